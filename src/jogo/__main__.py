@@ -1,7 +1,38 @@
-from jogo.ui_flet.main import run_app
+from __future__ import annotations
 
+# startup primeiro: o relógio do cold start começa aqui
+from jogo.runtime import startup
 
-def main() -> None:
+import argparse
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="jogo", description="Detetive John")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="mede imports e tempo até o primeiro render, imprime o relatório e sai",
+    )
+    parser.add_argument("--headless", action="store_true", help="com --profile-startup: sem janela (CI/benchmarks)")
+    parser.add_argument("--json", action="store_true", help="com --profile-startup: relatório em JSON")
+    args = parser.parse_args(argv)
+
+    from jogo.runtime.config import AppConfig
+
+    cfg = AppConfig()
+    # capítulo carrega numa thread enquanto o flet (import pesado) sobe
+    startup.preload_content(cfg.default_chapter)
+
+    if args.profile_startup:
+        from jogo.ui_flet.main import profile_startup
+
+        profile_startup(cfg, headless=args.headless, as_json=args.json)
+        return
+
+    from jogo.ui_flet.main import run_app
+
+    startup.mark("ui_imported")
     run_app()
 
 
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Set, Tuple
+
+from jogo.content import registry
+
+
+def _pillow() -> Any:
+    """
+    Pillow é opcional (extra "images"): sem ele as variantes são o próprio arquivo original.
+    Import tardio: só os workers pagam por ele, nunca o cold start da UI.
+    """
+    try:
+        from PIL import Image
+    except ImportError:  # pragma: no cover - depende do ambiente
+        return None
+    return Image
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "detetive_john" / "images"
+
+
+@dataclass
+class AssetStats:
+    variants_built: int = 0
+    variant_hits: int = 0  # variante pronta na hora do render
+    variant_misses: int = 0  # render usou o original enquanto a variante é gerada
+    warmed: int = 0
+    variants_failed: int = 0  # imagem ilegível/corrompida: fica no original
+
+
+class ImagePipeline:
+    """
+    Variantes pré-escaladas das imagens de cena, em cache de disco.
+    - chave = hash do conteúdo + largura (editar a imagem gera variante nova)
+    - variant() nunca bloqueia: se a variante não existe, devolve o original
+      e agenda a geração em background
+    - variante que falhou não é tentada de novo (até clear())
+    - prefetch(): gera/aquece as imagens das cenas vizinhas (gotos)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        *,
+        widths: Sequence[int] = (480, 960, 1600),
+        max_workers: int = 2,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.widths = tuple(sorted(widths))
+        self.max_workers = max_workers
+        self.stats = AssetStats()
+
+        self._hashes: Dict[Tuple[str, int, int], str] = {}  # (path, mtime_ns, size) -> sha1
+        self._ready: Dict[Tuple[str, int], str] = {}  # (path, largura) -> arquivo servido
+        self._inflight: Set[Tuple[str, int]] = set()
+        self._failed: Set[Tuple[str, int]] = set()  # (path, largura) cujo build levantou erro
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    # ---------- API ----------
+
+    def pick_width(self, target_width: int) -> int:
+        """Menor variante que cobre o painel (ou a maior disponível)."""
+        for w in self.widths:
+            if w >= target_width:
+                return w
+        return self.widths[-1]
+
+    def variant(self, src: str, target_width: int) -> str:
+        if not src:
+            return ""
+        width = self.pick_width(target_width)
+        ready = self._ready.get((src, width))
+        if ready is not None:
+            self.stats.variant_hits += 1
+            return ready
+
+        if (src, width) in self._failed:
+            return src  # build já falhou: o original serve sem reagendar
+
+        self.stats.variant_misses += 1
+        self._schedule(src, width)
+        return src
+
+    def is_ready(self, src: str, target_width: int) -> bool:
+        return (src, self.pick_width(target_width)) in self._ready
+
+    def prefetch(self, chapter_id: str, scene_id: str, target_width: int) -> None:
+        """Agenda as imagens das cenas alcançáveis a partir de scene_id."""
+        try:
+            chapter = registry.get_chapter(chapter_id)
+            # só a cena atual e as vizinhas são decodificadas (modo streaming)
+            images = [chapter.scenes[nxt].image for nxt in registry.get_successors(chapter_id, scene_id)]
+        except (registry.ChapterNotFoundError, registry.ManifestError):
+            return
+        width = self.pick_width(target_width)
+        for image in images:
+            if image:
+                self._schedule(image, width)
+
+    def build(self, src: str, width: int) -> str:
+        """Gera (ou reaproveita) a variante no disco. Síncrono; roda nos workers."""
+        p = Path(src)
+        try:
+            st = p.stat()
+        except OSError:
+            return src
+
+        key = (src, st.st_mtime_ns, st.st_size)
+        digest = self._hashes.get(key)
+        data: Optional[bytes] = None
+        if digest is None:
+            data = p.read_bytes()
+            digest = hashlib.sha1(data).hexdigest()
+            self._hashes[key] = digest
+
+        Image = _pillow()
+        if Image is None:
+            # sem Pillow: só aquece o cache do SO lendo o arquivo
+            if data is None:
+                p.read_bytes()
+            self.stats.warmed += 1
+            return src
+
+        out = self.cache_dir / f"{digest[:20]}_{width}.png"
+        if out.exists():
+            return str(out)
+
+        with Image.open(p) as im:
+            if im.width <= width:
+                return src  # não amplia: o original já serve
+            height = max(1, round(im.height * width / im.width))
+            scaled = im.resize((width, height), Image.Resampling.LANCZOS)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = out.with_suffix(f".{threading.get_ident()}.tmp")
+        scaled.save(tmp, format="PNG", optimize=True)
+        os.replace(tmp, out)
+        self.stats.variants_built += 1
+        return str(out)
+
+    def warm(self, paths: Iterable[str], target_width: int) -> None:
+        width = self.pick_width(target_width)
+        for src in paths:
+            if src:
+                self._schedule(src, width)
+
+    def clear(self) -> None:
+        """Esquece as variantes prontas e as falhas (ex.: depois de recarregar o capítulo)."""
+        with self._lock:
+            self._ready.clear()
+            self._failed.clear()
+            self._hashes.clear()
+
+    def shutdown(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    # ---------- Internos ----------
+
+    def _schedule(self, src: str, width: int) -> None:
+        key = (src, width)
+        with self._lock:
+            if key in self._ready or key in self._inflight or key in self._failed:
+                return
+            self._inflight.add(key)
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="assets")
+            fut = self._pool.submit(self.build, src, width)
+        fut.add_done_callback(lambda f, k=key: self._done(k, f))
+
+    def _done(self, key: Tuple[str, int], fut: "Future[str]") -> None:
+        with self._lock:
+            self._inflight.discard(key)
+            if fut.cancelled():
+                return
+            if fut.exception() is None:
+                self._ready[key] = fut.result()
+            else:
+                self._failed.add(key)
+                self.stats.variants_failed += 1
+
+
+# ---------- Instância por processo ----------
+
+_shared: Optional[ImagePipeline] = None
+_shared_lock = threading.Lock()
+
+
+def configure(cache_dir: Optional[Path] = None, widths: Sequence[int] = (480, 960, 1600)) -> ImagePipeline:
+    """(Re)cria o pipeline compartilhado por todas as sessões do processo."""
+    global _shared
+    with _shared_lock:
+        if _shared is not None:
+            _shared.shutdown()
+        _shared = ImagePipeline(cache_dir, widths=widths)
+        return _shared
+
+
+def get_pipeline() -> ImagePipeline:
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ImagePipeline()
+        return _shared
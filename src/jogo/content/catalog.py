@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from jogo.content import registry
+from jogo.content.manifest_index import read_meta
+from jogo.content.pack import ChapterPack
+from jogo.runtime.pools import LazyPool
+
+# Catálogo dos capítulos em CHAPTERS_DIR.
+#
+# Descobrir = listar as pastas com manifest.json (ou chapter.pack) e ler só o
+# bloco meta de cada uma (sem decodificar cenas). Carregar de verdade fica com
+# o registry; aqui só se decide o quê e quando, num pool próprio.
+
+# ordem de quem não declara meta.order: depois dos que declaram, por id
+_NO_ORDER = 1 << 30
+
+
+@dataclass(frozen=True)
+class ChapterInfo:
+    """
+    Resumo de um capítulo para listagem.
+    - order: meta.order (ou por id); next: meta.next ou o seguinte na ordem
+    - error: manifest ilegível (o capítulo aparece, mas não carrega)
+    """
+    id: str
+    title: str
+    version: int
+    order: int
+    next: str
+    source: Path
+    meta: Mapping[str, Any] = field(compare=False)
+    error: str = ""
+
+
+@dataclass
+class WarmReport:
+    loaded: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)  # id -> mensagem
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+# ---------- Pool ----------
+
+_pool = LazyPool(4, "catalog")
+
+
+def configure_workers(n: int) -> None:
+    """Tamanho do pool do catálogo (AppConfig.catalog_workers); ver LazyPool.resize."""
+    _pool.resize(n)
+
+
+# ---------- Descoberta ----------
+
+# chapter_id -> (assinatura da fonte, info crua: (título, versão, ordem, next declarado, meta, erro))
+_RawInfo = Tuple[str, int, int, Optional[str], Mapping[str, Any], str]
+_meta_cache: Dict[str, Tuple[Tuple[Path, int, int], _RawInfo]] = {}
+_meta_lock = threading.Lock()
+
+
+def discover() -> List[ChapterInfo]:
+    """
+    Todos os capítulos, na ordem de jogo.
+    Chamadas repetidas só fazem stat: o meta é relido quando o arquivo muda.
+    """
+    found: List[Tuple[str, Path, _RawInfo]] = []
+    try:
+        dirs = sorted(p for p in registry.CHAPTERS_DIR.iterdir() if p.is_dir())
+    except OSError:
+        return []
+    for d in dirs:
+        source = _source(d)
+        if source is not None:
+            found.append((d.name, source, _raw_info(d.name, source)))
+
+    found.sort(key=lambda item: (item[2][2], item[0]))
+    infos: List[ChapterInfo] = []
+    for i, (chapter_id, source, (title, version, order, declared, meta, error)) in enumerate(found):
+        if declared is None:
+            declared = found[i + 1][0] if i + 1 < len(found) else ""
+        infos.append(
+            ChapterInfo(
+                id=chapter_id,
+                title=title,
+                version=version,
+                order=order,
+                next=declared,
+                source=source,
+                meta=meta,
+                error=error,
+            )
+        )
+    return infos
+
+
+def chapter_ids() -> List[str]:
+    return [info.id for info in discover()]
+
+
+def get_info(chapter_id: str) -> ChapterInfo:
+    for info in discover():
+        if info.id == chapter_id:
+            return info
+    raise registry.ChapterNotFoundError(f"Capítulo '{chapter_id}' não está no catálogo ({registry.CHAPTERS_DIR}).")
+
+
+def next_chapter(chapter_id: str) -> str:
+    """Id do capítulo seguinte ("" = último)."""
+    return get_info(chapter_id).next
+
+
+def _source(d: Path) -> Optional[Path]:
+    for name in (registry.PACK_FILENAME, "manifest.json"):
+        p = d / name
+        if p.is_file():
+            return p
+    return None
+
+
+def _raw_info(chapter_id: str, source: Path) -> _RawInfo:
+    try:
+        st = source.stat()
+        key = (source, st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = (source, -1, -1)
+    with _meta_lock:
+        cached = _meta_cache.get(chapter_id)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    error = ""
+    try:
+        meta = _read_meta(source)
+    except (OSError, ValueError) as e:
+        meta, error = {}, str(e)
+
+    version, order = meta.get("version"), meta.get("order")
+    declared: Optional[str] = None  # None = segue a ordem do catálogo
+    if "next" in meta:
+        declared = meta["next"] if isinstance(meta["next"], str) else ""  # null = fim da história
+    raw: _RawInfo = (
+        str(meta.get("title") or chapter_id),
+        version if isinstance(version, int) else 0,
+        order if isinstance(order, int) else _NO_ORDER,
+        declared,
+        MappingProxyType(dict(meta)),
+        error,
+    )
+    with _meta_lock:
+        _meta_cache[chapter_id] = (key, raw)
+    return raw
+
+
+def _read_meta(source: Path) -> Dict[str, Any]:
+    if source.name == registry.PACK_FILENAME:
+        pack = ChapterPack(source)
+        try:
+            return dict(pack.meta)
+        finally:
+            pack.close()
+    return read_meta(source)
+
+
+# ---------- Carga ----------
+
+def warm_all(chapter_ids: Optional[Iterable[str]] = None) -> WarmReport:
+    """
+    Carrega e valida (entrada, gotos) os capítulos do catálogo em paralelo.
+    Erros não interrompem os demais: vão para o relatório. Manifests em modo
+    streaming só validam os gotos quando o grafo é montado (registry.get_graph).
+    """
+    t0 = time.perf_counter()
+    report = WarmReport()
+    if chapter_ids is None:
+        infos = discover()
+        report.failed.update((i.id, i.error) for i in infos if i.error)
+        ids = [i.id for i in infos if not i.error]
+    else:
+        ids = list(chapter_ids)
+
+    futures = {cid: _pool.submit(registry.load_chapter, cid) for cid in ids}
+    for cid, fut in futures.items():
+        try:
+            fut.result()
+        except (OSError, ValueError) as e:
+            report.failed[cid] = str(e)
+        else:
+            report.loaded.append(cid)
+    report.seconds = time.perf_counter() - t0
+    return report
+
+
+_preloading: Dict[str, Future] = {}
+
+
+def preload_next(chapter_id: str) -> Optional[Future]:
+    """
+    Carrega em background o capítulo seguinte ao atual (capítulo + texto da
+    entrada), para a virada de capítulo não esperar disco.
+    None = não há próximo. Chamadas repetidas reaproveitam o mesmo job.
+    """
+    try:
+        nxt = next_chapter(chapter_id)
+    except registry.ChapterNotFoundError:
+        return None
+    if not nxt:
+        return None
+
+    with _meta_lock:
+        fut = _preloading.get(nxt)
+        if fut is not None and not (fut.done() and fut.exception() is not None):
+            return fut
+        fut = _preloading[nxt] = _pool.submit(_preload, nxt)
+    return fut
+
+
+def _preload(chapter_id: str) -> None:
+    registry.load_chapter(chapter_id)
+    registry.get_scene(chapter_id, registry.get_entry_scene_id(chapter_id))
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import ast
+from typing import Any, Callable, Dict, NamedTuple
+
+from jogo.content.items import CLUES, ITEMS
+from jogo.content.templates import STAT_NAMES
+
+# Condições sobre os stats, escritas no manifest:
+#
+#   "requires": "foco >= 50 and estresse < 80"
+#   "when": "not (sono < 20 or energia < 10)"
+#   "when": "30 <= estresse < 70"
+#   "requires": "has('lanterna') and not knows('pegada')"
+#
+# Aceita: stats (sono, energia, foco, estresse), inteiros, + - (binário e
+# unário), comparações (encadeadas também), and / or / not, parênteses e
+# has('item') / knows('pista'). Nenhuma outra chamada, atributo ou nome: o
+# texto vem do conteúdo.
+#
+# Compilada uma vez no load do capítulo: a árvore validada vira o corpo de um
+# `lambda s, h: ...` (cada stat -> s.<stat>; has('x') -> h.items & <bit> != 0,
+# com o bit já internado) e o bytecode fica pronto; no render é só chamar.
+#
+# Simuladores (batch, explore) numeram itens/pistas por capítulo: usam
+# compile_local() com os próprios bits, ou parse_condition() para gerar
+# outro código a partir da mesma árvore validada.
+
+
+class ConditionError(ValueError):
+    pass
+
+
+_ALLOWED = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.USub,
+    ast.UAdd,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+)
+
+_ARG = "s"  # parâmetros da lambda gerada: stats e itens/pistas
+_HELD = "h"
+
+# função -> campo do bitset
+FUNCS: Dict[str, str] = {"has": "items", "knows": "clues"}
+
+BitFor = Callable[[str], int]  # id do item/pista -> bit
+
+
+class _NoHoldings(NamedTuple):
+    items: int = 0
+    clues: int = 0
+
+
+_NOTHING = _NoHoldings()
+
+
+class Condition:
+    """
+    Predicado compilado: cond(stats, held) -> bool.
+    stats: StatsSnapshot/PlayerStats; held: qualquer coisa com .items/.clues (ints).
+    """
+
+    __slots__ = ("source", "test")
+
+    def __init__(self, source: str, test: Callable[[Any, Any], bool]) -> None:
+        self.source = source
+        self.test = test
+
+    def __call__(self, stats: Any, held: Any = _NOTHING) -> bool:
+        return self.test(stats, held)
+
+    def __repr__(self) -> str:
+        return f"Condition({self.source!r})"
+
+
+# mesma condição escrita em várias ações/cenas = um só código compilado
+_compiled: Dict[str, Condition] = {}
+
+
+def compile_condition(source: str) -> Condition:
+    cond = _compiled.get(source)
+    if cond is None:
+        cond = _compiled[source] = Condition(source, _compile(source, ITEMS.bit, CLUES.bit))
+    return cond
+
+
+def compile_local(source: str, item_bit: BitFor, clue_bit: BitFor) -> Condition:
+    """Mesma condição com outra numeração de bits (sem cache): held.items/clues nessa numeração."""
+    return Condition(source, _compile(source, item_bit, clue_bit))
+
+
+def parse_condition(source: str) -> ast.expr:
+    """Árvore validada (só nós permitidos; has/knows com um id literal). Nova a cada chamada."""
+    if not isinstance(source, str) or not source.strip():
+        raise ConditionError("condição vazia")
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ConditionError(f"condição inválida {source!r}: {e.msg}") from e
+
+    calls = set()  # partes de has()/knows() já validadas
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            _check_call(source, node)
+            calls.update((id(node.func), id(node.args[0])))
+            continue
+        if id(node) in calls:
+            continue
+        if not isinstance(node, _ALLOWED):
+            raise ConditionError(f"condição {source!r}: '{type(node).__name__}' não é permitido")
+        if isinstance(node, ast.Name) and node.id not in STAT_NAMES:
+            raise ConditionError(f"condição {source!r}: stat desconhecido '{node.id}' (use {', '.join(STAT_NAMES)})")
+        if isinstance(node, ast.Constant) and type(node.value) is not int:
+            raise ConditionError(f"condição {source!r}: só números inteiros")
+    return tree.body
+
+
+def _compile(source: str, item_bit: BitFor, clue_bit: BitFor) -> Callable[[Any, Any], bool]:
+    body = _StatsToAttrs({"has": item_bit, "knows": clue_bit}).visit(parse_condition(source))
+    fn = ast.Expression(
+        ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[], args=[ast.arg(_ARG), ast.arg(_HELD)], kwonlyargs=[], kw_defaults=[], defaults=[]
+            ),
+            body=ast.Call(ast.Name("bool", ast.Load()), [body], []),
+        )
+    )
+    ast.fix_missing_locations(fn)
+    code = compile(fn, f"<condition {source!r}>", "eval")
+    return eval(code, {"__builtins__": {}, "bool": bool})
+
+
+def _check_call(source: str, node: ast.Call) -> None:
+    ok = (
+        isinstance(node.func, ast.Name)
+        and node.func.id in FUNCS
+        and len(node.args) == 1
+        and not node.keywords
+        and isinstance(node.args[0], ast.Constant)
+        and isinstance(node.args[0].value, str)
+        and node.args[0].value
+    )
+    if not ok:
+        raise ConditionError(f"condição {source!r}: só has('item') e knows('pista') podem ser chamadas")
+
+
+class _StatsToAttrs(ast.NodeTransformer):
+    def __init__(self, bits: Dict[str, BitFor]) -> None:
+        self.bits = bits
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        return ast.copy_location(ast.Attribute(ast.Name(_ARG, ast.Load()), node.id, ast.Load()), node)
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        # has('x') -> (h.items & (1 << bit de x)) != 0
+        name = node.func.id  # type: ignore[union-attr]
+        field_name = FUNCS[name]
+        mask = 1 << self.bits[name](node.args[0].value)  # type: ignore[attr-defined]
+        held = ast.Attribute(ast.Name(_HELD, ast.Load()), field_name, ast.Load())
+        test = ast.Compare(ast.BinOp(held, ast.BitAnd(), ast.Constant(mask)), [ast.NotEq()], [ast.Constant(0)])
+        return ast.copy_location(test, node)
+
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Mapping, Tuple
+
+if TYPE_CHECKING:
+    from jogo.content.registry import SceneData
+
+
+@dataclass(frozen=True)
+class BrokenEdge:
+    scene_id: str
+    action_key: str
+    goto: str
+
+
+@dataclass(frozen=True)
+class ChapterGraph:
+    """
+    Índice do grafo de cenas (montado uma vez por versão do capítulo).
+    - edges/reverse: destinos/origens únicos de cada cena (ordem do manifest)
+    - terminal: cenas sem ações (finais)
+    - reachable/unreachable: a partir da entry_scene
+    """
+    entry: str
+    edges: Mapping[str, Tuple[str, ...]]
+    reverse: Mapping[str, Tuple[str, ...]]
+    reachable: FrozenSet[str]
+    unreachable: FrozenSet[str]
+    terminal: FrozenSet[str]
+    broken: Tuple[BrokenEdge, ...] = ()
+
+    def successors(self, scene_id: str) -> Tuple[str, ...]:
+        return self.edges.get(scene_id, ())
+
+    def predecessors(self, scene_id: str) -> Tuple[str, ...]:
+        """Quais cenas levam até aqui."""
+        return self.reverse.get(scene_id, ())
+
+    @property
+    def endings(self) -> FrozenSet[str]:
+        """Finais alcançáveis a partir da entrada."""
+        return self.terminal & self.reachable
+
+
+def build_graph(entry: str, scenes: Mapping[str, "SceneData"]) -> ChapterGraph:
+    """
+    Passada linear por todas as arestas (goto):
+    monta adjacência + reverso e coleta gotos quebrados sem parar no primeiro.
+    """
+    edges: Dict[str, Tuple[str, ...]] = {}
+    reverse: Dict[str, List[str]] = {sid: [] for sid in scenes}
+    broken: List[BrokenEdge] = []
+
+    for scene_id, scene in scenes.items():
+        targets: Dict[str, None] = {}
+        for a in scene.actions:
+            if a.goto not in scenes:
+                broken.append(BrokenEdge(scene_id, a.key, a.goto))
+                continue
+            if a.goto not in targets:
+                targets[a.goto] = None
+                reverse[a.goto].append(scene_id)
+        edges[scene_id] = tuple(targets)
+
+    reachable: set = set()
+    if entry in scenes:
+        reachable.add(entry)
+        queue = deque([entry])
+        while queue:
+            for nxt in edges[queue.popleft()]:
+                if nxt not in reachable:
+                    reachable.add(nxt)
+                    queue.append(nxt)
+
+    return ChapterGraph(
+        entry=entry,
+        edges=MappingProxyType(edges),
+        reverse=MappingProxyType({sid: tuple(src) for sid, src in reverse.items()}),
+        reachable=frozenset(reachable),
+        unreachable=frozenset(scenes.keys() - reachable),
+        terminal=frozenset(sid for sid, out in edges.items() if not scenes[sid].actions),
+        broken=tuple(broken),
+    )
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+# Itens (mochila) e pistas (arquivo) como bitsets.
+#
+# Cada id ("lanterna", "pegada_na_lama") vira um bit na primeira vez que um
+# capítulo carregado o menciona; o bit vale para o processo inteiro (todos os
+# capítulos, todas as sessões). O que o jogador tem é um int: teste = AND,
+# ganhar/perder = OR/AND-NOT, foto no GameState = o próprio int.
+#
+# Bits dependem da ordem de carga: saves guardam os ids (to_save/from_save).
+
+
+class Interner:
+    """id -> bit (0, 1, 2...). Bits nunca são reaproveitados."""
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self._bits: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._labels: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def bit(self, name: str) -> int:
+        b = self._bits.get(name)
+        if b is None:
+            with self._lock:
+                b = self._bits.get(name)
+                if b is None:
+                    b = self._bits[name] = len(self._names)
+                    self._names.append(name)
+        return b
+
+    def mask(self, names: Iterable[str]) -> int:
+        m = 0
+        for name in names:
+            m |= 1 << self.bit(name)
+        return m
+
+    def names(self, mask: int) -> List[str]:
+        """Ids dos bits ligados, na ordem dos bits."""
+        out = []
+        while mask:
+            low = mask & -mask
+            out.append(self._names[low.bit_length() - 1])
+            mask ^= low
+        return out
+
+    def set_label(self, name: str, label: str) -> None:
+        self.bit(name)
+        self._labels[name] = label
+
+    def label(self, name: str) -> str:
+        return self._labels.get(name, name)
+
+    def labels(self, mask: int) -> List[str]:
+        return [self.label(n) for n in self.names(mask)]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+ITEMS = Interner("item")
+CLUES = Interner("clue")
+
+
+def to_save(items: int, clues: int) -> Dict[str, List[str]]:
+    """Save portátil: só os ids que o jogador tem (não depende da ordem dos bits)."""
+    return {"items": ITEMS.names(items), "clues": CLUES.names(clues)}
+
+
+def from_save(data: Mapping[str, Any]) -> Tuple[int, int]:
+    return ITEMS.mask(data.get("items") or ()), CLUES.mask(data.get("clues") or ())
+
+
+class LocalBits:
+    """
+    Numeração própria (0, 1, 2...) dos ids que um capítulo usa: simuladores
+    guardam itens/pistas em campos de largura fixa (int64 no batch, estado
+    empacotado no explore), e os bits globais podem ir longe.
+    """
+
+    def __init__(self, interner: Interner) -> None:
+        self.interner = interner
+        self.bits: Dict[str, int] = {}
+
+    def bit(self, name: str) -> int:
+        b = self.bits.get(name)
+        if b is None:
+            b = self.bits[name] = len(self.bits)
+        return b
+
+    def remap(self, mask: int) -> int:
+        """Máscara global -> local (ids novos ganham bit)."""
+        local = 0
+        for name in self.interner.names(mask):
+            local |= 1 << self.bit(name)
+        return local
+
+    def known(self, mask: int) -> int:
+        """Máscara global -> local, ignorando ids que o capítulo não usa."""
+        local = 0
+        for name in self.interner.names(mask):
+            b = self.bits.get(name)
+            if b is not None:
+                local |= 1 << b
+        return local
+
+    def __len__(self) -> int:
+        return len(self.bits)
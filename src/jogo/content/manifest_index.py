@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+# Leitura incremental do manifest.json para capítulos grandes.
+#
+# Uma varredura (mmap + regex, sem montar o JSON inteiro na memória) anota o
+# intervalo de bytes de cada cena; cada cena é decodificada só quando pedida.
+# O índice vai para manifest.index.json, ao lado do manifest: com a mesma
+# assinatura (mtime_ns, size), os próximos launches nem varrem o arquivo.
+
+INDEX_FILENAME = "manifest.index.json"
+INDEX_VERSION = 1
+
+Span = Tuple[int, int]
+
+# string JSON (loop "desenrolado": rápido e sem recursão em textos longos)
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+_DECODER = json.JSONDecoder()
+_SCALAR = re.compile(rb"[^\s,}\]]+")
+_WS = re.compile(rb"\s*")
+
+
+class ManifestIndexError(ValueError):
+    pass
+
+
+class _Scanner:
+    """Varredura estrutural de um JSON em bytes (mmap): acha onde cada valor termina."""
+
+    def __init__(self, mm: Any) -> None:
+        self._mm = mm
+
+    def _members(self, pos: int, on_member: Callable[[str, int], int]) -> int:
+        """
+        Percorre um objeto (pos logo depois do '{'): on_member(key, início do valor)
+        devolve o fim do valor. Retorna a posição logo depois do '}'.
+        """
+        mm = self._mm
+        pos = self._skip_ws(pos)
+        if mm[pos : pos + 1] == b"}":
+            return pos + 1
+        while True:
+            m = _STRING.match(mm, pos)
+            if m is None:
+                raise ManifestIndexError(f"chave esperada na posição {pos}")
+            key = json.loads(m.group())
+            pos = self._skip_ws(m.end())
+            if mm[pos : pos + 1] != b":":
+                raise ManifestIndexError(f"':' esperado na posição {pos}")
+
+            pos = self._skip_ws(on_member(key, self._skip_ws(pos + 1)))
+            c = mm[pos : pos + 1]
+            if c == b",":
+                pos = self._skip_ws(pos + 1)
+            elif c == b"}":
+                return pos + 1
+            else:
+                raise ManifestIndexError(f"',' ou '}}' esperado na posição {pos}")
+
+    def _skip_value(self, pos: int) -> int:
+        mm = self._mm
+        c = mm[pos : pos + 1]
+        if c == b'"':
+            m = _STRING.match(mm, pos)
+            if m is None:
+                raise ManifestIndexError(f"string sem fim na posição {pos}")
+            end = m.end()
+        elif c in (b"{", b"["):
+            end = self._skip_container(pos)
+        else:
+            m = _SCALAR.match(mm, pos)
+            if m is None:
+                raise ManifestIndexError(f"valor esperado na posição {pos}")
+            end = m.end()
+        return end
+
+    def _skip_container(self, pos: int) -> int:
+        """
+        Fim de um objeto/array: o decoder C do json numa janela que cresce até
+        conter o valor inteiro (memória ~ tamanho de uma cena, não do arquivo).
+        """
+        mm = self._mm
+        window = 4096
+        while True:
+            chunk = mm[pos : pos + window]
+            try:
+                text = chunk.decode("utf-8")
+            except UnicodeDecodeError as e:
+                if e.start < len(chunk) - 4:
+                    raise ManifestIndexError(f"UTF-8 inválido na posição {pos + e.start}") from e
+                text = chunk[: e.start].decode("utf-8")  # caractere cortado no fim da janela
+            try:
+                _value, end = _DECODER.raw_decode(text)
+            except json.JSONDecodeError as e:
+                if pos + window >= len(mm):
+                    raise ManifestIndexError(f"JSON inválido na posição {pos + e.pos}: {e.msg}") from e
+                window *= 4
+                continue
+            return pos + len(text[:end].encode("utf-8"))
+
+    def _skip_ws(self, pos: int) -> int:
+        return _WS.match(self._mm, pos).end()  # type: ignore[union-attr]
+
+
+class StreamingManifest(_Scanner):
+    """
+    Manifest lido sob demanda.
+    - entry_scene/meta ficam disponíveis assim que a varredura passa por eles
+      (no formato usual, antes de "scenes": o jogo começa sem esperar o resto)
+    - raw_scene(id) decodifica só aquela cena a partir do offset
+    - a varredura roda numa thread; quem pede algo ainda não visto espera
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        st = self.path.stat()
+        self.signature: Tuple[int, int] = (st.st_mtime_ns, st.st_size)
+
+        self._file = self.path.open("rb")
+        super().__init__(mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if st.st_size else b"")
+        self._top: Dict[str, Span] = {}
+        self._scenes: Dict[str, Span] = {}
+        self._done = False
+        self._error: Optional[Exception] = None
+        self._cond = threading.Condition()
+        self.from_index = False
+        self._thread: Optional[threading.Thread] = None
+
+        if self._load_index():
+            self.from_index = True
+            self._done = True
+        else:
+            self._thread = threading.Thread(target=self._scan_and_persist, name="manifest-scan", daemon=True)
+            self._thread.start()
+
+    # ---------- API ----------
+
+    @property
+    def entry_scene(self) -> str:
+        value = self.top_value("entry_scene")
+        return value if isinstance(value, str) else ""
+
+    @property
+    def meta(self) -> Mapping[str, Any]:
+        value = self.top_value("meta")
+        return value if isinstance(value, dict) else {}
+
+    def raw_scene(self, scene_id: str) -> Optional[Dict[str, Any]]:
+        span = self._wait(lambda: self._scenes.get(scene_id))
+        if span is None:
+            return None
+        raw = json.loads(self._mm[span[0] : span[1]])
+        if not isinstance(raw, dict):
+            raise ManifestIndexError(f"Cena '{scene_id}' deve ser um objeto (dict).")
+        return raw
+
+    def has_scene(self, scene_id: str) -> bool:
+        return self._wait(lambda: self._scenes.get(scene_id)) is not None
+
+    def scene_ids(self) -> Iterator[str]:
+        """Ordem do arquivo. Espera a varredura terminar."""
+        self.wait()
+        return iter(self._scenes)
+
+    def scene_count(self) -> int:
+        self.wait()
+        return len(self._scenes)
+
+    def wait(self) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: self._done)
+        if self._error is not None:
+            raise self._error
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._thread.join()  # inclui a gravação do índice
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    # ---------- Índice persistido ----------
+
+    def index_path(self) -> Path:
+        return self.path.with_name(INDEX_FILENAME)
+
+    def _load_index(self) -> bool:
+        try:
+            data = json.loads(self.index_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if data.get("v") != INDEX_VERSION or tuple(data.get("signature", ())) != self.signature:
+            return False  # manifest mudou: varre de novo
+        try:
+            self._top = {k: (int(a), int(b)) for k, (a, b) in data["top"].items()}
+            self._scenes = {k: (int(a), int(b)) for k, (a, b) in data["scenes"].items()}
+        except (KeyError, TypeError, ValueError):
+            return False
+        return True
+
+    def _persist(self) -> None:
+        data = {
+            "v": INDEX_VERSION,
+            "signature": list(self.signature),
+            "top": self._top,
+            "scenes": self._scenes,
+        }
+        tmp = self.index_path().with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.index_path())
+        except OSError:
+            pass  # pasta só leitura: funciona, só não reaproveita no próximo launch
+
+    # ---------- Varredura ----------
+
+    def _scan_and_persist(self) -> None:
+        try:
+            self._scan()
+        except Exception as e:  # vira erro para quem estiver esperando
+            self._error = e if isinstance(e, ManifestIndexError) else ManifestIndexError(f"{self.path}: {e}")
+        with self._cond:
+            self._done = True
+            self._cond.notify_all()
+        if self._error is None:
+            self._persist()
+
+    def _scan(self) -> None:
+        mm = self._mm
+        pos = self._skip_ws(0)
+        if mm[pos : pos + 1] != b"{":
+            raise ManifestIndexError("manifest.json deve ser um objeto JSON (dict).")
+
+        def top_member(key: str, start: int) -> int:
+            if key == "scenes":
+                if mm[start : start + 1] != b"{":
+                    raise ManifestIndexError("'scenes' deve ser um objeto (dict).")
+                end = self._members(start + 1, scene_member)
+            else:
+                end = self._skip_value(start)
+            with self._cond:
+                self._top[key] = (start, end)
+                self._cond.notify_all()
+            return end
+
+        def scene_member(scene_id: str, start: int) -> int:
+            end = self._skip_value(start)
+            with self._cond:
+                self._scenes[scene_id] = (start, end)
+                self._cond.notify_all()
+            return end
+
+        self._members(pos + 1, top_member)
+
+    # ---------- Espera ----------
+
+    def _wait(self, probe: Any) -> Any:
+        with self._cond:
+            self._cond.wait_for(lambda: self._done or probe() is not None)
+            found = probe()
+        if found is None and self._error is not None:
+            raise self._error
+        return found
+
+    def top_value(self, key: str) -> Any:
+        """Valor de uma chave do topo do manifest (None = ausente)."""
+        span = self._wait(lambda: self._top.get(key))
+        if span is None:
+            return None
+        return json.loads(self._mm[span[0] : span[1]])
+
+
+class _Stop(Exception):
+    pass
+
+
+def read_meta(path: Path) -> Dict[str, Any]:
+    """
+    Só o bloco meta do manifest, sem decodificar as cenas.
+    Usa o índice persistido se estiver em dia; senão varre o topo até achar
+    "meta" (no formato usual ele vem antes de "scenes": lê poucos bytes).
+    """
+    path = Path(path)
+    with path.open("rb") as f:
+        st = os.fstat(f.fileno())
+        if not st.st_size:
+            raise ManifestIndexError(f"manifest.json vazio: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            span = _indexed_span(path.with_name(INDEX_FILENAME), (st.st_mtime_ns, st.st_size), "meta")
+            if span is None:
+                span = _find_top_member(_Scanner(mm), "meta")
+            value = json.loads(mm[span[0] : span[1]]) if span is not None else None
+    return value if isinstance(value, dict) else {}
+
+
+def _indexed_span(index: Path, signature: Tuple[int, int], key: str) -> Optional[Span]:
+    try:
+        data = json.loads(index.read_text(encoding="utf-8"))
+        if data.get("v") != INDEX_VERSION or tuple(data.get("signature", ())) != signature:
+            return None
+        a, b = data["top"][key]
+        return int(a), int(b)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _find_top_member(scanner: _Scanner, wanted: str) -> Optional[Span]:
+    pos = scanner._skip_ws(0)
+    if scanner._mm[pos : pos + 1] != b"{":
+        raise ManifestIndexError("manifest.json deve ser um objeto JSON (dict).")
+    found: List[Span] = []
+
+    def member(key: str, start: int) -> int:
+        end = scanner._skip_value(start)
+        if key == wanted:
+            found.append((start, end))
+            raise _Stop
+        return end
+
+    try:
+        scanner._members(pos + 1, member)
+    except _Stop:
+        pass
+    return found[0] if found else None
+
+
+class LazyScenes(Mapping[str, Any]):
+    """
+    Mapping scene_id -> SceneData que decodifica cada cena na primeira leitura.
+    `load(scene_id)` é fornecido pelo registry (decodifica + mesma validação do
+    caminho normal); None = cena não existe.
+    """
+
+    def __init__(self, manifest: StreamingManifest, load: Callable[[str], Any]) -> None:
+        self._manifest = manifest
+        self._load = load
+        self._decoded: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, scene_id: str) -> Any:
+        scene = self._decoded.get(scene_id)
+        if scene is not None:
+            return scene
+        scene = self._load(scene_id)
+        if scene is None:
+            raise KeyError(scene_id)
+        with self._lock:
+            return self._decoded.setdefault(scene_id, scene)
+
+    def __contains__(self, scene_id: object) -> bool:
+        return isinstance(scene_id, str) and (
+            scene_id in self._decoded or self._manifest.has_scene(scene_id)
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return self._manifest.scene_ids()
+
+    def __len__(self) -> int:
+        return self._manifest.scene_count()
+
+    @property
+    def decoded(self) -> int:
+        """Quantas cenas já foram decodificadas (o resto está só no índice)."""
+        return len(self._decoded)
+
+    def close(self) -> None:
+        """Fecha o manifest (mmap + arquivo); cenas ainda não decodificadas deixam de abrir."""
+        self._manifest.close()
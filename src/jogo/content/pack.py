@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+# Pack compilado de capítulo (um arquivo só, lido via mmap):
+#
+#   [header][tabela de blobs][índice JSON][área de blobs]
+#
+# - header: magic, versão, flags, nº de cenas, nº de blobs, offset/tamanho do índice
+# - tabela: por blob -> offset (absoluto), tamanho gravado, tamanho cru, codec
+# - índice: entry_scene, meta, fontes (arquivo -> mtime/tamanho no build) e,
+#   por cena, os ids de blob (def, text, image)
+# - blobs: deduplicados por conteúdo; zlib opcional (só quando compensa)
+
+PACK_FILENAME = "chapter.pack"
+
+MAGIC = b"JDPK"
+VERSION = 1
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+
+NO_BLOB = -1
+
+_HEADER = struct.Struct("<4sHHIIQQ")
+_BLOB_ENTRY = struct.Struct("<QIIB3x")
+
+Blob = Union[memoryview, bytes]
+
+
+class PackError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class PackScene:
+    definition: int
+    text: int = NO_BLOB
+    image: int = NO_BLOB
+
+
+# ---------- Escrita ----------
+
+class PackWriter:
+    """
+    Monta o pack em memória e grava de uma vez.
+    Blobs iguais (mesmo sha1) são gravados uma única vez.
+    """
+
+    def __init__(self, *, compress: bool = False, level: int = 6) -> None:
+        self.compress = compress
+        self.level = level
+        self._blobs: List[Tuple[bytes, int, int]] = []  # (stored, raw_len, codec)
+        self._by_hash: Dict[bytes, int] = {}
+        self._scenes: Dict[str, PackScene] = {}
+        self._entry_scene = ""
+        self._meta: Dict[str, Any] = {}
+        self._labels: Dict[str, Any] = {}
+        self._source_hash = ""
+        self._sources: Dict[str, List[int]] = {}
+
+    def add_blob(self, data: bytes) -> int:
+        key = hashlib.sha1(data).digest()
+        idx = self._by_hash.get(key)
+        if idx is not None:
+            return idx
+
+        stored, codec = data, CODEC_RAW
+        if self.compress:
+            packed = zlib.compress(data, self.level)
+            # PNG e afins já vêm comprimidos: só troca se ganhar de verdade
+            if len(packed) < len(data) * 0.9:
+                stored, codec = packed, CODEC_ZLIB
+
+        idx = len(self._blobs)
+        self._blobs.append((stored, len(data), codec))
+        self._by_hash[key] = idx
+        return idx
+
+    def set_header(
+        self,
+        *,
+        entry_scene: str,
+        meta: Dict[str, Any],
+        source_hash: str = "",
+        labels: Optional[Dict[str, Any]] = None,
+        sources: Optional[Dict[str, List[int]]] = None,
+    ) -> None:
+        self._entry_scene = entry_scene
+        self._meta = meta
+        self._source_hash = source_hash
+        self._labels = labels or {}
+        self._sources = sources or {}
+
+    def add_scene(
+        self,
+        scene_id: str,
+        definition: Dict[str, Any],
+        *,
+        text: Optional[bytes] = None,
+        image: Optional[bytes] = None,
+    ) -> None:
+        def_blob = self.add_blob(json.dumps(definition, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+        self._scenes[scene_id] = PackScene(
+            definition=def_blob,
+            text=self.add_blob(text) if text is not None else NO_BLOB,
+            image=self.add_blob(image) if image is not None else NO_BLOB,
+        )
+
+    def write(self, path: Path) -> Path:
+        index = json.dumps(
+            {
+                "entry_scene": self._entry_scene,
+                "meta": self._meta,
+                "source_hash": self._source_hash,
+                "sources": self._sources,
+                "labels": self._labels,
+                "scenes": {
+                    sid: [s.definition, s.text, s.image] for sid, s in self._scenes.items()
+                },
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+        table_off = _HEADER.size
+        index_off = table_off + _BLOB_ENTRY.size * len(self._blobs)
+        offset = index_off + len(index)
+
+        table = bytearray()
+        for stored, raw_len, codec in self._blobs:
+            table += _BLOB_ENTRY.pack(offset, len(stored), raw_len, codec)
+            offset += len(stored)
+
+        header = _HEADER.pack(MAGIC, VERSION, 0, len(self._scenes), len(self._blobs), index_off, len(index))
+
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with tmp.open("wb") as f:
+            f.write(header)
+            f.write(table)
+            f.write(index)
+            for stored, _raw_len, _codec in self._blobs:
+                f.write(stored)
+        tmp.replace(path)
+        return path
+
+
+# ---------- Leitura ----------
+
+class ChapterPack:
+    """
+    Leitor de pack via mmap.
+    Blobs sem compressão são devolvidos como memoryview do mmap (zero cópia);
+    blobs zlib são descomprimidos sob demanda.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = path.open("rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # arquivo vazio
+            self._file.close()
+            raise PackError(f"Pack vazio: {path}") from e
+        self._view = memoryview(self._mm)
+
+        try:
+            magic, version, _flags, n_scenes, n_blobs, index_off, index_len = _HEADER.unpack_from(self._mm, 0)
+        except struct.error as e:
+            self.close()
+            raise PackError(f"Header inválido em {path}") from e
+
+        if magic != MAGIC:
+            self.close()
+            raise PackError(f"Arquivo não é um pack de capítulo: {path}")
+        if version != VERSION:
+            self.close()
+            raise PackError(f"Versão de pack não suportada ({version}) em {path}")
+
+        self._table = [
+            _BLOB_ENTRY.unpack_from(self._mm, _HEADER.size + i * _BLOB_ENTRY.size) for i in range(n_blobs)
+        ]
+
+        try:
+            index = json.loads(bytes(self._view[index_off:index_off + index_len]).decode("utf-8"))
+        except (ValueError, UnicodeDecodeError) as e:
+            self.close()
+            raise PackError(f"Índice inválido em {path}: {e}") from e
+
+        self.entry_scene: str = index.get("entry_scene", "")
+        self.meta: Dict[str, Any] = index.get("meta") or {}
+        # nomes de itens/pistas declarados no manifest ({"items": {...}, "clues": {...}})
+        self.labels: Dict[str, Any] = index.get("labels") or {}
+        self.source_hash: str = index.get("source_hash", "")
+        # arquivos soltos usados no build (relativos à pasta do capítulo) -> [mtime_ns, tamanho]
+        self.sources: Dict[str, List[int]] = index.get("sources") or {}
+        self.scenes: Dict[str, PackScene] = {sid: PackScene(*ids) for sid, ids in index["scenes"].items()}
+
+        if len(self.scenes) != n_scenes:
+            self.close()
+            raise PackError(f"Índice de cenas inconsistente em {path}")
+
+    def blob(self, idx: int) -> Blob:
+        offset, stored_len, _raw_len, codec = self._table[idx]
+        view = self._view[offset:offset + stored_len]
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(view)
+        return view
+
+    def definition(self, scene_id: str) -> Dict[str, Any]:
+        return json.loads(bytes(self.blob(self.scenes[scene_id].definition)).decode("utf-8"))
+
+    def text(self, scene_id: str) -> Optional[str]:
+        idx = self.scenes[scene_id].text
+        if idx == NO_BLOB:
+            return None
+        return str(self.blob(idx), "utf-8")
+
+    def image(self, scene_id: str) -> Optional[Blob]:
+        idx = self.scenes[scene_id].image
+        if idx == NO_BLOB:
+            return None
+        return self.blob(idx)
+
+    def close(self) -> None:
+        try:
+            self._view.release()
+            self._mm.close()
+        except (AttributeError, BufferError):
+            # ainda existem memoryviews vivas apontando pro mmap; o GC fecha depois
+            pass
+        self._file.close()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from jogo.content import registry
+from jogo.content.pack import PACK_FILENAME, PackWriter
+
+
+def compile_chapter(chapter_id: str, *, compress: bool = False, out: Optional[Path] = None) -> Path:
+    """
+    Compila o capítulo (manifest.json + ascii/*.txt + images/*) em um único chapter.pack.
+    Valida o capítulo inteiro antes de gravar (mesmas regras do registry).
+    O pack guarda mtime/tamanho de cada arquivo usado: o registry ignora o
+    pack quando algum deles muda depois do build.
+    """
+    manifest = registry.manifest_path(chapter_id)
+    sources: Dict[str, List[int]] = {}
+    _record(sources, manifest, manifest.parent)
+    raw = manifest.read_bytes()
+    data = registry.load_manifest(chapter_id)
+    base_dir = manifest.parent
+
+    chapter = registry.build_chapter(chapter_id, base_dir, data)
+
+    writer = PackWriter(compress=compress)
+
+    for scene_id, raw_scene in data["scenes"].items():
+        scene = chapter.scenes[scene_id]
+
+        text = None
+        if scene.text_file:
+            try:
+                _record(sources, Path(scene.text_file), base_dir)
+                text = Path(scene.text_file).read_bytes()
+            except OSError as e:
+                raise registry.ManifestError(f"text_file não encontrado: {scene.text_file}") from e
+
+        image = None
+        image_path = scene.image
+        if image_path and Path(image_path).is_file():
+            _record(sources, Path(image_path), base_dir)
+            image = Path(image_path).read_bytes()
+
+        writer.add_scene(scene_id, raw_scene, text=text, image=image)
+
+    writer.set_header(
+        entry_scene=chapter.entry_scene,
+        meta=dict(chapter.meta),
+        source_hash=hashlib.sha1(raw).hexdigest(),
+        labels={"items": data.get("items") or {}, "clues": data.get("clues") or {}},
+        sources=sources,
+    )
+    return writer.write(out or base_dir / PACK_FILENAME)
+
+
+def _record(sources: Dict[str, List[int]], path: Path, base_dir: Path) -> None:
+    """Assinatura antes da leitura: edição durante o build também deixa o pack velho."""
+    st = path.stat()
+    try:
+        key = path.resolve().relative_to(base_dir.resolve()).as_posix()
+    except ValueError:
+        key = str(path.resolve())
+    sources[key] = [st.st_mtime_ns, st.st_size]
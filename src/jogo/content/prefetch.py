@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Dict, Set, Tuple
+
+from jogo.content import registry
+from jogo.runtime.pools import LazyPool
+
+# Pool único por processo: todas as sessões dividem as mesmas threads.
+_pool = LazyPool(2, "prefetch")
+
+
+def configure_workers(n: int) -> None:
+    """Tamanho do pool compartilhado (AppConfig.prefetch_workers); ver LazyPool.resize."""
+    _pool.resize(n)
+
+
+@dataclass
+class PrefetchStats:
+    scheduled: int = 0
+    completed: int = 0
+    cancelled: int = 0  # jogador mudou de cena antes do job rodar
+    dropped: int = 0  # fila cheia
+    hits: int = 0  # cena escolhida já estava quente ao chegar
+    misses: int = 0  # cena prevista, mas ainda fria
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ScenePrefetcher:
+    """
+    Prefetch das cenas vizinhas (gotos) de uma sessão.
+    - schedule(cena): cancela o que sobrou da cena anterior e agenda as próximas
+    - no máximo max_pending jobs em voo; o excedente é descartado
+    - hit = a cena escolhida tinha sido prevista e já estava quente
+      (no cache ou com o job concluído) quando o jogador saiu da anterior
+    """
+
+    def __init__(self, *, max_pending: int = 8) -> None:
+        self.max_pending = max(1, max_pending)
+        self.stats = PrefetchStats()
+
+        self._gen = 0
+        self._predicted: Tuple[str, Tuple[str, ...]] = ("", ())
+        self._ready: Set[str] = set()  # cenas previstas já quentes (geração atual)
+        self._jobs: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def schedule(self, chapter_id: str, scene_id: str) -> None:
+        self._score(chapter_id, scene_id)
+
+        with self._lock:
+            if self._closed:
+                return
+            self._gen += 1
+            gen = self._gen
+            stale = list(self._jobs.values())
+            self._jobs.clear()
+            self._ready = set()
+        # cancel() roda os callbacks (_done) na hora: fora do lock
+        for fut in stale:
+            fut.cancel()
+
+        try:
+            nexts = registry.get_successors(chapter_id, scene_id)
+        except (registry.ChapterNotFoundError, registry.ManifestError):
+            return
+        self._predicted = (chapter_id, tuple(nexts))
+
+        pool = _pool.executor()
+        for nxt in nexts:
+            with self._lock:
+                if registry.is_scene_cached(chapter_id, nxt):
+                    self._ready.add(nxt)
+                    continue
+                if len(self._jobs) >= self.max_pending:
+                    self.stats.dropped += 1
+                    continue
+                key = (chapter_id, nxt)
+                fut = pool.submit(self._warm, gen, chapter_id, nxt)
+                self._jobs[key] = fut
+                self.stats.scheduled += 1
+            fut.add_done_callback(lambda f, k=key, g=gen: self._done(k, g, f))
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            stale = list(self._jobs.values())
+            self._jobs.clear()
+        for fut in stale:
+            fut.cancel()
+
+    # ---------- Internos ----------
+
+    def _score(self, chapter_id: str, scene_id: str) -> None:
+        chapter, predicted = self._predicted
+        if chapter != chapter_id or scene_id not in predicted:
+            return
+        # chamado antes do reset da geração: _ready ainda é a da cena anterior
+        with self._lock:
+            if scene_id in self._ready:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+
+    def _warm(self, gen: int, chapter_id: str, scene_id: str) -> None:
+        if gen != self._gen:
+            return  # jogador já saiu da cena que pediu este job
+        try:
+            registry.get_scene(chapter_id, scene_id)
+        except (registry.ManifestError, registry.SceneNotFoundError):
+            pass  # o erro aparece de novo (e é tratado) no caminho normal
+
+    def _done(self, key: Tuple[str, str], gen: int, fut: Future) -> None:
+        with self._lock:
+            if self._jobs.get(key) is fut:
+                del self._jobs[key]
+            if fut.cancelled():
+                self.stats.cancelled += 1
+                return
+            self.stats.completed += 1
+            if gen == self._gen:
+                self._ready.add(key[1])
@@ -1,9 +1,25 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import dataclass
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from jogo.content.conditions import Condition, ConditionError, compile_condition
+from jogo.content.graph import ChapterGraph, build_graph
+from jogo.content.items import CLUES, ITEMS
+from jogo.content.manifest_index import LazyScenes, ManifestIndexError, StreamingManifest
+from jogo.content.pack import PACK_FILENAME, Blob, ChapterPack, PackError
+from jogo.content.templates import Template, compile_template
+from jogo.content.textcache import ByteLRU, LRUStats
+from jogo.runtime import metrics
+from jogo.runtime.config import AppConfig
+from jogo.runtime.pools import LazyPool
 
 
 # Pasta base do conteúdo: src/jogo/content
@@ -27,6 +43,23 @@ class ActionData:
     goto: str
     effects: EffectsData = EffectsData()
     hint: str = ""  # opcional (Sprint 1)
+    # hint com {stats} compilado no load; None = hint estático
+    hint_template: Optional[Template] = field(default=None, compare=False, repr=False)
+    # "requires" compilado no load; None = sempre habilitada
+    requires: Optional[Condition] = field(default=None, compare=False, repr=False)
+    # "grants"/"consumes" como máscaras de bits (items.ITEMS / items.CLUES)
+    gain_items: int = 0
+    lose_items: int = 0
+    gain_clues: int = 0
+    lose_clues: int = 0
+
+
+@dataclass(frozen=True)
+class TextVariant:
+    """Texto alternativo da cena: vale o primeiro cujo `when` for verdadeiro."""
+    when: Condition
+    text: str
+    template: Optional[Template] = field(default=None, compare=False, repr=False)
 
 
 @dataclass(frozen=True)
@@ -35,6 +68,47 @@ class SceneData:
     text: str
     image: str  # path resolvido (string) ou ""
     actions: List[ActionData]
+    text_file: str = ""  # path resolvido; corpo carregado sob demanda (LRU)
+    # índice key -> ação, montado no load (lookup O(1) no choose)
+    actions_by_key: Mapping[str, ActionData] = field(
+        default_factory=lambda: MappingProxyType({}), compare=False, repr=False
+    )
+    # texto com {stats} compilado (inline: no load; text_file: quando o corpo é lido)
+    template: Optional[Template] = field(default=None, compare=False, repr=False)
+    variants: Tuple[TextVariant, ...] = ()
+
+
+@dataclass(frozen=True, eq=False)
+class ChapterData:
+    """
+    Capítulo já parseado e validado (imutável).
+    - scenes indexadas por id (lookup O(1), sem I/O)
+    - cenas com text_file ficam só com metadados aqui (text=""); o corpo
+      é resolvido por get_scene() via LRU limitado por bytes
+    - eq=False: identidade do objeto = versão do capítulo em cache
+    - manifest grande (>= AppConfig.streaming_manifest_bytes): scenes é um
+      LazyScenes (cada cena decodificada no primeiro acesso) e graph=None até
+      o primeiro get_graph()
+    """
+    id: str
+    base_dir: Path
+    entry_scene: str
+    meta: Mapping[str, Any]
+    scenes: Mapping[str, SceneData]
+    graph: Optional[ChapterGraph]
+    pack: Optional[ChapterPack] = None  # presente quando carregado de chapter.pack
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    reloads: int = 0  # arquivo mudou (mtime) e o conteúdo (hash) também
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
 
 
 # ---------- Erros do registry ----------
@@ -69,74 +143,531 @@ def manifest_path(chapter_id: str) -> Path:
 
 def load_manifest(chapter_id: str) -> Dict[str, Any]:
     """
-    Lê e retorna o dict do manifest do capítulo.
-    Mantém cache simples por processo (opcional futuramente).
+    Lê e retorna o dict cru do manifest do capítulo (sempre do disco).
+    Para o caminho quente use get_chapter()/get_scene(), que usam o cache.
     """
     p = manifest_path(chapter_id)
-    try:
-        data = json.loads(p.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as e:
-        raise ManifestError(f"JSON inválido em {p}: {e}") from e
+    return _decode_manifest(p, p.read_bytes())
 
-    if not isinstance(data, dict):
-        raise ManifestError("manifest.json deve ser um objeto JSON (dict).")
 
-    # validações mínimas (v1)
-    if "scenes" not in data or not isinstance(data["scenes"], dict):
-        raise ManifestError("manifest.json deve conter 'scenes' como objeto (dict).")
+def pack_path(chapter_id: str) -> Optional[Path]:
+    """Caminho do chapter.pack compilado, se existir."""
+    p = chapter_dir(chapter_id) / PACK_FILENAME
+    return p if p.is_file() else None
 
-    if "entry_scene" in data and not isinstance(data["entry_scene"], str):
-        raise ManifestError("'entry_scene' deve ser string.")
 
-    return data
+def load_chapter(chapter_id: str) -> ChapterData:
+    """
+    Retorna o capítulo do cache, revalidando contra o disco:
+    - mtime/size iguais -> hit (só stat, sem leitura)
+    - manifest: mtime mudou mas hash do conteúdo igual -> hit (mantém o parse)
+    - conteúdo mudou -> parse + validação de novo
+
+    Se existir chapter.pack em dia com os arquivos soltos ele tem prioridade
+    (aberto via mmap, sem ler nem hashear o pack inteiro); pack velho (algum
+    arquivo mudou depois do build) é ignorado e valem os arquivos soltos.
+    Com o pack em cache, o hit confere só pack e manifest (dois stats):
+    text_file/imagem editados contam na próxima abertura do pack.
+    Um lock por capítulo: capítulos diferentes carregam em paralelo (catalog.warm_all).
+    """
+    with _load_lock(chapter_id):
+        entry = _cache.get(chapter_id)
+        pack = pack_path(chapter_id)
+        pack_signature = _signature(pack) if pack is not None else None
+        if entry is not None and _is_fresh(entry, pack_signature):
+            _stats.hits += 1
+            _prune_stale_texts(entry.chapter)
+            return entry.chapter
+
+        t0 = time.perf_counter() if metrics.ENABLED else 0.0
+        opened = _open_fresh_pack(pack) if pack is not None else None
+        if opened is not None:
+            assert pack is not None and pack_signature is not None
+            chapter = _build_chapter_from_pack(chapter_id, opened)
+            manifest = pack.parent / "manifest.json"
+            _cache[chapter_id] = _CacheEntry(
+                pack_signature, "", pack, chapter, pack_signature, watch_signature=_signature(manifest)
+            )
+            return _loaded(chapter_id, chapter, entry, t0)
+
+        source = manifest_path(chapter_id)
+        signature = _signature(source)
+        if signature[1] >= _streaming_min_bytes:
+            # capítulo grande: sem ler/decodificar o arquivo inteiro (nem hash)
+            chapter = _build_chapter_streaming(chapter_id, source)
+            _cache[chapter_id] = _CacheEntry(signature, "", source, chapter, pack_signature)
+            return _loaded(chapter_id, chapter, entry, t0)
+
+        raw = source.read_bytes()
+        data = _decode_manifest(source, raw)
+        digest = hashlib.sha1(raw).hexdigest()
+
+        if entry is not None and entry.source == source and entry.digest == digest:
+            _cache[chapter_id] = _CacheEntry(signature, digest, source, entry.chapter, pack_signature)
+            _stats.hits += 1
+            _prune_stale_texts(entry.chapter)
+            return entry.chapter
+
+        chapter = build_chapter(chapter_id, source.parent, data)
+        _cache[chapter_id] = _CacheEntry(signature, digest, source, chapter, pack_signature)
+        return _loaded(chapter_id, chapter, entry, t0)
+
+
+def _is_fresh(entry: _CacheEntry, pack_signature: Optional[Tuple[int, int]]) -> bool:
+    if entry.pack_signature != pack_signature or entry.signature != _signature(entry.source):
+        return False
+    # capítulo vindo do pack: editar o manifest solto invalida
+    return entry.watch_signature is None or entry.watch_signature == _signature(entry.source.parent / "manifest.json")
+
+
+def _loaded(chapter_id: str, chapter: ChapterData, previous: Optional[_CacheEntry], t0: float) -> ChapterData:
+    _text_cache.prune(lambda key, _stamp: key[0] == chapter_id)
+    if previous is None:
+        _stats.misses += 1
+    else:
+        _stats.reloads += 1
+        if previous.chapter is not chapter:
+            _close_chapter(previous.chapter)
+    if t0:
+        metrics.observe("registry.load_chapter", time.perf_counter() - t0)
+    return chapter
+
+
+def _close_chapter(chapter: ChapterData) -> None:
+    """Versão antiga substituída no cache: libera mmap/arquivo do pack ou do manifest em streaming."""
+    if chapter.pack is not None:
+        chapter.pack.close()
+    if isinstance(chapter.scenes, LazyScenes):
+        chapter.scenes.close()
+
+
+def get_chapter(chapter_id: str) -> ChapterData:
+    """
+    Caminho quente: devolve o capítulo em cache sem tocar no disco.
+    Só carrega (load_chapter) na primeira vez.
+    """
+    entry = _cache.get(chapter_id)
+    if entry is not None:
+        _stats.hits += 1
+        return entry.chapter
+    return load_chapter(chapter_id)
+
+
+def invalidate(chapter_id: Optional[str] = None) -> None:
+    """Descarta o cache de um capítulo (ou de todos), incluindo textos."""
+    with _cache_lock:
+        if chapter_id is None:
+            _cache.clear()
+            _text_cache.clear()
+        else:
+            _cache.pop(chapter_id, None)
+            _text_cache.prune(lambda key, _stamp: key[0] == chapter_id)
+
+
+def cache_stats() -> CacheStats:
+    """Cópia dos contadores de hit/miss do cache de capítulos."""
+    return CacheStats(hits=_stats.hits, misses=_stats.misses, reloads=_stats.reloads)
+
+
+def reset_cache_stats() -> None:
+    _stats.hits = _stats.misses = _stats.reloads = 0
+    _text_cache.reset_stats()
+
+
+def configure_streaming(min_bytes: int) -> None:
+    """Manifests a partir deste tamanho usam o modo streaming (AppConfig.streaming_manifest_bytes)."""
+    global _streaming_min_bytes
+    _streaming_min_bytes = max(0, int(min_bytes))
+
+
+def configure_text_cache(max_bytes: int) -> None:
+    """Ajusta o teto (em bytes) do LRU de textos (AppConfig.text_cache_bytes)."""
+    _text_cache.resize(max_bytes)
+
+
+def text_cache_stats() -> LRUStats:
+    """Hits, misses, evictions e bytes em uso do LRU de textos."""
+    return _text_cache.stats()
 
 
 def get_entry_scene_id(chapter_id: str) -> str:
-    m = load_manifest(chapter_id)
-    entry = m.get("entry_scene")
+    entry = get_chapter(chapter_id).entry_scene
     if not entry:
-        # fallback: pega a primeira key das cenas
-        scenes = list(m["scenes"].keys())
-        if not scenes:
-            raise ManifestError("Nenhuma cena definida em 'scenes'.")
-        return scenes[0]
+        raise ManifestError("Nenhuma cena definida em 'scenes'.")
     return entry
 
 
+def get_graph(chapter_id: str) -> ChapterGraph:
+    """Índice do grafo (arestas, reverso, alcançáveis, finais) do capítulo."""
+    chapter = get_chapter(chapter_id)
+    if chapter.graph is not None:
+        return chapter.graph
+    # modo streaming: monta uma vez (decodifica todas as cenas) e guarda por versão
+    with _cache_lock:
+        graph = _lazy_graphs.get(chapter)
+        if graph is None:
+            graph = _lazy_graphs[chapter] = build_graph(chapter.entry_scene, chapter.scenes)
+        return graph
+
+
+def get_successors(chapter_id: str, scene_id: str) -> Tuple[str, ...]:
+    """
+    Cenas vizinhas (gotos válidos, sem repetição) de scene_id.
+    Modo streaming sem grafo montado: decodifica só esta cena (para prefetch
+    no event loop, sem pagar o get_graph() inteiro).
+    """
+    chapter = get_chapter(chapter_id)
+    graph = chapter.graph if chapter.graph is not None else _lazy_graphs.get(chapter)
+    if graph is not None:
+        return graph.successors(scene_id)
+    scene = chapter.scenes.get(scene_id)
+    if scene is None:
+        return ()
+    return tuple(dict.fromkeys(a.goto for a in scene.actions if a.goto in chapter.scenes))
+
+
+def get_image_bytes(chapter_id: str, scene_id: str) -> Optional[Blob]:
+    """
+    Bytes da imagem da cena:
+    - do pack: fatia do mmap (sem cópia)
+    - solto: lido do disco
+    None se a cena não tem imagem (ou o arquivo não existe).
+    """
+    chapter = get_chapter(chapter_id)
+    scene = get_scene(chapter_id, scene_id)
+
+    if chapter.pack is not None and scene_id in chapter.pack.scenes:
+        data = chapter.pack.image(scene_id)
+        if data is not None:
+            return data
+
+    if not scene.image:
+        return None
+    try:
+        return Path(scene.image).read_bytes()
+    except OSError:
+        return None
+
+
 def get_scene(chapter_id: str, scene_id: str) -> SceneData:
     """
-    Retorna SceneData já resolvido:
+    Retorna SceneData já resolvido (lookup O(1) no capítulo em cache):
     - text carregado de text_file ou 'text'
     - image resolvido para caminho absoluto (string) ou ""
     - actions normalizadas com efeitos default + hint opcional
     """
-    manifest = load_manifest(chapter_id)
-    scenes = manifest["scenes"]
-
-    if scene_id not in scenes:
+    t0 = time.perf_counter() if metrics.ENABLED else 0.0
+    chapter = get_chapter(chapter_id)
+    scene = chapter.scenes.get(scene_id)
+    if scene is None:
         raise SceneNotFoundError(f"Cena '{scene_id}' não existe no capítulo '{chapter_id}'.")
+    if scene.text_file:
+        scene = _text_cache.get((chapter_id, scene_id), lambda: _load_scene_text(chapter, scene))
+    if t0:
+        metrics.observe("registry.get_scene", time.perf_counter() - t0)
+    return scene
+
+
+def is_chapter_cached(chapter_id: str) -> bool:
+    """get_chapter() responderia sem tocar no disco?"""
+    return chapter_id in _cache
+
+
+def is_scene_cached(chapter_id: str, scene_id: str) -> bool:
+    """get_scene() responderia sem I/O? (texto inline ou text_file já no LRU)"""
+    chapter = get_chapter(chapter_id)
+    scene = chapter.scenes.get(scene_id)
+    if scene is None or not scene.text_file:
+        return True
+    return _text_cache.peek((chapter_id, scene_id)) is not None
 
-    raw_scene = scenes[scene_id]
-    if not isinstance(raw_scene, dict):
-        raise ManifestError(f"Cena '{scene_id}' deve ser objeto (dict).")
 
-    base_dir = chapter_dir(chapter_id)
+# ---------- Cache de capítulos (por processo) ----------
 
-    text = _resolve_text(base_dir, raw_scene, scene_id)
-    image = _resolve_image(base_dir, raw_scene)
+@dataclass(frozen=True)
+class _CacheEntry:
+    signature: Tuple[int, int]
+    digest: str
+    source: Path  # manifest.json ou chapter.pack
+    chapter: ChapterData
+    # chapter.pack no disco quando a entrada foi montada (None = não havia);
+    # pack aparecer/mudar/sumir recarrega, mesmo se ele foi ignorado por estar velho
+    pack_signature: Optional[Tuple[int, int]] = None
+    # fonte = pack: assinatura do manifest.json solto
+    watch_signature: Optional[Tuple[int, int]] = None
+
+
+_cache: Dict[str, _CacheEntry] = {}
+_cache_lock = threading.RLock()
+_load_locks: Dict[str, threading.Lock] = {}
+_stats = CacheStats()
+
+# Corpos de text_file: chave (chapter_id, scene_id) -> SceneData com texto.
+# Peso = bytes do texto; teto vem do AppConfig (configure_text_cache).
+_text_cache: ByteLRU[SceneData] = ByteLRU(AppConfig().text_cache_bytes)
+
+_streaming_min_bytes = AppConfig().streaming_manifest_bytes
+# grafos montados sob demanda para capítulos em modo streaming
+_lazy_graphs: "weakref.WeakKeyDictionary[ChapterData, ChapterGraph]" = weakref.WeakKeyDictionary()
+
+# taxas de acerto lidas só quando as métricas são exportadas
+metrics.register_gauge("registry.chapter_cache.hit_rate", lambda: cache_stats().hit_rate)
+metrics.register_gauge("registry.text_cache.hit_rate", lambda: _text_cache.stats().hit_rate)
+metrics.register_gauge("registry.text_cache.bytes", lambda: _text_cache.stats().bytes)
+
+
+def _load_lock(chapter_id: str) -> threading.Lock:
+    with _cache_lock:
+        lock = _load_locks.get(chapter_id)
+        if lock is None:
+            lock = _load_locks[chapter_id] = threading.Lock()
+        return lock
+
+
+def _signature(f: Path) -> Tuple[int, int]:
+    """(mtime_ns, size) do arquivo; arquivo sumido vira (-1, -1)."""
+    try:
+        st = f.stat()
+    except OSError:
+        return (-1, -1)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_scene_text(chapter: ChapterData, scene: SceneData) -> Tuple[SceneData, int, Any]:
+    if chapter.pack is not None and scene.id in chapter.pack.scenes:
+        text = chapter.pack.text(scene.id)
+        stamp = None  # versão do pack já é coberta pela assinatura do capítulo
+    else:
+        text = None
+
+    if text is None:
+        p = Path(scene.text_file)
+        try:
+            raw = p.read_bytes()
+        except OSError as e:
+            raise ManifestError(f"text_file não encontrado: {p}") from e
+        text = raw.decode("utf-8")
+        stamp = _signature(p)
+
+    return replace(scene, text=text, template=compile_template(text)), len(text.encode("utf-8")), stamp
+
+
+def _prune_stale_texts(chapter: ChapterData) -> None:
+    """
+    Na revalidação (load_chapter), descarta textos em cache cujo arquivo mudou.
+    Custo limitado ao que está no LRU, não ao tamanho do capítulo.
+    """
+    def _stale(key: Any, stamp: Any) -> bool:
+        if key[0] != chapter.id or stamp is None:
+            return False
+        scene = chapter.scenes.get(key[1])
+        return scene is None or _signature(Path(scene.text_file)) != stamp
+
+    _text_cache.prune(_stale)
+
+
+def build_chapter(chapter_id: str, base_dir: Path, data: Dict[str, Any]) -> ChapterData:
+    """
+    Parse + validação de todas as cenas, uma única vez por versão do manifest.
+    Público para ferramentas (ex.: compilador de pack) validarem um capítulo.
+    """
+    raw_scenes = data["scenes"]
+    scenes: Dict[str, SceneData] = {}
+    _register_labels(data.get("items"), data.get("clues"))
+
+    for scene_id, raw_scene in raw_scenes.items():
+        if not isinstance(raw_scene, dict):
+            raise ManifestError(f"Cena '{scene_id}' deve ser objeto (dict).")
+        scenes[scene_id] = _parse_scene(base_dir, scene_id, raw_scene)
+
+    meta = data.get("meta") or {}
+    if not isinstance(meta, dict):
+        raise ManifestError("'meta' deve ser objeto (dict).")
+
+    return _make_chapter(chapter_id, base_dir, data.get("entry_scene") or "", meta, scenes)
+
+
+def _open_fresh_pack(path: Path) -> Optional[ChapterPack]:
+    """
+    Abre o pack se ele ainda corresponde aos arquivos soltos.
+    None = algum arquivo (manifest, text_file, imagem) mudou depois do build.
+    Arquivo solto ausente não conta: o pack pode ser distribuído sozinho.
+    """
+    try:
+        pack = ChapterPack(path)
+    except (OSError, PackError) as e:
+        raise ManifestError(str(e)) from e
+
+    base_dir = path.parent
+    manifest = base_dir / "manifest.json"
+    checks = dict(pack.sources)
+    recorded = checks.pop("manifest.json", None)
+    stale = False
+
+    sig = _signature(manifest)
+    if sig != (-1, -1) and (recorded is None or tuple(recorded) != sig):
+        # mtime diferente (checkout, cópia) ainda pode ser o mesmo conteúdo
+        stale = not pack.source_hash or hashlib.sha1(manifest.read_bytes()).hexdigest() != pack.source_hash
+    if not stale:
+        for rel, recorded in checks.items():
+            sig = _signature(base_dir / rel)
+            if sig != (-1, -1) and tuple(recorded) != sig:
+                stale = True
+                break
+
+    if stale:
+        pack.close()
+        if metrics.ENABLED:
+            metrics.incr("registry.pack.stale")
+        return None
+    return pack
+
+
+def _build_chapter_from_pack(chapter_id: str, pack: ChapterPack) -> ChapterData:
+    base_dir = pack.path.parent
+    scenes: Dict[str, SceneData] = {}
+    _register_labels(pack.labels.get("items"), pack.labels.get("clues"))
+    for scene_id in pack.scenes:
+        scenes[scene_id] = _parse_scene(base_dir, scene_id, pack.definition(scene_id))
+
+    return _make_chapter(chapter_id, base_dir, pack.entry_scene, pack.meta, scenes, pack=pack)
+
+
+# Trabalho de fundo do registry (nomes de itens/pistas no modo streaming):
+# uma thread compartilhada por todos os capítulos, criada no primeiro uso.
+_background = LazyPool(1, "registry")
+
+
+def _build_chapter_streaming(chapter_id: str, path: Path) -> ChapterData:
+    """
+    Manifest grande: índice de offsets (varrido uma vez e salvo em
+    manifest.index.json) + decodificação por cena. A entrada sai logo;
+    gotos quebrados só aparecem no get_graph()/na escolha (GameEngine.choose
+    confere o destino antes de mudar o estado).
+    """
+    manifest = StreamingManifest(path)
+    base_dir = path.parent
+
+    def load(scene_id: str) -> Optional[SceneData]:
+        try:
+            raw = manifest.raw_scene(scene_id)
+        except (ManifestIndexError, ValueError) as e:
+            raise ManifestError(f"Cena '{scene_id}' inválida em {path}: {e}") from e
+        if raw is None:
+            return None
+        return _parse_scene(base_dir, scene_id, raw)
+
+    scenes = LazyScenes(manifest, load)
+    try:
+        entry = manifest.entry_scene or next(iter(scenes), "")
+        meta = manifest.meta
+    except ManifestIndexError as e:
+        raise ManifestError(str(e)) from e
+
+    def labels() -> None:
+        # seções depois de "scenes" só saem no fim da varredura: não segura o load
+        try:
+            _register_labels(manifest.top_value("items"), manifest.top_value("clues"))
+        except (ManifestError, ValueError):
+            pass  # nomes são só exibição; ids continuam valendo (ou o capítulo já foi recarregado)
+
+    _background.submit(labels)
+    if entry and entry not in scenes:
+        raise ManifestError(f"entry_scene '{entry}' não existe em 'scenes'.")
+
+    return ChapterData(
+        id=chapter_id,
+        base_dir=base_dir,
+        entry_scene=entry,
+        meta=MappingProxyType(dict(meta)),
+        scenes=scenes,
+        graph=None,
+    )
+
+
+def _make_chapter(
+    chapter_id: str,
+    base_dir: Path,
+    entry: str,
+    meta: Mapping[str, Any],
+    scenes: Dict[str, SceneData],
+    *,
+    pack: Optional[ChapterPack] = None,
+) -> ChapterData:
+    """
+    Fecha o capítulo: entrada + índice do grafo.
+    Todos os gotos são checados aqui (uma passada), então o caminho quente
+    (get_scene/choose) não precisa validar nada.
+    """
+    # fallback: pega a primeira key das cenas
+    entry = entry or next(iter(scenes), "")
+    if entry and entry not in scenes:
+        raise ManifestError(f"entry_scene '{entry}' não existe em 'scenes'.")
+
+    graph = build_graph(entry, scenes)
+    if graph.broken:
+        details = ", ".join(f"{b.scene_id}[{b.action_key}] -> '{b.goto}'" for b in graph.broken)
+        raise ManifestError(f"Capítulo '{chapter_id}' tem goto(s) para cena inexistente: {details}")
+
+    return ChapterData(
+        id=chapter_id,
+        base_dir=base_dir,
+        entry_scene=entry,
+        meta=MappingProxyType(dict(meta)),
+        scenes=MappingProxyType(scenes),
+        graph=graph,
+        pack=pack,
+    )
+
+
+# ---------- Internos (helpers) ----------
+
+def _parse_scene(base_dir: Path, scene_id: str, raw_scene: Dict[str, Any]) -> SceneData:
+    text, text_file = _resolve_text(base_dir, raw_scene, scene_id)
     actions = _resolve_actions(raw_scene)
 
+    by_key: Dict[str, ActionData] = {}
+    for a in actions:
+        if a.key in by_key:
+            raise ManifestError(f"Cena '{scene_id}': ação com key '{a.key}' duplicada.")
+        by_key[a.key] = a
+
     return SceneData(
         id=scene_id,
         text=text,
-        image=image,
+        image=_resolve_image(base_dir, raw_scene),
         actions=actions,
+        text_file=text_file,
+        actions_by_key=MappingProxyType(by_key),
+        template=compile_template(text),
+        variants=_resolve_variants(raw_scene, scene_id),
     )
 
 
-# ---------- Internos (helpers) ----------
+def _decode_manifest(p: Path, raw: bytes) -> Dict[str, Any]:
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ManifestError(f"JSON inválido em {p}: {e}") from e
+
+    if not isinstance(data, dict):
+        raise ManifestError("manifest.json deve ser um objeto JSON (dict).")
 
-def _resolve_text(base_dir: Path, raw_scene: Dict[str, Any], scene_id: str) -> str:
+    # validações mínimas (v1)
+    if "scenes" not in data or not isinstance(data["scenes"], dict):
+        raise ManifestError("manifest.json deve conter 'scenes' como objeto (dict).")
+
+    if "entry_scene" in data and not isinstance(data["entry_scene"], str):
+        raise ManifestError("'entry_scene' deve ser string.")
+
+    return data
+
+
+def _resolve_text(base_dir: Path, raw_scene: Dict[str, Any], scene_id: str) -> Tuple[str, str]:
+    """
+    Retorna (texto inline, text_file resolvido).
+    Só valida o text_file aqui; o corpo é lido sob demanda em get_scene().
+    """
     text_file = raw_scene.get("text_file")
     text_inline = raw_scene.get("text")
 
@@ -146,16 +677,13 @@ def _resolve_text(base_dir: Path, raw_scene: Dict[str, Any], scene_id: str) -> s
     if text_file:
         if not isinstance(text_file, str):
             raise ManifestError(f"'text_file' da cena '{scene_id}' deve ser string.")
-        p = (base_dir / text_file).resolve()
-        if not p.exists():
-            raise ManifestError(f"text_file não encontrado: {p}")
-        return p.read_text(encoding="utf-8")
+        return "", str((base_dir / text_file).resolve())
 
     if text_inline is None:
-        return ""  # permitido (cena sem texto)
+        return "", ""  # permitido (cena sem texto)
     if not isinstance(text_inline, str):
         raise ManifestError(f"'text' da cena '{scene_id}' deve ser string.")
-    return text_inline
+    return text_inline, ""
 
 
 def _resolve_image(base_dir: Path, raw_scene: Dict[str, Any]) -> str:
@@ -204,11 +732,87 @@ def _resolve_actions(raw_scene: Dict[str, Any]) -> List[ActionData]:
         if not isinstance(hint, str):
             raise ManifestError(f"Ação index {i}: 'hint' deve ser string.")
 
-        out.append(ActionData(key=key, label=label, goto=goto, effects=effects, hint=hint))
+        gain_items, gain_clues = _parse_holdings(a.get("grants"), f"Ação index {i}: 'grants'")
+        lose_items, lose_clues = _parse_holdings(a.get("consumes"), f"Ação index {i}: 'consumes'")
+
+        requires = a.get("requires")
+        if requires is not None:
+            if not isinstance(requires, str):
+                raise ManifestError(f"Ação index {i}: 'requires' deve ser string.")
+            try:
+                requires = compile_condition(requires)
+            except ConditionError as e:
+                raise ManifestError(f"Ação index {i}: {e}") from e
+
+        out.append(
+            ActionData(
+                key=key,
+                label=label,
+                goto=goto,
+                effects=effects,
+                hint=hint,
+                hint_template=compile_template(hint),
+                requires=requires,
+                gain_items=gain_items,
+                lose_items=lose_items,
+                gain_clues=gain_clues,
+                lose_clues=lose_clues,
+            )
+        )
 
     return out
 
 
+def _parse_holdings(raw: Any, where: str) -> Tuple[int, int]:
+    """{"items": [...], "clues": [...]} -> (máscara de itens, máscara de pistas)."""
+    if raw is None:
+        return 0, 0
+    if not isinstance(raw, dict):
+        raise ManifestError(f"{where} deve ser objeto (dict).")
+    masks = []
+    for kind, interner in (("items", ITEMS), ("clues", CLUES)):
+        ids = raw.get(kind) or []
+        if not isinstance(ids, list) or not all(isinstance(x, str) and x for x in ids):
+            raise ManifestError(f"{where}.{kind} deve ser lista de ids (strings).")
+        masks.append(interner.mask(ids))
+    return masks[0], masks[1]
+
+
+def _register_labels(items_decl: Any, clues_decl: Any) -> None:
+    """Seções "items"/"clues" do manifest: id -> nome exibido (opcionais)."""
+    for kind, decl, interner in (("items", items_decl, ITEMS), ("clues", clues_decl, CLUES)):
+        if decl is None:
+            continue
+        if not isinstance(decl, dict) or not all(isinstance(v, str) for v in decl.values()):
+            raise ManifestError(f"'{kind}' deve ser objeto id -> nome (strings).")
+        for name, label in decl.items():
+            interner.set_label(name, label)
+
+
+def _resolve_variants(raw_scene: Dict[str, Any], scene_id: str) -> Tuple[TextVariant, ...]:
+    variants_raw = raw_scene.get("variants")
+    if variants_raw is None:
+        return ()
+    if not isinstance(variants_raw, list):
+        raise ManifestError(f"Cena '{scene_id}': 'variants' deve ser uma lista.")
+
+    out: List[TextVariant] = []
+    for i, v in enumerate(variants_raw):
+        if not isinstance(v, dict):
+            raise ManifestError(f"Cena '{scene_id}': variante index {i} deve ser objeto (dict).")
+        when, text = v.get("when"), v.get("text")
+        if not isinstance(when, str):
+            raise ManifestError(f"Cena '{scene_id}': variante index {i}: 'when' deve ser string.")
+        if not isinstance(text, str):
+            raise ManifestError(f"Cena '{scene_id}': variante index {i}: 'text' deve ser string.")
+        try:
+            cond = compile_condition(when)
+        except ConditionError as e:
+            raise ManifestError(f"Cena '{scene_id}': variante index {i}: {e}") from e
+        out.append(TextVariant(when=cond, text=text, template=compile_template(text)))
+    return tuple(out)
+
+
 def _parse_effects(e: Any) -> EffectsData:
     if e is None:
         return EffectsData()
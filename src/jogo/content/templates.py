@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import operator
+import re
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+# Templates de texto/hint com stats ao vivo.
+#
+#   {estresse}                      -> valor do stat
+#   {estresse>=70?Suas mãos tremem.}           -> trecho só se a condição valer
+#   {foco<40?Tudo embaralha.|Você lê com calma.} -> com alternativa
+#
+# Stats: sono, energia, foco, estresse. Operadores: >= <= > < == !=.
+# Qualquer {...} que não siga esse formato fica literal (arte ASCII usa chaves).
+#
+# Compilado uma vez (no load do capítulo / do text_file): os trechos fixos já
+# vêm concatenados e render() é só um join sobre poucas partes.
+
+STAT_NAMES = ("sono", "energia", "foco", "estresse")
+
+_OPS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+_STATS = "|".join(STAT_NAMES)
+_TOKEN = re.compile(
+    r"\{(?P<stat>" + _STATS + r")"
+    r"(?:\s*(?P<op>>=|<=|==|!=|>|<)\s*(?P<num>-?\d+)\?(?P<yes>[^{}|]*)(?:\|(?P<no>[^{}|]*))?)?\}"
+)
+
+Part = Union[str, Callable[[Any], str]]
+
+
+class Template:
+    """
+    Texto compilado. render(stats) recebe qualquer objeto com os atributos
+    dos stats (StatsSnapshot, PlayerStats).
+    """
+
+    __slots__ = ("source", "_parts")
+
+    def __init__(self, source: str, parts: Tuple[Part, ...]) -> None:
+        self.source = source
+        self._parts = parts
+
+    def render(self, stats: Any) -> str:
+        return "".join([p if isinstance(p, str) else p(stats) for p in self._parts])
+
+    def __repr__(self) -> str:
+        return f"Template({self.source!r})"
+
+
+def compile_template(source: str) -> Optional[Template]:
+    """None = texto estático (caminho rápido: usar a string como está)."""
+    if "{" not in source:
+        return None
+
+    parts: List[Part] = []
+    pos = 0
+    for m in _TOKEN.finditer(source):
+        if m.start() > pos:
+            parts.append(source[pos : m.start()])  # trecho fixo inteiro (inclui {...} literais)
+        parts.append(_compile_token(m))
+        pos = m.end()
+    if not parts:
+        return None
+
+    tail = source[pos:]
+    if tail:
+        parts.append(tail)
+    return Template(source, tuple(parts))
+
+
+def _compile_token(m: "re.Match[str]") -> Callable[[Any], str]:
+    get = operator.attrgetter(m.group("stat"))
+    op = m.group("op")
+    if op is None:
+        return lambda stats: str(get(stats))
+
+    test = _OPS[op]
+    num = int(m.group("num"))
+    yes = m.group("yes")
+    no = m.group("no") or ""
+    return lambda stats: yes if test(get(stats), num) else no
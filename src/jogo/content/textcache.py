@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class LRUStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ByteLRU(Generic[V]):
+    """
+    LRU limitado por bytes (não por quantidade de itens).
+    - cada entrada declara seu peso (ex.: tamanho do texto em bytes)
+    - ao passar de max_bytes, expulsa as menos usadas
+    - item maior que o limite inteiro não é guardado (só devolvido)
+    - stamp: metadado livre por entrada (ex.: mtime do arquivo) para prune()
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._data: "OrderedDict[Hashable, Tuple[V, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, load: Callable[[], Tuple[V, int, Any]]) -> V:
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return hit[0]
+            self._misses += 1
+
+        # I/O fora do lock: outras threads seguem lendo o cache
+        value, weight, stamp = load()
+        self.put(key, value, weight, stamp)
+        return value
+
+    def peek(self, key: Hashable) -> Optional[V]:
+        """Consulta sem contar hit/miss e sem mexer na ordem."""
+        hit = self._data.get(key)
+        return hit[0] if hit is not None else None
+
+    def put(self, key: Hashable, value: V, weight: int, stamp: Any = None) -> None:
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if weight > self.max_bytes:
+                return
+            self._data[key] = (value, weight, stamp)
+            self._bytes += weight
+            self._evict()
+
+    def prune(self, stale: Callable[[Hashable, Any], bool]) -> int:
+        """Remove entradas para as quais stale(key, stamp) é True."""
+        with self._lock:
+            dead = [k for k, (_v, _w, stamp) in self._data.items() if stale(k, stamp)]
+            for k in dead:
+                self._bytes -= self._data.pop(k)[1]
+            return len(dead)
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max(0, int(max_bytes))
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> LRUStats:
+        return LRUStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._data),
+            bytes=self._bytes,
+            max_bytes=self.max_bytes,
+        )
+
+    def reset_stats(self) -> None:
+        self._hits = self._misses = self._evictions = 0
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._data:
+            _k, (_v, w, _s) = self._data.popitem(last=False)
+            self._bytes -= w
+            self._evictions += 1
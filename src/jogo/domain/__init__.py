@@ -1,4 +1,14 @@
+from jogo.domain.async_engine import AsyncGameEngine
 from jogo.domain.engine import GameEngine
-from jogo.domain.models import Choice, GameState, PlayerStats
+from jogo.domain.models import Choice, GameState, Holdings, HoldingsSnapshot, PlayerStats, StatsSnapshot
 
-__all__ = ["GameEngine", "Choice", "GameState", "PlayerStats"]
+__all__ = [
+    "AsyncGameEngine",
+    "GameEngine",
+    "Choice",
+    "GameState",
+    "Holdings",
+    "HoldingsSnapshot",
+    "PlayerStats",
+    "StatsSnapshot",
+]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from jogo.content import registry
+from jogo.runtime import metrics
+from jogo.runtime.pools import LazyPool
+from jogo.domain.engine import GameEngine
+from jogo.domain.models import GameState, Holdings, PlayerStats
+
+# Acesso ao registry sem bloquear o event loop do Flet.
+#
+# Cena já em memória (capítulo em cache + texto inline ou no LRU) responde na
+# hora, sem trocar de thread. O resto (ler manifest/text_file, decodificar
+# cena em streaming) vai para um pool; pedidos simultâneos da mesma cena
+# (várias sessões, clique duplo) esperam o mesmo job.
+
+T = TypeVar("T")
+
+_pool = LazyPool(4, "engine-io")
+
+_inflight: Dict[Tuple[str, str], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def configure_workers(n: int) -> None:
+    """Tamanho do pool de I/O (AppConfig.engine_io_workers); ver LazyPool.resize."""
+    _pool.resize(n)
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any) -> T:
+    return await asyncio.wrap_future(_pool.submit(fn, *args))
+
+
+async def get_scene(chapter_id: str, scene_id: str) -> registry.SceneData:
+    """registry.get_scene awaitable (mesmos erros)."""
+    if registry.is_chapter_cached(chapter_id) and registry.is_scene_cached(chapter_id, scene_id):
+        return registry.get_scene(chapter_id, scene_id)
+
+    key = (chapter_id, scene_id)
+    with _inflight_lock:
+        fut = _inflight.get(key)
+        coalesced = fut is not None
+        if fut is None:
+            fut = _inflight[key] = _pool.submit(registry.get_scene, chapter_id, scene_id)
+    if coalesced:
+        if metrics.ENABLED:
+            metrics.incr("engine.async.coalesced")
+    else:
+        # fora do lock: o callback roda na hora se o job já terminou
+        fut.add_done_callback(lambda _f: _forget(key, fut))
+    return await asyncio.wrap_future(fut)
+
+
+def _forget(key: Tuple[str, str], fut: Future) -> None:
+    with _inflight_lock:
+        if _inflight.get(key) is fut:
+            del _inflight[key]
+
+
+class AsyncGameEngine:
+    """
+    GameEngine para o event loop: mesmas regras, mas a cena de destino é
+    carregada (await) antes da escolha ser aplicada.
+    - choose() de uma mesma sessão são serializados (clique duplo não embaralha)
+    - a engine síncrona continua acessível em .engine (stats, scene_id, saves)
+    """
+
+    def __init__(self, engine: GameEngine) -> None:
+        self.engine = engine
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def open(
+        cls,
+        *,
+        chapter_id: str,
+        stats: Optional[PlayerStats] = None,
+        holdings: Optional[Holdings] = None,
+        scene_id: Optional[str] = None,
+    ) -> "AsyncGameEngine":
+        """Cria a engine (load_chapter pode ler o disco) fora do event loop."""
+        engine = await run_blocking(
+            lambda: GameEngine(chapter_id=chapter_id, stats=stats, holdings=holdings, scene_id=scene_id)
+        )
+        return cls(engine)
+
+    @property
+    def chapter_id(self) -> str:
+        return self.engine.chapter_id
+
+    @property
+    def scene_id(self) -> str:
+        return self.engine.scene_id
+
+    async def start(self) -> GameState:
+        async with self._lock:
+            await get_scene(self.engine.chapter_id, self.engine.scene_id)
+            return self.engine.start()
+
+    async def choose(self, action_key: str) -> GameState:
+        async with self._lock:
+            goto = self.engine.target_of(action_key)
+            if goto is not None:
+                await get_scene(self.engine.chapter_id, goto)
+            # destino já em memória: choose() não faz I/O
+            return self.engine.choose(action_key)
@@ -0,0 +1,514 @@
+"""
+Simulador em lote (headless) para balanceamento.
+
+N sessões em struct-of-arrays (uma linha NumPy por stat + cena atual +
+itens/pistas), avançadas todas de uma vez. Mesma semântica do
+GameEngine.choose(): ação com requires falso não anda; senão efeitos
+somados (sem clamp), consumes, grants e goto; cena sem ações = final.
+
+Itens/pistas usam bits próprios do capítulo (int64: até 63 de cada).
+
+Requer numpy (extra opcional: `pip install jogo-detetive-john[sim]`).
+"""
+from __future__ import annotations
+
+import ast
+import copy
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from jogo.content import registry
+from jogo.content.conditions import FUNCS, BitFor, parse_condition
+from jogo.content.items import CLUES, ITEMS, LocalBits
+from jogo.domain.models import Holdings, PlayerStats
+
+STAT_FIELDS: Tuple[str, ...] = ("sono", "energia", "foco", "estresse")
+
+NO_ACTION = -1  # key inexistente na cena: re-renderiza (não anda)
+
+MAX_HELD_BITS = 63  # itens (ou pistas) distintos por capítulo
+
+# condição vetorizada: (stats (4, m), held (2, m)) -> (m,) bool
+VectorCondition = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+# ---------- Capítulo compilado para arrays ----------
+
+@dataclass(frozen=True)
+class CompiledChapter:
+    chapter_id: str
+    scene_ids: Tuple[str, ...]
+    index: Dict[str, int]
+    entry: int
+    n_actions: np.ndarray  # (S,)
+    goto: np.ndarray  # (S, A) índice da cena destino; -1 = padding
+    effects: np.ndarray  # (S, A, 4) deltas na ordem de STAT_FIELDS
+    keys: Tuple[Tuple[str, ...], ...]  # keys das ações por cena
+    terminal: np.ndarray  # (S,) bool
+    valid: np.ndarray  # (S, A) bool: ação existe (não é padding)
+    cond: np.ndarray  # (S, A) índice em conditions; -1 = sem requires
+    conditions: Tuple[VectorCondition, ...]
+    held_delta: np.ndarray  # (S, A, 4) máscaras locais: ganha/perde item, ganha/perde pista
+    items: LocalBits
+    clues: LocalBits
+
+    @property
+    def gated(self) -> bool:
+        return bool(self.conditions)
+
+    @property
+    def changes_holdings(self) -> bool:
+        return bool(self.held_delta.any())
+
+    def key_table(self, key: str) -> np.ndarray:
+        """(S,) índice da ação com essa key em cada cena, ou NO_ACTION."""
+        return np.array(
+            [ks.index(key) if key in ks else NO_ACTION for ks in self.keys],
+            dtype=np.int32,
+        )
+
+
+def compile_chapter(chapter: registry.ChapterData) -> CompiledChapter:
+    scene_ids = tuple(chapter.scenes)
+    index = {sid: i for i, sid in enumerate(scene_ids)}
+    width = max((len(s.actions) for s in chapter.scenes.values()), default=0) or 1
+
+    n_actions = np.zeros(len(scene_ids), dtype=np.int32)
+    goto = np.full((len(scene_ids), width), -1, dtype=np.int32)
+    effects = np.zeros((len(scene_ids), width, len(STAT_FIELDS)), dtype=np.int32)
+    cond = np.full((len(scene_ids), width), -1, dtype=np.int32)
+    held_delta = np.zeros((len(scene_ids), width, 4), dtype=np.int64)
+
+    items, clues = LocalBits(ITEMS), LocalBits(CLUES)
+    conditions: List[VectorCondition] = []
+    cond_index: Dict[str, int] = {}
+
+    for i, sid in enumerate(scene_ids):
+        actions = chapter.scenes[sid].actions
+        n_actions[i] = len(actions)
+        for j, a in enumerate(actions):
+            goto[i, j] = index[a.goto]
+            effects[i, j] = [getattr(a.effects, f) for f in STAT_FIELDS]
+            if a.requires is not None:
+                c = cond_index.get(a.requires.source)
+                if c is None:
+                    c = cond_index[a.requires.source] = len(conditions)
+                    conditions.append(vector_condition(a.requires.source, items.bit, clues.bit))
+                cond[i, j] = c
+            if a.gain_items | a.lose_items | a.gain_clues | a.lose_clues:
+                held_delta[i, j] = [
+                    items.remap(a.gain_items),
+                    items.remap(a.lose_items),
+                    clues.remap(a.gain_clues),
+                    clues.remap(a.lose_clues),
+                ]
+
+    for kind, bits in (("itens", items), ("pistas", clues)):
+        if len(bits) > MAX_HELD_BITS:
+            raise ValueError(f"Simulador em lote suporta até {MAX_HELD_BITS} {kind} por capítulo ({len(bits)}).")
+
+    return CompiledChapter(
+        chapter_id=chapter.id,
+        scene_ids=scene_ids,
+        index=index,
+        entry=index[chapter.entry_scene],
+        n_actions=n_actions,
+        goto=goto,
+        effects=effects,
+        keys=tuple(tuple(a.key for a in chapter.scenes[sid].actions) for sid in scene_ids),
+        terminal=n_actions == 0,
+        valid=np.arange(width)[None, :] < n_actions[:, None],
+        cond=cond,
+        conditions=tuple(conditions),
+        held_delta=held_delta,
+        items=items,
+        clues=clues,
+    )
+
+
+# ---------- Condições vetorizadas ----------
+
+def vector_condition(source: str, item_bit: BitFor, clue_bit: BitFor) -> VectorCondition:
+    """
+    A mesma condição do manifest, avaliada para m sessões de uma vez:
+    and/or/not viram logical_and/or/not, comparação encadeada vira and,
+    stats são linhas de stats (4, m) e has/knows testam held (2, m).
+    """
+    body = _Vectorize({"has": item_bit, "knows": clue_bit}).visit(parse_condition(source))
+    fn = ast.Expression(
+        ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[], args=[ast.arg("s"), ast.arg("h")], kwonlyargs=[], kw_defaults=[], defaults=[]
+            ),
+            body=ast.Call(ast.Name("_mask", ast.Load()), [body, ast.Name("s", ast.Load())], []),
+        )
+    )
+    ast.fix_missing_locations(fn)
+    code = compile(fn, f"<vector condition {source!r}>", "eval")
+    return eval(
+        code,
+        {
+            "__builtins__": {},
+            "_and": np.logical_and,
+            "_or": np.logical_or,
+            "_not": np.logical_not,
+            "_mask": _as_mask,
+        },
+    )
+
+
+def _as_mask(value: object, stats: np.ndarray) -> np.ndarray:
+    # condição constante ("1 < 2") dá escalar: vira uma linha por sessão
+    return np.broadcast_to(np.asarray(value).astype(bool), stats.shape[1:])
+
+
+def _call(fn: str, *args: ast.expr) -> ast.Call:
+    return ast.Call(ast.Name(fn, ast.Load()), list(args), [])
+
+
+def _row(name: str, i: int) -> ast.Subscript:
+    return ast.Subscript(ast.Name(name, ast.Load()), ast.Constant(i), ast.Load())
+
+
+class _Vectorize(ast.NodeTransformer):
+    def __init__(self, bits: Dict[str, BitFor]) -> None:
+        self.bits = bits
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        return ast.copy_location(_row("s", STAT_FIELDS.index(node.id)), node)
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        name = node.func.id  # type: ignore[union-attr]
+        mask = 1 << self.bits[name](node.args[0].value)  # type: ignore[attr-defined]
+        held = _row("h", 0 if FUNCS[name] == "items" else 1)
+        test = ast.Compare(ast.BinOp(held, ast.BitAnd(), ast.Constant(mask)), [ast.NotEq()], [ast.Constant(0)])
+        return ast.copy_location(test, node)
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        self.generic_visit(node)
+        fn = "_and" if isinstance(node.op, ast.And) else "_or"
+        out = node.values[0]
+        for v in node.values[1:]:
+            out = _call(fn, out, v)
+        return out
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        return _call("_not", node.operand) if isinstance(node.op, ast.Not) else node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        if len(node.ops) == 1:
+            return node
+        # a < b < c -> (a < b) and (b < c)
+        left, out = node.left, None
+        for op, right in zip(node.ops, node.comparators):
+            part = ast.Compare(copy.deepcopy(left), [op], [copy.deepcopy(right)])
+            out = part if out is None else _call("_and", out, part)
+            left = right
+        return out
+
+
+# ---------- Políticas ----------
+
+class Policy(ABC):
+    """
+    Escolhe o índice da ação para um subconjunto de sessões.
+    - scene: (m,) cena atual de cada sessão
+    - step: (m,) passo atual de cada sessão
+    - stats: (4, m) stats atuais
+    - enabled: (m, A) ações que o jogador pode clicar (existem e o requires vale)
+    Retorna (m,) índices de ação (ou NO_ACTION). Ação desabilitada = não anda.
+    """
+
+    def bind(self, chapter: CompiledChapter) -> None:
+        """Chamado uma vez pelo BatchEngine (pré-computar tabelas por cena)."""
+
+    @abstractmethod
+    def choose(self, scene: np.ndarray, step: np.ndarray, stats: np.ndarray, enabled: np.ndarray) -> np.ndarray:
+        ...
+
+
+class RandomPolicy(Policy):
+    """Ação uniforme entre as habilitadas."""
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self._rng = np.random.default_rng(seed)
+
+    def choose(self, scene: np.ndarray, step: np.ndarray, stats: np.ndarray, enabled: np.ndarray) -> np.ndarray:
+        n = enabled.sum(axis=1)
+        pick = (self._rng.random(scene.shape[0]) * n).astype(np.int32)
+        # pick-ésima ação habilitada de cada linha
+        action = (enabled.cumsum(axis=1) > pick[:, None]).argmax(axis=1).astype(np.int32)
+        return np.where(n > 0, action, NO_ACTION)
+
+
+class ScriptedPolicy(Policy):
+    """
+    Sequência fixa de keys (repetida em ciclo).
+    Key que não existe na cena = NO_ACTION (igual ao engine: não anda).
+    """
+
+    def __init__(self, keys: Sequence[str]) -> None:
+        if not keys:
+            raise ValueError("ScriptedPolicy precisa de pelo menos uma key.")
+        self.keys = tuple(keys)
+        self._table: np.ndarray = np.zeros((0, 0), dtype=np.int32)
+
+    def bind(self, chapter: CompiledChapter) -> None:
+        # (len(keys), S): para cada posição do script, índice da ação em cada cena
+        self._table = np.stack([chapter.key_table(k) for k in self.keys])
+
+    def choose(self, scene: np.ndarray, step: np.ndarray, stats: np.ndarray, enabled: np.ndarray) -> np.ndarray:
+        return self._table[step % len(self.keys), scene]
+
+
+def distance_to_ending(chapter: CompiledChapter) -> np.ndarray:
+    """(S,) menor número de ações até alguma cena final (-1 = nenhum final alcançável)."""
+    n_scenes, width = chapter.goto.shape
+    dst = chapter.goto.ravel()
+    real = dst >= 0
+    src, dst = np.repeat(np.arange(n_scenes, dtype=np.int32), width)[real], dst[real]
+
+    # arestas invertidas em CSR: quem leva a cada cena
+    preds = src[np.argsort(dst, kind="stable")]
+    counts = np.bincount(dst, minlength=n_scenes)
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    dist = np.full(n_scenes, -1, dtype=np.int32)
+    level = np.flatnonzero(chapter.terminal)
+    d = 0
+    while level.size:
+        dist[level] = d
+        lens = counts[level]
+        total = int(lens.sum())
+        if not total:
+            break
+        # índices em preds de todos os predecessores do nível (sem laço Python)
+        idx = np.repeat(offsets[level] - np.cumsum(lens) + lens, lens) + np.arange(total)
+        level = np.unique(preds[idx])
+        level = level[dist[level] < 0]
+        d += 1
+    return dist
+
+
+class GreedyPolicy(Policy):
+    """
+    Maximiza weights · effects da ação (olhando só um passo à frente), entre
+    as ações que aproximam de um final: cada passo reduz a distância (em ações)
+    até a cena final mais próxima, então a sessão nunca repete cena nem fica
+    presa num loop. Sem ação habilitada que aproxime: melhor ação que sai da
+    cena; sem essa, a melhor habilitada.
+    Default: quer foco/energia/sono e evita estresse.
+    """
+
+    def __init__(self, weights: Sequence[float] = (1.0, 1.0, 1.0, -1.0)) -> None:
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self._rank: np.ndarray = np.zeros((0, 0), dtype=np.float64)
+
+    def bind(self, chapter: CompiledChapter) -> None:
+        # a preferência só depende da cena: pré-computa uma vez; no choose só
+        # sobra tirar as desabilitadas (requires) e pegar o argmax
+        score = chapter.effects @ self.weights
+        valid = chapter.valid
+
+        dist = distance_to_ending(chapter)
+        there = np.where(valid, dist[np.maximum(chapter.goto, 0)], -1)
+        forward = valid & (there >= 0) & (there < dist[:, None])
+        leaves = valid & (chapter.goto != np.arange(len(dist))[:, None])
+
+        # rank = nível (aproxima > sai da cena > fica) e, dentro do nível, o score
+        finite = score[valid]
+        low = float(finite.min()) if finite.size else 0.0
+        span = (float(finite.max()) - low if finite.size else 0.0) + 1.0
+        tier = np.where(forward, 2, np.where(leaves, 1, 0))
+        self._rank = np.where(valid, tier * span + (score - low), -np.inf)
+
+    def choose(self, scene: np.ndarray, step: np.ndarray, stats: np.ndarray, enabled: np.ndarray) -> np.ndarray:
+        rank = np.where(enabled, self._rank[scene], -np.inf)
+        return np.where(enabled.any(axis=1), rank.argmax(axis=1), NO_ACTION).astype(np.int32)
+
+
+# ---------- Resultado ----------
+
+@dataclass(frozen=True)
+class BatchResult:
+    scene_ids: Tuple[str, ...]
+    endings: Dict[str, int]
+    unfinished: int
+    steps: np.ndarray  # (N,) passos até o final (ou max_steps)
+    stats: np.ndarray  # (4, N) stats finais
+    histograms: np.ndarray  # (S, 4, bins) contagem de visitas por faixa de stat
+    bin_edges: np.ndarray  # (bins + 1,)
+
+    def histogram(self, scene_id: str, stat: str) -> np.ndarray:
+        return self.histograms[self.scene_ids.index(scene_id), STAT_FIELDS.index(stat)]
+
+
+# ---------- Engine em lote ----------
+
+class BatchEngine:
+    """
+    N sessões avançando juntas.
+    - policies: lista de políticas; assignment[i] diz qual política a sessão i usa
+    - histogramas acumulam stats a cada visita de cena (inclusive a inicial)
+    - held: (2, N) itens e pistas em bits locais (chapter.items / chapter.clues)
+    """
+
+    def __init__(
+        self,
+        *,
+        chapter_id: str,
+        n: int,
+        policies: Sequence[Policy],
+        assignment: Optional[Sequence[int]] = None,
+        stats: Optional[PlayerStats] = None,
+        holdings: Optional[Holdings] = None,
+        bins: int = 20,
+        stat_range: Tuple[int, int] = (0, 100),
+    ) -> None:
+        if not policies:
+            raise ValueError("BatchEngine precisa de pelo menos uma política.")
+
+        self.chapter = compile_chapter(registry.load_chapter(chapter_id))
+        self.n = n
+        self.policies = tuple(policies)
+        for p in self.policies:
+            p.bind(self.chapter)
+
+        if assignment is None:
+            self.assignment = np.arange(n, dtype=np.int32) % len(self.policies)
+        else:
+            self.assignment = np.asarray(assignment, dtype=np.int32)
+            if self.assignment.shape != (n,):
+                raise ValueError("assignment deve ter uma política por sessão.")
+
+        base = stats or PlayerStats()
+        # struct-of-arrays: cada linha é um stat contíguo para as N sessões
+        self.stats = np.empty((len(STAT_FIELDS), n), dtype=np.int32)
+        for row, f in enumerate(STAT_FIELDS):
+            self.stats[row] = getattr(base, f)
+        self.scene = np.full(n, self.chapter.entry, dtype=np.int32)
+        self.step_count = np.zeros(n, dtype=np.int32)
+        held = holdings or Holdings()
+        # itens que o capítulo nem menciona não mudam nada aqui
+        self.held = np.empty((2, n), dtype=np.int64)
+        self.held[0] = self.chapter.items.known(held.items)
+        self.held[1] = self.chapter.clues.known(held.clues)
+
+        self.bins = bins
+        self.bin_edges = np.linspace(stat_range[0], stat_range[1], bins + 1)
+        self._lo, self._hi = stat_range
+        self.histograms = np.zeros((len(self.chapter.scene_ids), len(STAT_FIELDS), bins), dtype=np.int64)
+        self._record(np.arange(n))
+
+    # views nomeadas (sem cópia)
+    @property
+    def sono(self) -> np.ndarray:
+        return self.stats[0]
+
+    @property
+    def energia(self) -> np.ndarray:
+        return self.stats[1]
+
+    @property
+    def foco(self) -> np.ndarray:
+        return self.stats[2]
+
+    @property
+    def estresse(self) -> np.ndarray:
+        return self.stats[3]
+
+    @property
+    def items(self) -> np.ndarray:
+        return self.held[0]
+
+    @property
+    def clues(self) -> np.ndarray:
+        return self.held[1]
+
+    @property
+    def active(self) -> np.ndarray:
+        return ~self.chapter.terminal[self.scene]
+
+    def enabled(self, idx: np.ndarray) -> np.ndarray:
+        """(m, A) ações clicáveis das sessões idx (mesma regra do GameEngine: requires)."""
+        chapter = self.chapter
+        scene = self.scene[idx]
+        enabled = chapter.valid[scene]
+        if not chapter.gated:
+            return enabled
+        cond = chapter.cond[scene]
+        for c in np.unique(cond[cond >= 0]):
+            rows, cols = np.nonzero(cond == c)
+            sessions = idx[rows]
+            ok = chapter.conditions[c](self.stats[:, sessions], self.held[:, sessions])
+            enabled[rows[~ok], cols[~ok]] = False
+        return enabled
+
+    def step(self) -> int:
+        """Avança todas as sessões ativas um passo. Retorna quantas seguem ativas."""
+        idx = np.flatnonzero(self.active)
+        if idx.size == 0:
+            return 0
+
+        enabled = self.enabled(idx)
+        action = np.empty(idx.size, dtype=np.int32)
+        owner = self.assignment[idx]
+        for p_id, policy in enumerate(self.policies):
+            sel = owner == p_id
+            if sel.any():
+                sub = idx[sel]
+                action[sel] = policy.choose(self.scene[sub], self.step_count[sub], self.stats[:, sub], enabled[sel])
+
+        # key inexistente ou ação desabilitada: re-renderiza (não anda)
+        moved = (action != NO_ACTION) & enabled[np.arange(idx.size), np.maximum(action, 0)]
+        src = self.scene[idx[moved]]
+        act = action[moved]
+        targets = idx[moved]
+
+        self.stats[:, targets] += self.chapter.effects[src, act].T
+        if self.chapter.changes_holdings:
+            gain_i, lose_i, gain_c, lose_c = self.chapter.held_delta[src, act].T
+            self.held[0, targets] = (self.held[0, targets] & ~lose_i) | gain_i
+            self.held[1, targets] = (self.held[1, targets] & ~lose_c) | gain_c
+        self.scene[targets] = self.chapter.goto[src, act]
+        self.step_count[idx] += 1
+
+        self._record(idx)
+        return int(self.active.sum())
+
+    def run(self, max_steps: int = 1000) -> BatchResult:
+        for _ in range(max_steps):
+            if self.step() == 0:
+                break
+        return self.result()
+
+    def result(self) -> BatchResult:
+        ended = self.chapter.terminal[self.scene]
+        counts = np.bincount(self.scene[ended], minlength=len(self.chapter.scene_ids))
+        endings = {
+            self.chapter.scene_ids[i]: int(c) for i, c in enumerate(counts) if c and self.chapter.terminal[i]
+        }
+        return BatchResult(
+            scene_ids=self.chapter.scene_ids,
+            endings=endings,
+            unfinished=int((~ended).sum()),
+            steps=self.step_count.copy(),
+            stats=self.stats.copy(),
+            histograms=self.histograms.copy(),
+            bin_edges=self.bin_edges,
+        )
+
+    def _record(self, idx: np.ndarray) -> None:
+        """Soma uma visita por sessão no histograma (cena, stat, faixa)."""
+        n_stats = len(STAT_FIELDS)
+        span = max(self._hi - self._lo, 1)
+        values = np.clip(self.stats[:, idx], self._lo, self._hi)
+        bin_idx = np.minimum((values - self._lo) * self.bins // span, self.bins - 1)
+        flat = (self.scene[idx][None, :] * n_stats + np.arange(n_stats)[:, None]) * self.bins + bin_idx
+        # add.at escala com N (sessões), não com S (cenas)
+        np.add.at(self.histograms.reshape(-1), flat.ravel(), 1)
@@ -1,70 +1,201 @@
 from __future__ import annotations
 
-from dataclasses import replace
-from typing import Optional
+import time
+import weakref
+from dataclasses import dataclass, replace
+from typing import Dict, Mapping, Optional, Tuple
 
 from jogo.content import registry
-from jogo.domain.models import Choice, GameState, PlayerStats
+from jogo.runtime import metrics
+from jogo.domain.models import Choice, GameState, Holdings, HoldingsSnapshot, PlayerStats, StatsSnapshot
+
+
+@dataclass(frozen=True)
+class _SceneTable:
+    """Tabela pré-computada da cena: key -> ação e as Choices (imutáveis)."""
+    actions: Mapping[str, registry.ActionData]
+    choices: Tuple[Choice, ...]
+    # hints com {stats} ou ações com requires: as Choices são refeitas por
+    # estado (só nessas cenas; as demais reaproveitam a tupla)
+    dynamic: bool = False
+    # mesma Choice com enabled=False (pronta: requires falso não aloca nada)
+    disabled: Tuple[Choice, ...] = ()
+
+
+_NO_EFFECTS = registry.EffectsData()
+
+# Uma tabela por cena, por versão do capítulo (ChapterData).
+# WeakKey: quando o registry recarrega o capítulo, as tabelas antigas somem junto.
+_tables: "weakref.WeakKeyDictionary[registry.ChapterData, Dict[str, _SceneTable]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _scene_table(chapter: registry.ChapterData, scene: registry.SceneData) -> _SceneTable:
+    per_chapter = _tables.get(chapter)
+    if per_chapter is None:
+        per_chapter = _tables.setdefault(chapter, {})
+
+    table = per_chapter.get(scene.id)
+    if table is None:
+        choices = tuple(
+            Choice(
+                key=a.key,
+                label=a.label,
+                goto=a.goto,
+                hint=a.hint,
+                enabled=True,
+            )
+            for a in scene.actions
+        )
+        dynamic = any(a.hint_template is not None or a.requires is not None for a in scene.actions)
+        table = _SceneTable(
+            actions=scene.actions_by_key,
+            choices=choices,
+            dynamic=dynamic,
+            disabled=tuple(replace(c, enabled=False) for c in choices) if dynamic else (),
+        )
+        per_chapter[scene.id] = table
+    return table
+
+
+def _live_choice(
+    c: Choice, d: Choice, a: registry.ActionData, stats: StatsSnapshot, held: HoldingsSnapshot
+) -> Choice:
+    if a.hint_template is None:
+        return c if a.requires(stats, held) else d  # type: ignore[misc]
+    enabled = True if a.requires is None else a.requires(stats, held)
+    return replace(c, hint=a.hint_template.render(stats), enabled=enabled)
 
 
 class GameEngine:
     """
     Engine mínima:
     - Carrega cenas via registry (manifest.json)
-    - Mantém stats em memória
-    - Escolhas aplicam efeitos e mudam a cena
+    - Mantém stats, itens e pistas em memória
+    - Escolhas aplicam efeitos, dão/tiram itens e pistas e mudam a cena
     """
 
-    def __init__(self, *, chapter_id: str, stats: Optional[PlayerStats] = None):
+    def __init__(
+        self,
+        *,
+        chapter_id: str,
+        stats: Optional[PlayerStats] = None,
+        holdings: Optional[Holdings] = None,
+        scene_id: Optional[str] = None,
+    ):
         self.chapter_id = chapter_id
         self.stats = stats or PlayerStats()
-        self.scene_id = registry.get_entry_scene_id(chapter_id)
+        self.holdings = holdings or Holdings()
+        self._snapshot: Optional[StatsSnapshot] = None
+        self._held: Optional[HoldingsSnapshot] = None
+        # revalida o cache no início da sessão (edições no capítulo aparecem);
+        # daqui pra frente get_scene() é só lookup em memória
+        chapter = registry.load_chapter(chapter_id)
+
+        # scene_id explícito = retomar um save
+        if scene_id is not None and scene_id not in chapter.scenes:
+            raise registry.SceneNotFoundError(
+                f"Cena '{scene_id}' não existe no capítulo '{chapter_id}'."
+            )
+        self.scene_id = scene_id or registry.get_entry_scene_id(chapter_id)
 
     def start(self) -> GameState:
+        if metrics.ENABLED:
+            metrics.visit(self.chapter_id, self.scene_id)
         return self._build_state(self.scene_id)
 
     def choose(self, action_key: str) -> GameState:
-        scene = registry.get_scene(self.chapter_id, self.scene_id)
+        t0 = time.perf_counter() if metrics.ENABLED else 0.0
+        chapter = registry.get_chapter(self.chapter_id)
+        table = _scene_table(chapter, chapter.scenes[self.scene_id])
 
-        action = next((a for a in scene.actions if a.key == action_key), None)
+        action = table.actions.get(action_key)
         if action is None:
             # não explode: só re-renderiza a mesma cena
+            if t0:
+                metrics.incr("engine.choose.unknown_key")
+            return self._build_state(self.scene_id)
+        if action.requires is not None and not action.requires(self.stats, self.holdings):
+            # ação desabilitada (UI já mostra apagada): mesma regra da key desconhecida
+            if t0:
+                metrics.incr("engine.choose.disabled")
             return self._build_state(self.scene_id)
+        if chapter.graph is None and action.goto not in chapter.scenes:
+            # modo streaming: gotos não foram validados no load; nada muda
+            raise registry.SceneNotFoundError(
+                f"Cena '{action.goto}' não existe no capítulo '{self.chapter_id}' (goto da ação '{action_key}')."
+            )
 
         # aplica efeitos
-        self.stats.apply(
-            sono=action.effects.sono,
-            energia=action.effects.energia,
-            foco=action.effects.foco,
-            estresse=action.effects.estresse,
-        )
+        fx = action.effects
+        if fx != _NO_EFFECTS:
+            self.stats.apply(sono=fx.sono, energia=fx.energia, foco=fx.foco, estresse=fx.estresse)
+            self._snapshot = None
+        if action.gain_items | action.lose_items | action.gain_clues | action.lose_clues:
+            self.holdings.apply(
+                gain_items=action.gain_items,
+                lose_items=action.lose_items,
+                gain_clues=action.gain_clues,
+                lose_clues=action.lose_clues,
+            )
+            self._held = None
 
         # navega para próxima cena
         self.scene_id = action.goto
-        return self._build_state(self.scene_id)
+        state = self._build_state(self.scene_id)
+        if t0:
+            metrics.observe("engine.choose", time.perf_counter() - t0)
+            metrics.visit(self.chapter_id, self.scene_id)
+        return state
+
+    def target_of(self, action_key: str) -> Optional[str]:
+        """Cena para onde a ação levaria (nada é aplicado); None = key desconhecida."""
+        chapter = registry.get_chapter(self.chapter_id)
+        action = _scene_table(chapter, chapter.scenes[self.scene_id]).actions.get(action_key)
+        return action.goto if action is not None else None
 
     def _build_state(self, scene_id: str) -> GameState:
         scene = registry.get_scene(self.chapter_id, scene_id)
+        table = _scene_table(registry.get_chapter(self.chapter_id), scene)
+        stats = self.snapshot()
+        held = self.held()
 
-        choices = [
-            Choice(
-                key=a.key,
-                label=a.label,
-                goto=a.goto,
-                hint=a.hint,
-                enabled=True,
+        # templates e condições já compilados no load: aqui é só chamar
+        choices = table.choices
+        if table.dynamic:
+            choices = tuple(
+                c if a.hint_template is None and a.requires is None else _live_choice(c, d, a, stats, held)
+                for c, d, a in zip(choices, table.disabled, scene.actions)
             )
-            for a in scene.actions
-        ]
 
-        # snapshot para evitar UI mutar engine
-        stats_snapshot = replace(self.stats)
+        text, template = scene.text, scene.template
+        for v in scene.variants:
+            if v.when(stats, held):
+                text, template = v.text, v.template
+                break
 
         return GameState(
             chapter_id=self.chapter_id,
             scene_id=scene.id,
-            text=scene.text,
+            text=text if template is None else template.render(stats),
             image_path=scene.image,
             choices=choices,
-            stats=stats_snapshot,
+            stats=stats,
+            holdings=held,
         )
+
+    def snapshot(self) -> StatsSnapshot:
+        """
+        Foto imutável dos stats (UI não consegue mutar a engine).
+        Compartilhada entre estados até a próxima ação com efeito.
+        """
+        if self._snapshot is None:
+            self._snapshot = self.stats.snapshot()
+        return self._snapshot
+
+    def held(self) -> HoldingsSnapshot:
+        """Foto dos itens/pistas (dois ints), refeita só quando mudam."""
+        if self._held is None:
+            self._held = self.holdings.snapshot()
+        return self._held
@@ -0,0 +1,438 @@
+"""
+Explorador do espaço de estados de um capítulo.
+
+Estado = (cena, PlayerStats, itens/pistas). Transição = GameEngine.choose():
+ação com requires falso não existe para o jogador; as demais somam os
+effects (sem clamp, como a engine), aplicam consumes/grants e vão para o goto.
+
+Loops (ex.: scn_01_loop_delegacia) mudam stats e voltam para a mesma cena,
+então o espaço não tem fim: a busca para em max_depth / max_states (com
+default) e o resultado diz se e onde foi truncada.
+
+Estados viram um int empacotado (itens/pistas em bits do capítulo, cena e
+stats em campos fixos), então a transição comum é uma soma: filho = pai +
+delta pré-calculado da ação. Só cenas com requires ou grants/consumes
+desempacotam o pai.
+
+BFS por nível, particionada: cada estado tem um dono (hash % partições).
+Com workers > 1 cada partição vive num processo e guarda os próprios
+estados vistos, pais, faixas e finais; a cada nível ela expande a sua
+fronteira e manda cada filho direto para a partição dona, que deduplica.
+O processo principal só coordena os níveis.
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from jogo.content import registry
+from jogo.content.conditions import Condition, compile_local
+from jogo.content.items import CLUES, ITEMS, LocalBits
+from jogo.domain.models import Holdings, HoldingsSnapshot, PlayerStats, StatsSnapshot
+
+STAT_FIELDS: Tuple[str, ...] = ("sono", "energia", "foco", "estresse")
+
+DEFAULT_MAX_DEPTH = 24
+DEFAULT_MAX_STATES = 2_000_000
+
+# campos de 32 bits por stat, com viés: |stat| < 2^31 (nenhuma busca chega perto)
+_FIELD = 32
+_BIAS = 1 << (_FIELD - 1)
+_MASK = (1 << _FIELD) - 1
+_SCENE_SHIFT = _FIELD * len(STAT_FIELDS)
+
+# (ganha item, perde item, ganha pista, perde pista) em bits do capítulo
+_Change = Tuple[int, int, int, int]
+
+
+@dataclass(frozen=True)
+class ExploreResult:
+    chapter_id: str
+    states: int
+    depth: int
+    truncated: bool  # parou por max_depth/max_states antes de esgotar
+    endings: Dict[str, Tuple[str, ...]]  # final -> keys do caminho mais curto
+    ranges: Dict[str, Dict[str, Tuple[int, int]]]  # cena -> stat -> (min, max)
+    limit: str = ""  # "max_depth" / "max_states" quando truncated
+
+
+# ---------- Capítulo compilado ----------
+
+@dataclass(frozen=True)
+class Tables:
+    """
+    Capítulo reduzido ao que a busca usa (só tuplas/dicts: vai por pickle para os workers).
+    Por cena, por ação: key, delta do estado empacotado, requires (fonte) e mudança de itens/pistas.
+    """
+    scene_ids: Tuple[str, ...]
+    keys: Tuple[Tuple[str, ...], ...]
+    deltas: Tuple[Tuple[int, ...], ...]
+    requires: Tuple[Tuple[Optional[str], ...], ...]
+    changes: Tuple[Tuple[Optional[_Change], ...], ...]
+    item_bits: Dict[str, int]
+    clue_bits: Dict[str, int]
+    scene_bits: int
+
+    @property
+    def held_shift(self) -> int:
+        return _SCENE_SHIFT + self.scene_bits
+
+    def pack(self, scene: int, stats: Tuple[int, ...], items: int = 0, clues: int = 0) -> int:
+        key = (items << len(self.clue_bits)) | clues
+        key = (key << self.scene_bits) | scene
+        for v in stats:
+            key = (key << _FIELD) | (v + _BIAS)
+        return key
+
+    def scene_of(self, key: int) -> int:
+        return (key >> _SCENE_SHIFT) & ((1 << self.scene_bits) - 1)
+
+
+def unpack_stats(key: int) -> Tuple[int, int, int, int]:
+    return (
+        ((key >> 3 * _FIELD) & _MASK) - _BIAS,
+        ((key >> 2 * _FIELD) & _MASK) - _BIAS,
+        ((key >> _FIELD) & _MASK) - _BIAS,
+        (key & _MASK) - _BIAS,
+    )
+
+
+def compile_tables(chapter: registry.ChapterData) -> Tables:
+    scene_ids = tuple(chapter.scenes)
+    index = {sid: i for i, sid in enumerate(scene_ids)}
+    scene_bits = max(1, (len(scene_ids) - 1).bit_length())
+    items, clues = LocalBits(ITEMS), LocalBits(CLUES)
+
+    requires: List[Tuple[Optional[str], ...]] = []
+    changes: List[Tuple[Optional[_Change], ...]] = []
+    for sid in scene_ids:
+        actions = chapter.scenes[sid].actions
+        for a in actions:
+            if a.requires is not None:
+                compile_local(a.requires.source, items.bit, clues.bit)  # numera os ids citados
+        requires.append(tuple(None if a.requires is None else a.requires.source for a in actions))
+        changes.append(
+            tuple(
+                (items.remap(a.gain_items), items.remap(a.lose_items), clues.remap(a.gain_clues), clues.remap(a.lose_clues))
+                if a.gain_items | a.lose_items | a.gain_clues | a.lose_clues
+                else None
+                for a in actions
+            )
+        )
+
+    # layout fechado (número de bits de itens/pistas conhecido): agora os deltas
+    layout = Tables(scene_ids, (), (), (), (), dict(items.bits), dict(clues.bits), scene_bits)
+    zero = (0, 0, 0, 0)
+    deltas = tuple(
+        tuple(
+            layout.pack(index[a.goto], (a.effects.sono, a.effects.energia, a.effects.foco, a.effects.estresse))
+            - layout.pack(i, zero)
+            for a in chapter.scenes[sid].actions
+        )
+        for i, sid in enumerate(scene_ids)
+    )
+    return Tables(
+        scene_ids=scene_ids,
+        keys=tuple(tuple(a.key for a in chapter.scenes[sid].actions) for sid in scene_ids),
+        deltas=deltas,
+        requires=tuple(requires),
+        changes=tuple(changes),
+        item_bits=layout.item_bits,
+        clue_bits=layout.clue_bits,
+        scene_bits=scene_bits,
+    )
+
+
+# ---------- Partição ----------
+
+class _Partition:
+    """
+    Estados cujo dono é esta partição (hash % parts == part).
+    parents: estado -> pai * width + índice da ação (-1 = início)
+    """
+
+    def __init__(self, part: int, parts: int, tables: Tables) -> None:
+        self.part = part
+        self.parts = parts
+        self.tables = tables
+        self.deltas = tables.deltas
+        self.width = max((len(d) for d in tables.deltas), default=0) + 1
+        # cenas com requires/grants/consumes: (delta, condição, mudança) por ação
+        item_bit, clue_bit = tables.item_bits.__getitem__, tables.clue_bits.__getitem__
+        conds: Dict[str, Condition] = {}
+        self.special: Dict[int, Tuple[Tuple[int, Optional[Condition], Optional[_Change]], ...]] = {}
+        for scene, (deltas, reqs, chs) in enumerate(zip(tables.deltas, tables.requires, tables.changes)):
+            if any(r is not None for r in reqs) or any(c is not None for c in chs):
+                for r in reqs:
+                    if r is not None and r not in conds:
+                        conds[r] = compile_local(r, item_bit, clue_bit)
+                self.special[scene] = tuple(
+                    (d, None if r is None else conds[r], c) for d, r, c in zip(deltas, reqs, chs)
+                )
+        self.parents: Dict[int, int] = {}
+        self.frontier: List[int] = []
+        self.ranges: Dict[int, Tuple[List[int], List[int]]] = {}
+        self.endings: Dict[int, Tuple[int, int]] = {}  # cena final -> (profundidade, estado)
+        self.depth = 0
+
+    def seed(self, state: int) -> None:
+        self.parents[state] = -1
+        self.frontier = [state]
+        self._visit(state)
+
+    def expand(self) -> List[List[int]]:
+        """Filhos da fronteira, por partição dona: [filho, pai * width + ação, ...]."""
+        parts, width, deltas, special = self.parts, self.width, self.deltas, self.special
+        scene_of = self.tables.scene_of
+        out: List[List[int]] = [[] for _ in range(parts)]
+        for parent in self.frontier:
+            link = parent * width
+            scene = scene_of(parent)
+            if scene in special:
+                children = self._special_children(parent, special[scene])
+            else:
+                children = [(i, parent + delta) for i, delta in enumerate(deltas[scene])]
+            for i, child in children:
+                bucket = out[hash(child) % parts]
+                bucket.append(child)
+                bucket.append(link + i)
+        self.frontier = []
+        return out
+
+    def _special_children(
+        self, parent: int, actions: Tuple[Tuple[int, Optional[Condition], Optional[_Change]], ...]
+    ) -> List[Tuple[int, int]]:
+        shift = self.tables.held_shift
+        n_clues = len(self.tables.clue_bits)
+        held = parent >> shift
+        items, clues = held >> n_clues, held & ((1 << n_clues) - 1)
+        stats = StatsSnapshot(*unpack_stats(parent))
+        snap = HoldingsSnapshot(items, clues)
+
+        out = []
+        for i, (delta, cond, change) in enumerate(actions):
+            if cond is not None and not cond(stats, snap):
+                continue
+            child = parent + delta
+            if change is not None:
+                gain_i, lose_i, gain_c, lose_c = change
+                new = (((items & ~lose_i) | gain_i) << n_clues) | ((clues & ~lose_c) | gain_c)
+                child += (new - held) << shift
+            out.append((i, child))
+        return out
+
+    def insert(self, batch: List[int]) -> None:
+        parents, frontier = self.parents, self.frontier
+        for j in range(0, len(batch), 2):
+            child = batch[j]
+            if child not in parents:
+                parents[child] = batch[j + 1]
+                frontier.append(child)
+                self._visit(child)
+
+    def end_level(self) -> int:
+        """Fecha o nível: novos estados desta partição (ordem estável entre execuções)."""
+        self.frontier.sort()
+        self.depth += 1
+        return len(self.frontier)
+
+    def parent_of(self, state: int) -> Tuple[int, int]:
+        link = self.parents[state]
+        return (-1, -1) if link < 0 else divmod(link, self.width)
+
+    def report(self) -> Tuple[int, Dict[int, Tuple[int, int]], Dict[int, Tuple[List[int], List[int]]]]:
+        return len(self.parents), self.endings, self.ranges
+
+    def _visit(self, state: int) -> None:
+        scene, values = self.tables.scene_of(state), unpack_stats(state)
+        r = self.ranges.get(scene)
+        if r is None:
+            self.ranges[scene] = (list(values), list(values))
+        else:
+            lo_, hi_ = r
+            for i, v in enumerate(values):
+                if v < lo_[i]:
+                    lo_[i] = v
+                elif v > hi_[i]:
+                    hi_[i] = v
+        if not self.deltas[scene]:
+            found = (self.depth + 1 if self.parents[state] >= 0 else 0, state)
+            if scene not in self.endings or found < self.endings[scene]:
+                self.endings[scene] = found
+
+
+# ---------- Worker (uma partição por processo) ----------
+
+def _worker(part: int, parts: int, tables: Tables, start: int, commands, inboxes, results) -> None:
+    p = _Partition(part, parts, tables)
+    if hash(start) % parts == part:
+        p.seed(start)
+    while True:
+        cmd, arg = commands.get()
+        if cmd == "step":
+            buckets = p.expand()
+            for q, bucket in enumerate(buckets):
+                if q != part:
+                    inboxes[q].put(bucket)
+            p.insert(buckets[part])
+            for _ in range(parts - 1):
+                p.insert(inboxes[part].get())
+            results.put(p.end_level())
+        elif cmd == "parent":
+            results.put(p.parent_of(arg))
+        elif cmd == "report":
+            results.put(p.report())
+        else:
+            return
+
+
+class _Local:
+    """Uma partição só, no processo atual (workers 0/1)."""
+
+    def __init__(self, tables: Tables, start: int) -> None:
+        self.p = _Partition(0, 1, tables)
+        self.p.seed(start)
+
+    def step(self) -> int:
+        self.p.insert(self.p.expand()[0])
+        return self.p.end_level()
+
+    def parent_of(self, state: int) -> Tuple[int, int]:
+        return self.p.parent_of(state)
+
+    def reports(self) -> list:
+        return [self.p.report()]
+
+    def close(self) -> None:
+        pass
+
+
+class _Pool:
+    def __init__(self, parts: int, tables: Tables, start: int) -> None:
+        ctx = mp.get_context()
+        self.parts = parts
+        self.commands = [ctx.Queue() for _ in range(parts)]
+        inboxes = [ctx.Queue() for _ in range(parts)]
+        self.results = [ctx.Queue() for _ in range(parts)]
+        self.procs = [
+            ctx.Process(
+                target=_worker,
+                args=(i, parts, tables, start, self.commands[i], inboxes, self.results[i]),
+                daemon=True,
+            )
+            for i in range(parts)
+        ]
+        for proc in self.procs:
+            proc.start()
+
+    def _all(self, cmd: str) -> list:
+        for q in self.commands:
+            q.put((cmd, None))
+        return [r.get() for r in self.results]
+
+    def step(self) -> int:
+        return sum(self._all("step"))
+
+    def parent_of(self, state: int) -> Tuple[int, int]:
+        owner = hash(state) % self.parts
+        self.commands[owner].put(("parent", state))
+        return self.results[owner].get()
+
+    def reports(self) -> list:
+        return self._all("report")
+
+    def close(self) -> None:
+        for q in self.commands:
+            q.put(("stop", None))
+        for proc in self.procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+
+
+# ---------- API ----------
+
+def explore(
+    chapter_id: str,
+    *,
+    stats: Optional[PlayerStats] = None,
+    holdings: Optional[Holdings] = None,
+    max_depth: Optional[int] = DEFAULT_MAX_DEPTH,
+    max_states: Optional[int] = DEFAULT_MAX_STATES,
+    workers: Optional[int] = None,
+) -> ExploreResult:
+    """
+    BFS a partir da entry_scene.
+    - max_depth / max_states: None = sem teto (só termina se o espaço for finito);
+      o teto de estados é conferido no fim de cada nível
+    - workers: partições em processos (None = os.cpu_count(); 0/1 = tudo no processo atual)
+    """
+    chapter = registry.load_chapter(chapter_id)
+    tables = compile_tables(chapter)
+    scene_ids = tables.scene_ids
+
+    base = stats or PlayerStats()
+    held = holdings or Holdings()
+    # itens que o capítulo nem menciona não mudam nada aqui
+    items = sum(1 << b for name, b in tables.item_bits.items() if held.items >> ITEMS.bit(name) & 1)
+    clues = sum(1 << b for name, b in tables.clue_bits.items() if held.clues >> CLUES.bit(name) & 1)
+    start = tables.pack(
+        scene_ids.index(chapter.entry_scene), tuple(getattr(base, f) for f in STAT_FIELDS), items, clues
+    )
+
+    n_workers = workers if workers is not None else (os.cpu_count() or 1)
+    search = _Pool(n_workers, tables, start) if n_workers > 1 else _Local(tables, start)
+
+    try:
+        depth, states, added, limit = 0, 1, 1, ""
+        while added:
+            if max_depth is not None and depth >= max_depth:
+                limit = "max_depth"
+                break
+            if max_states is not None and states >= max_states:
+                limit = "max_states"
+                break
+            added = search.step()
+            states += added
+            depth += 1 if added else 0
+
+        endings: Dict[int, Tuple[int, int]] = {}
+        ranges: Dict[int, Tuple[List[int], List[int]]] = {}
+        for _, part_endings, part_ranges in search.reports():
+            for scene, found in part_endings.items():
+                if scene not in endings or found < endings[scene]:
+                    endings[scene] = found
+            for scene, (lo_, hi_) in part_ranges.items():
+                r = ranges.get(scene)
+                if r is None:
+                    ranges[scene] = (list(lo_), list(hi_))
+                else:
+                    ranges[scene] = ([min(a, b) for a, b in zip(r[0], lo_)], [max(a, b) for a, b in zip(r[1], hi_)])
+
+        def _path(state: int) -> Tuple[str, ...]:
+            keys: List[str] = []
+            while True:
+                parent, action = search.parent_of(state)
+                if parent < 0:
+                    return tuple(reversed(keys))
+                keys.append(tables.keys[tables.scene_of(parent)][action])
+                state = parent
+
+        paths = {scene_ids[scene]: _path(state) for scene, (_, state) in sorted(endings.items())}
+    finally:
+        search.close()
+
+    return ExploreResult(
+        chapter_id=chapter_id,
+        states=states,
+        depth=depth,
+        truncated=bool(limit),
+        endings=paths,
+        ranges={
+            scene_ids[scene]: {f: (lo_[i], hi_[i]) for i, f in enumerate(STAT_FIELDS)}
+            for scene, (lo_, hi_) in sorted(ranges.items())
+        },
+        limit=limit,
+    )
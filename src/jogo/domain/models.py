@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass
+from typing import NamedTuple, Tuple
 
 
-@dataclass
+class StatsSnapshot(NamedTuple):
+    """
+    Foto imutável dos stats (tupla: sem __dict__, barata de compartilhar).
+    É o que vai no GameState; a engine reaproveita a mesma foto até os stats mudarem.
+    """
+    sono: int = 65
+    energia: int = 55
+    foco: int = 70
+    estresse: int = 30
+
+
+@dataclass(slots=True)
 class PlayerStats:
     sono: int = 65
     energia: int = 55
@@ -17,8 +28,30 @@ class PlayerStats:
         self.foco += foco
         self.estresse += estresse
 
+    def snapshot(self) -> StatsSnapshot:
+        return StatsSnapshot(self.sono, self.energia, self.foco, self.estresse)
+
+
+class HoldingsSnapshot(NamedTuple):
+    """Itens e pistas como bitsets (bits de jogo.content.items): foto = dois ints."""
+    items: int = 0
+    clues: int = 0
+
+
+@dataclass(slots=True)
+class Holdings:
+    items: int = 0
+    clues: int = 0
+
+    def apply(self, *, gain_items: int = 0, lose_items: int = 0, gain_clues: int = 0, lose_clues: int = 0) -> None:
+        self.items = (self.items & ~lose_items) | gain_items
+        self.clues = (self.clues & ~lose_clues) | gain_clues
+
+    def snapshot(self) -> HoldingsSnapshot:
+        return HoldingsSnapshot(self.items, self.clues)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Choice:
     key: str
     label: str
@@ -27,11 +60,12 @@ class Choice:
     enabled: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameState:
     chapter_id: str
     scene_id: str
     text: str
     image_path: str
-    choices: List[Choice] = field(default_factory=list)
-    stats: PlayerStats = field(default_factory=PlayerStats)
+    choices: Tuple[Choice, ...] = ()  # tupla compartilhada por cena (engine)
+    stats: StatsSnapshot = StatsSnapshot()
+    holdings: HoldingsSnapshot = HoldingsSnapshot()
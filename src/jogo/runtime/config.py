@@ -1,13 +1,57 @@
 from dataclasses import dataclass
+from typing import Tuple
 
 
 @dataclass(frozen=True)
 class AppConfig:
     # base
-    fps: int = 30
+    fps: int = 30  # frames/s do ticker de animações da UI
+
+    # duração da revelação das dicas (typewriter), qualquer que seja o tamanho
+    hint_reveal_seconds: float = 0.6
 
     # visual ASCII (desktop-first)
     ascii_font_size: int = 18
 
     # conteúdo
     default_chapter: str = "chapter_01"
+
+    # cache de textos (text_file) por processo, em bytes
+    text_cache_bytes: int = 8 * 1024 * 1024
+
+    # manifest.json a partir deste tamanho: varredura com índice de offsets
+    # (manifest.index.json) e cenas decodificadas sob demanda
+    streaming_manifest_bytes: int = 4 * 1024 * 1024
+
+    # catálogo: pool que valida/aquece capítulos; warm_all_chapters = todos no startup
+    catalog_workers: int = 4
+    warm_all_chapters: bool = False
+    # carrega o próximo capítulo (meta.next) em background durante o atual
+    preload_next_chapter: bool = True
+
+    # AsyncGameEngine: threads para o I/O do registry fora do event loop
+    engine_io_workers: int = 4
+
+    # prefetch das cenas vizinhas (pool compartilhado + fila por sessão)
+    prefetch_workers: int = 2
+    prefetch_max_pending: int = 8
+
+    # imagens de cena: variantes pré-escaladas (cache em disco; "" = ~/.cache/detetive_john/images)
+    asset_cache_dir: str = ""
+    image_variant_widths: Tuple[int, ...] = (480, 960, 1600)
+    scene_panel_width: int = 640
+
+    # autosave: journal de ações (jogo.runtime.saves), retomado ao abrir o jogo;
+    # "" = ~/.local/share/detetive_john/save. O modo web não grava (sessões
+    # simultâneas dividiriam o mesmo save).
+    autosave: bool = True
+    save_dir: str = ""
+
+    # instrumentação (jogo.runtime.metrics); também liga com JOGO_METRICS=1
+    metrics_enabled: bool = False
+    # dump ao fim de cada sessão (.prom = Prometheus, senão JSON); "" = não grava
+    metrics_export_path: str = ""
+
+    # modo web (jogo-web)
+    web_host: str = "127.0.0.1"
+    web_port: int = 8550
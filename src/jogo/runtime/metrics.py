@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+# Instrumentação dos caminhos quentes (registry, engine, layout).
+#
+# Desligada por padrão. Os pontos de medição fazem só `if metrics.ENABLED:`
+# (uma leitura de atributo) quando desligada; relógio, locks e dicts só
+# entram em jogo quando ligada (AppConfig.metrics_enabled ou JOGO_METRICS=1).
+
+ENABLED = os.environ.get("JOGO_METRICS", "") not in ("", "0")
+
+# limites (s) dos buckets de latência exportados para o Prometheus
+BUCKETS: Tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+
+
+@dataclass
+class Timer:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(BUCKETS) + 1))
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+_lock = threading.Lock()
+_counters: Dict[str, int] = {}
+_timers: Dict[str, Timer] = {}
+_visits: Dict[Tuple[str, str], int] = {}
+_gauges: Dict[str, Callable[[], float]] = {}
+
+
+def enable(on: bool = True) -> None:
+    global ENABLED
+    ENABLED = on
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+        _visits.clear()
+
+
+# ---------- Coleta ----------
+
+def incr(name: str, n: int = 1) -> None:
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def observe(name: str, seconds: float) -> None:
+    with _lock:
+        t = _timers.get(name)
+        if t is None:
+            t = _timers[name] = Timer()
+        t.count += 1
+        t.total += seconds
+        if seconds > t.max:
+            t.max = seconds
+        t.buckets[bisect_left(BUCKETS, seconds)] += 1
+
+
+def visit(chapter_id: str, scene_id: str) -> None:
+    key = (chapter_id, scene_id)
+    with _lock:
+        _visits[key] = _visits.get(key, 0) + 1
+
+
+def register_gauge(name: str, read: Callable[[], float]) -> None:
+    """Valor lido só na exportação (ex.: taxa de acerto de um cache)."""
+    _gauges[name] = read
+
+
+# ---------- Exportação ----------
+
+def snapshot() -> Dict[str, Any]:
+    with _lock:
+        timers = {
+            name: {
+                "count": t.count,
+                "mean_ms": round(t.mean * 1000, 4),
+                "max_ms": round(t.max * 1000, 4),
+                "total_ms": round(t.total * 1000, 3),
+            }
+            for name, t in _timers.items()
+        }
+        counters = dict(_counters)
+        visits = {f"{c}/{s}": n for (c, s), n in _visits.items()}
+    gauges = {}
+    for name, read in _gauges.items():
+        try:
+            gauges[name] = round(float(read()), 4)
+        except Exception:
+            continue
+    return {"enabled": ENABLED, "timers": timers, "counters": counters, "gauges": gauges, "visits": visits}
+
+
+def to_json() -> str:
+    return json.dumps(snapshot(), ensure_ascii=False, indent=2)
+
+
+def _prom_name(name: str) -> str:
+    return "jogo_" + "".join(ch if ch.isalnum() else "_" for ch in name)
+
+
+def _prom_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def to_prometheus() -> str:
+    """Formato texto de exposição do Prometheus (0.0.4)."""
+    lines: List[str] = []
+    with _lock:
+        for name, value in sorted(_counters.items()):
+            metric = _prom_name(name) + "_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+
+        for name, t in sorted(_timers.items()):
+            metric = _prom_name(name) + "_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for le, n in zip(BUCKETS, t.buckets):
+                cumulative += n
+                lines.append(f'{metric}_bucket{{le="{le}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{le="+Inf"}} {t.count}')
+            lines.append(f"{metric}_sum {t.total}")
+            lines.append(f"{metric}_count {t.count}")
+
+        if _visits:
+            lines.append("# TYPE jogo_scene_visits_total counter")
+            for (chapter, scene), n in sorted(_visits.items()):
+                lines.append(
+                    f'jogo_scene_visits_total{{chapter="{_prom_label(chapter)}",scene="{_prom_label(scene)}"}} {n}'
+                )
+
+    for name, read in sorted(_gauges.items()):
+        try:
+            value = float(read())
+        except Exception:
+            continue
+        metric = _prom_name(name)
+        lines += [f"# TYPE {metric} gauge", f"{metric} {value}"]
+    return "\n".join(lines) + "\n"
+
+
+def write(path: "os.PathLike[str] | str") -> None:
+    """Grava um dump: .prom/.txt = texto do Prometheus; qualquer outro = JSON."""
+    p = os.fspath(path)
+    body = to_prometheus() if p.endswith((".prom", ".txt")) else to_json()
+    tmp = p + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(body)
+    os.replace(tmp, p)
+
+
+def summary(top_scenes: int = 5) -> str:
+    """Texto curto para a view de debug (aba Debug)."""
+    snap = snapshot()
+    lines = []
+    for name, t in sorted(snap["timers"].items()):
+        lines.append(f"{name}: {t['count']}x  média {t['mean_ms']:.3f} ms  máx {t['max_ms']:.3f} ms")
+    for name, value in sorted(snap["gauges"].items()):
+        lines.append(f"{name}: {value:.2%}" if name.endswith("hit_rate") else f"{name}: {value}")
+    visits = sorted(snap["visits"].items(), key=lambda kv: kv[1], reverse=True)[:top_scenes]
+    if visits:
+        lines.append("cenas mais visitadas: " + ", ".join(f"{k.split('/', 1)[1]} ({n})" for k, n in visits))
+    return "\n".join(lines) or "sem dados ainda"
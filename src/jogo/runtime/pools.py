@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LazyPool:
+    """
+    ThreadPoolExecutor compartilhado por processo, criado no primeiro submit.
+    - resize(n) com o pool já criado troca de pool: os próximos jobs vão para
+      um pool novo de n threads; o antigo termina o que já tinha na fila e fecha
+    - mesmo tamanho = nada muda
+    """
+
+    def __init__(self, workers: int, name: str) -> None:
+        self.name = name
+        self._workers = max(1, int(workers))
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def resize(self, n: int) -> None:
+        n = max(1, int(n))
+        with self._lock:
+            if n == self._workers:
+                return
+            self._workers = n
+            old, self._pool = self._pool, None
+        if old is not None:
+            old.shutdown(wait=False)
+
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix=self.name)
+            return self._pool
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        return self.executor().submit(fn, *args)
+
+    def shutdown(self, *, wait: bool = False) -> None:
+        with self._lock:
+            old, self._pool = self._pool, None
+        if old is not None:
+            old.shutdown(wait=wait)
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Dict, List, Mapping, Optional, Tuple
+
+from jogo.content import items
+from jogo.domain import GameEngine, GameState, Holdings, PlayerStats
+
+# Save = pasta com:
+#   snapshot.json      -> {"v", "chapter_id", "scene_id", "stats", "holdings", "gen"}
+#   journal.<gen>.log  -> uma key de ação por linha (JSON string), só append
+#
+# Carregar = ler o snapshot + reaplicar o journal da mesma geração via choose().
+# Compactar = gravar snapshot novo (gen+1, atômico) e começar journal novo;
+# o journal antigo só é apagado depois, então um crash no meio não corrompe nada.
+#
+# holdings = ids de itens/pistas (items.to_save), nunca os bits: a numeração
+# depende da ordem em que os capítulos foram carregados.
+
+SNAPSHOT_FILE = "snapshot.json"
+SAVE_VERSION = 2
+# v1: sem holdings (itens/pistas vazios)
+_READABLE_VERSIONS = (1, SAVE_VERSION)
+
+
+class SaveError(ValueError):
+    pass
+
+
+def default_save_dir() -> Path:
+    base = os.environ.get("XDG_DATA_HOME") or str(Path.home() / ".local" / "share")
+    return Path(base) / "detetive_john" / "save"
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    chapter_id: str
+    scene_id: str
+    stats: Tuple[int, int, int, int]
+    gen: int
+    holdings: Mapping[str, Any]  # {"items": [ids], "clues": [ids]}
+
+
+class SaveJournal:
+    """
+    Journal de ações com snapshots periódicos.
+    - record(): O(1) por clique (append de uma linha)
+    - a cada compact_every ações o journal é compactado num snapshot
+    """
+
+    def __init__(self, directory: Path, *, compact_every: int = 256, durable: bool = False) -> None:
+        self.directory = Path(directory)
+        self.compact_every = max(1, compact_every)
+        self.durable = durable  # fsync a cada append (mais lento, sobrevive a queda de energia)
+        self._gen = 0
+        self._pending = 0
+        self._journal: Optional[IO[str]] = None
+
+    # ---------- API ----------
+
+    def new_game(self, engine: GameEngine) -> None:
+        """Começa um save novo a partir do estado atual da engine."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._close_journal()
+        for old in self.directory.glob("journal.*.log"):
+            old.unlink()
+        self._snapshot_path().unlink(missing_ok=True)
+        self._gen = 0
+        self.compact(engine)
+
+    def record(self, action_key: str, engine: GameEngine) -> None:
+        """Chamar depois de engine.choose(action_key)."""
+        if self._journal is None:
+            self._journal = self._journal_path(self._gen).open("a", encoding="utf-8")
+        self._journal.write(json.dumps(action_key, ensure_ascii=False) + "\n")
+        self._journal.flush()
+        if self.durable:
+            os.fsync(self._journal.fileno())
+
+        self._pending += 1
+        if self._pending >= self.compact_every:
+            self.compact(engine)
+
+    def choose(self, engine: GameEngine, action_key: str) -> GameState:
+        """Atalho: engine.choose() + record()."""
+        state = engine.choose(action_key)
+        self.record(action_key, engine)
+        return state
+
+    def compact(self, engine: GameEngine) -> None:
+        """Snapshot do estado atual; o journal volta a ficar vazio."""
+        old_gen = self._gen
+        new_gen = old_gen + 1 if self._snapshot_path().exists() else old_gen
+
+        self._close_journal()
+        self._write_snapshot(
+            _Snapshot(
+                chapter_id=engine.chapter_id,
+                scene_id=engine.scene_id,
+                stats=tuple(engine.snapshot()),  # type: ignore[arg-type]
+                gen=new_gen,
+                holdings=items.to_save(engine.holdings.items, engine.holdings.clues),
+            )
+        )
+        self._gen = new_gen
+        self._pending = 0
+        self._journal_path(new_gen).open("w", encoding="utf-8").close()
+
+        if new_gen != old_gen:
+            try:
+                self._journal_path(old_gen).unlink()
+            except FileNotFoundError:
+                pass
+
+    def load(self) -> GameEngine:
+        """Snapshot + replay do journal. Continua gravando no mesmo save."""
+        snap = self._read_snapshot()
+        # itens/pistas antes do replay: ações com requires has()/knows() dependem deles
+        held_items, held_clues = items.from_save(snap.holdings)
+        engine = GameEngine(
+            chapter_id=snap.chapter_id,
+            stats=PlayerStats(*snap.stats),
+            holdings=Holdings(items=held_items, clues=held_clues),
+            scene_id=snap.scene_id,
+        )
+
+        keys, clean = self._read_journal(snap.gen)
+        for key in keys:
+            engine.choose(key)
+
+        self._gen = snap.gen
+        self._pending = len(keys)
+        if not clean or self._pending >= self.compact_every:
+            # cauda truncada (crash no meio do append) não pode receber novos appends
+            self.compact(engine)
+        return engine
+
+    def resume(self, chapter_id: str) -> GameEngine:
+        """
+        load() se houver save; save ilegível (corrompido, capítulo/cena que
+        não existe mais) ou ausente = jogo novo em chapter_id, gravado por cima.
+        """
+        if self.exists():
+            try:
+                return self.load()
+            # SaveError/ManifestError (ValueError), ChapterNotFoundError (OSError), SceneNotFoundError (KeyError)
+            except (KeyError, OSError, ValueError):
+                pass
+        engine = GameEngine(chapter_id=chapter_id)
+        self.new_game(engine)
+        return engine
+
+    def exists(self) -> bool:
+        return self._snapshot_path().exists()
+
+    def close(self) -> None:
+        self._close_journal()
+
+    # ---------- Internos ----------
+
+    def _snapshot_path(self) -> Path:
+        return self.directory / SNAPSHOT_FILE
+
+    def _journal_path(self, gen: int) -> Path:
+        return self.directory / f"journal.{gen}.log"
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _write_snapshot(self, snap: _Snapshot) -> None:
+        data = {
+            "v": SAVE_VERSION,
+            "chapter_id": snap.chapter_id,
+            "scene_id": snap.scene_id,
+            "stats": list(snap.stats),
+            "holdings": dict(snap.holdings),
+            "gen": snap.gen,
+        }
+        tmp = self._snapshot_path().with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+            f.flush()
+            if self.durable:
+                os.fsync(f.fileno())
+        os.replace(tmp, self._snapshot_path())
+
+    def _read_snapshot(self) -> _Snapshot:
+        p = self._snapshot_path()
+        try:
+            data = json.loads(p.read_text(encoding="utf-8"))
+        except FileNotFoundError as e:
+            raise SaveError(f"Save não encontrado em {self.directory}") from e
+        except json.JSONDecodeError as e:
+            raise SaveError(f"snapshot inválido em {p}: {e}") from e
+
+        if data.get("v") not in _READABLE_VERSIONS:
+            raise SaveError(f"Versão de save não suportada: {data.get('v')}")
+        try:
+            stats = tuple(int(v) for v in data["stats"])
+            if len(stats) != 4:
+                raise ValueError("stats deve ter 4 valores")
+            holdings: Dict[str, List[str]] = {
+                kind: [str(i) for i in (data.get("holdings") or {}).get(kind) or ()] for kind in ("items", "clues")
+            }
+            return _Snapshot(
+                chapter_id=str(data["chapter_id"]),
+                scene_id=str(data["scene_id"]),
+                stats=stats,  # type: ignore[arg-type]
+                gen=int(data["gen"]),
+                holdings=holdings,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            raise SaveError(f"snapshot inválido em {p}: {e}") from e
+
+    def _read_journal(self, gen: int) -> Tuple[List[str], bool]:
+        """(keys, journal íntegro?)"""
+        try:
+            lines = self._journal_path(gen).read_text(encoding="utf-8").split("\n")
+        except FileNotFoundError:
+            return [], True
+
+        keys: List[str] = []
+        # última linha sem "\n" = escrita interrompida; é descartada
+        for line in lines[:-1]:
+            try:
+                keys.append(json.loads(line))
+            except json.JSONDecodeError:
+                return keys, False
+        return keys, lines[-1] == ""
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Relógio do cold start: zero = import deste módulo (o primeiro do `python -m jogo`).
+T0 = time.perf_counter()
+
+_marks: Dict[str, float] = {}
+_preload: Optional[threading.Thread] = None
+
+
+def mark(phase: str) -> float:
+    """Registra o instante (s desde T0) da primeira vez que a fase acontece."""
+    elapsed = time.perf_counter() - T0
+    _marks.setdefault(phase, elapsed)
+    return elapsed
+
+
+def marks() -> Dict[str, float]:
+    return dict(_marks)
+
+
+# ---------- Pré-carga do conteúdo ----------
+
+def preload_content(chapter_id: str) -> threading.Thread:
+    """
+    Carrega o capítulo e o texto da cena de entrada numa thread,
+    em paralelo com o import do flet (que domina o cold start).
+    Usa a fonte mais rápida disponível: chapter.pack (mmap) se existir, senão o manifest.
+    """
+    global _preload
+
+    def _run() -> None:
+        from jogo.content import registry
+
+        try:
+            registry.load_chapter(chapter_id)
+            registry.get_scene(chapter_id, registry.get_entry_scene_id(chapter_id))
+        except Exception:
+            return  # o caminho normal (GameEngine) repete e mostra o erro
+        mark("content_ready")
+
+    _preload = threading.Thread(target=_run, name="preload-content", daemon=True)
+    _preload.start()
+    return _preload
+
+
+def preload_modules(names: Iterable[str]) -> threading.Thread:
+    """
+    Importa os módulos da sessão (widgets, engine, assets) numa thread
+    enquanto ft.run sobe o cliente; a sessão depois só os pega de sys.modules.
+    """
+    names = tuple(names)
+
+    def _run() -> None:
+        for name in names:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                return  # o import da sessão repete e mostra o erro
+        mark("session_imported")
+
+    thread = threading.Thread(target=_run, name="preload-modules", daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_preload(timeout: Optional[float] = None) -> None:
+    """Primeira sessão espera a pré-carga em vez de ler o capítulo de novo."""
+    if _preload is not None:
+        _preload.join(timeout)
+
+
+# ---------- Relatório (--profile-startup) ----------
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+@dataclass
+class StartupReport:
+    phases: Dict[str, float]
+    # (pacote de topo, ms de import somados) em ordem decrescente
+    imports: List[Tuple[str, float]] = field(default_factory=list)
+    total_import_ms: float = 0.0
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "phases_ms": {k: round(v * 1000, 2) for k, v in self.phases.items()},
+                "imports_ms": dict((k, round(v, 2)) for k, v in self.imports),
+                "total_import_ms": round(self.total_import_ms, 2),
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+
+    def to_text(self) -> str:
+        lines = ["Startup (ms desde o início do processo jogo):"]
+        for phase, t in sorted(self.phases.items(), key=lambda kv: kv[1]):
+            lines.append(f"  {phase:<20} {t * 1000:9.1f}")
+        if self.imports:
+            lines.append(f"Imports ({self.total_import_ms:.1f} ms, por pacote de topo):")
+            for name, ms in self.imports:
+                lines.append(f"  {name:<20} {ms:9.1f}")
+        return "\n".join(lines)
+
+
+def import_breakdown(module: str, *, top: int = 12) -> Tuple[List[Tuple[str, float]], float]:
+    """
+    Tempo de import de `module` num interpretador novo (python -X importtime),
+    agrupado por pacote de topo. Processo separado = números de cold start reais,
+    sem o cache de módulos deste processo.
+    """
+    # garante que o subprocesso ache o mesmo pacote jogo (ex.: rodando de src/)
+    src = str(Path(__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH", "")) if p)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    per_pkg: Dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        m = _IMPORTTIME.match(line)
+        if m is None:
+            continue
+        # soma o tempo próprio (self) de cada módulo no pacote de topo dele
+        name = m.group(3).split(".")[0]
+        per_pkg[name] = per_pkg.get(name, 0.0) + int(m.group(1)) / 1000
+    total = sum(per_pkg.values())
+    ranked = sorted(per_pkg.items(), key=lambda kv: kv[1], reverse=True)[:top]
+    return ranked, total
+
+
+def build_report(*, module: str = "jogo.ui_flet.main", with_imports: bool = True) -> StartupReport:
+    report = StartupReport(phases=marks())
+    if with_imports:
+        report.imports, report.total_import_ms = import_breakdown(module)
+    return report
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import concurrent.futures
+from typing import Any, Awaitable, Callable
+
+
+class HeadlessPage:
+    """
+    Page "de mentira" para rodar a UI sem cliente Flet (load test, benchmarks, profiling).
+    - update(): só conta chamadas e controles enviados
+    - run_task(): não agenda nada; devolve um Future já concluído
+    """
+
+    def __init__(self, *, web: bool = False) -> None:
+        self.updates = 0
+        self.controls_sent = 0
+        self.title = ""
+        self.web = web  # como ft.Page.web (sessão no navegador)
+        self.controls: list = []
+
+    def update(self, *controls: Any) -> None:
+        self.updates += 1
+        self.controls_sent += len(controls) if controls else 1
+
+    def add(self, *controls: Any) -> None:
+        self.controls.extend(controls)
+
+    def run_task(self, handler: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+        fut: concurrent.futures.Future = concurrent.futures.Future()
+        fut.set_result(None)
+        return fut
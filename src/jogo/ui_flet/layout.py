@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
 import flet as ft
 
+from jogo.content import assets
+from jogo.content.items import CLUES, ITEMS
 from jogo.domain import GameState
+from jogo.runtime import metrics
+from jogo.runtime.config import AppConfig
+from jogo.ui_flet.ticker import FrameTicker
 
 from .widgets.status_tabs import StatusTabs
 from .widgets.narrative_panel import NarrativePanel
@@ -10,21 +19,53 @@ from .widgets.scene_panel import ScenePanel
 from .widgets.actions_panel import ActionsPanel
 
 
+@dataclass
+class RenderCounters:
+    renders: int = 0
+    panels_rendered: int = 0
+    updates_sent: int = 0
+    controls_sent: int = 0
+
+
 class AppLayout:
     """
     Composição principal da UI.
     - não conhece engine
     - recebe callbacks e estado
+    - render incremental: compara com o GameState anterior e só mexe
+      nos painéis que mudaram, com um único page.update() por transição
     - expõe dispose() para cleanup (tasks, timers, etc.)
     """
 
-    def __init__(self, page: ft.Page) -> None:
+    def __init__(
+        self,
+        page: ft.Page,
+        *,
+        config: Optional[AppConfig] = None,
+        pipeline: Optional[assets.ImagePipeline] = None,
+    ) -> None:
         self.page = page
+        self.config = config or AppConfig()
+        self.counters = RenderCounters()
+        self._state: Optional[GameState] = None
+
+        # relógio único de animações (typewriter, pulse, efeitos futuros)
+        self.ticker = FrameTicker(page, fps=self.config.fps)
 
         self.status_tabs = StatusTabs()
         self.narrative = NarrativePanel()
-        self.scene = ScenePanel()
-        self.actions = ActionsPanel(page)
+        # padrão: o pipeline do processo (cache em disco do usuário); testes/bench injetam o seu
+        self.assets = pipeline or assets.get_pipeline()
+        self.scene = ScenePanel(
+            assets=self.assets,
+            target_width=self.config.scene_panel_width,
+            inline_images=bool(getattr(page, "web", False)),
+        )
+        self.actions = ActionsPanel(
+            page,
+            ticker=self.ticker,
+            hint_reveal_seconds=self.config.hint_reveal_seconds,
+        )
 
         self._title = ft.Text("Holoway — Capítulo 01", size=16, weight=ft.FontWeight.W_700)
 
@@ -53,10 +94,54 @@ class AppLayout:
         )
 
     def render(self, state: GameState, *, on_choose) -> None:
-        self.status_tabs.render(state)
-        self.narrative.render(state)
-        self.scene.render(state)
-        self.actions.render(state, on_choose=on_choose)
+        t0 = time.perf_counter() if metrics.ENABLED else 0.0
+        prev = self._state
+        self._state = state
+        self.actions.set_on_choose(on_choose)
+
+        dirty: List[ft.Control] = []
+        if prev is None or prev.stats != state.stats:
+            dirty.append(self.status_tabs.render(state))
+        if prev is None or prev.text != state.text:
+            dirty.append(self.narrative.render(state))
+        if prev is None or prev.image_path != state.image_path:
+            dirty.append(self.scene.render(state))
+        if prev is None or (prev.choices is not state.choices and prev.choices != state.choices):
+            dirty.append(self.actions.render(state, on_choose=on_choose))
+        if prev is None or prev.holdings != state.holdings:
+            # mochila só aparece no clique; arquivo só vai se a aba estiver aberta
+            self.actions.set_inventory(ITEMS.labels(state.holdings.items))
+            clues = self.status_tabs.render_clues(CLUES.labels(state.holdings.clues))
+            if clues is not None:
+                dirty.append(clues)
+        if t0:
+            # view de debug (aba Debug) acompanha as métricas
+            debug = self.status_tabs.render_debug()
+            if debug is not None:
+                dirty.append(debug)
+
+        self.counters.renders += 1
+        self.counters.panels_rendered += len(dirty)
+        if dirty:
+            self.page.update(*dirty)
+            self.counters.updates_sent += 1
+            self.counters.controls_sent += len(dirty)
+
+        if prev is None or prev.scene_id != state.scene_id:
+            # enquanto o jogador lê, prepara as imagens das próximas cenas
+            self.assets.prefetch(state.chapter_id, state.scene_id, self.config.scene_panel_width)
+
+        if t0:
+            metrics.observe("ui.render", time.perf_counter() - t0)
+            metrics.incr("ui.panels_rendered", len(dirty))
+
+    @property
+    def controls_created(self) -> int:
+        """Total de controles Flet criados pelos painéis depois da montagem (render, troca de aba)."""
+        return sum(
+            getattr(w, "controls_created", 0)
+            for w in (self.status_tabs, self.narrative, self.scene, self.actions)
+        )
 
     # ----------------------------
     # Lifecycle / cleanup
@@ -66,6 +151,7 @@ class AppLayout:
         Cancela tasks penduradas (typewriter, efeitos, etc).
         Chamado no on_disconnect do main.
         """
+        self.ticker.dispose()
         for w in (self.actions, self.narrative, self.scene, self.status_tabs):
             if hasattr(w, "dispose"):
                 try:
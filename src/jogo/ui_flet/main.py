@@ -1,26 +1,137 @@
 from __future__ import annotations
 
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# só o flet (ft.run) vem antes da janela; o resto é importado numa thread
+# enquanto o cliente do flet sobe (startup.preload_modules)
 import flet as ft
 
+from jogo.runtime import metrics, startup
 from jogo.runtime.config import AppConfig
-from jogo.domain import GameEngine, GameState
-from jogo.ui_flet.layout import AppLayout
+
+if TYPE_CHECKING:
+    from jogo.ui_flet.layout import AppLayout
+
+# módulos que só a sessão usa (widgets, engine, assets/Pillow fica nos workers)
+SESSION_MODULES = (
+    "jogo.content.registry",
+    "jogo.content.assets",
+    "jogo.content.catalog",
+    "jogo.content.prefetch",
+    "jogo.domain",
+    "jogo.runtime.saves",
+    "jogo.ui_flet.layout",
+)
 
 
 def run_app() -> None:
+    startup.preload_modules(SESSION_MODULES)
     ft.run(_main)
 
 
+def warm_content(cfg: AppConfig) -> None:
+    """
+    Prepara o cache do registry (por processo, somente leitura).
+    Em modo servidor roda uma vez; todas as sessões compartilham o capítulo.
+    """
+    from jogo.content import assets, catalog, prefetch, registry
+    from jogo.domain import async_engine
+
+    if cfg.metrics_enabled:
+        metrics.enable()
+    registry.configure_text_cache(cfg.text_cache_bytes)
+    registry.configure_streaming(cfg.streaming_manifest_bytes)
+    prefetch.configure_workers(cfg.prefetch_workers)
+    catalog.configure_workers(cfg.catalog_workers)
+    async_engine.configure_workers(cfg.engine_io_workers)
+    if cfg.warm_all_chapters:
+        # servidor: todos os capítulos validados e em cache antes da primeira sessão
+        catalog.warm_all()
+    registry.load_chapter(cfg.default_chapter)
+    pipeline = assets.configure(
+        Path(cfg.asset_cache_dir) if cfg.asset_cache_dir else None,
+        widths=cfg.image_variant_widths,
+    )
+    # imagem da cena de entrada já começa a ser preparada antes da primeira sessão
+    entry = registry.get_scene(cfg.default_chapter, registry.get_entry_scene_id(cfg.default_chapter))
+    pipeline.warm([entry.image], cfg.scene_panel_width)
+
+
 def _main(page: ft.Page) -> None:
+    cfg = AppConfig()
+    # `python -m jogo` já começou a carregar o capítulo; aqui só espera terminar
+    startup.wait_preload()
+    warm_content(cfg)
+    start_session(page, cfg)
+
+
+def profile_startup(cfg: AppConfig, *, headless: bool = False, as_json: bool = False) -> None:
+    """
+    `python -m jogo --profile-startup`: sobe a UI, mede até o primeiro render,
+    imprime o relatório (fases + imports por pacote) e encerra.
+    headless=True usa HeadlessPage (sem cliente Flet; para CI e benchmarks).
+    """
+    startup.mark("ui_imported")
+    # medir não pode retomar nem gravar por cima do save do jogador
+    cfg = replace(cfg, autosave=False)
+
+    def _report() -> None:
+        # o que o processo importa até o primeiro render, não só até a janela
+        report = startup.build_report(module=", ".join(("jogo.ui_flet.main",) + SESSION_MODULES))
+        print(report.to_json() if as_json else report.to_text(), flush=True)
+
+    if headless:
+        from jogo.ui_flet.headless import HeadlessPage
+
+        startup.wait_preload()
+        warm_content(cfg)
+        layout = start_session(HeadlessPage(), cfg)  # type: ignore[arg-type]
+        layout.dispose()
+        _report()
+        return
+
+    def _profiled(page: ft.Page) -> None:
+        startup.wait_preload()
+        warm_content(cfg)
+        start_session(page, cfg)
+        _report()
+        page.run_task(page.window.close)
+
+    startup.preload_modules(SESSION_MODULES)
+    ft.run(_profiled)
+
+
+def start_session(page: ft.Page, cfg: AppConfig) -> "AppLayout":
+    """
+    Monta uma sessão de jogo na página.
+    Estado por sessão = engine (cena + stats) + controles da UI;
+    o conteúdo vem do cache compartilhado do registry.
+    Com cfg.autosave a sessão retoma o save e grava cada escolha no journal.
+    """
+    # já importados pela thread de preload_modules (aqui só pega de sys.modules)
+    from jogo.content import catalog, prefetch
+    from jogo.domain import AsyncGameEngine, GameEngine, GameState
+    from jogo.runtime.saves import SaveJournal, default_save_dir
+    from jogo.ui_flet.layout import AppLayout
+
     page.title = "Detetive John"
     page.theme_mode = ft.ThemeMode.DARK
     page.padding = 16
     page.spacing = 12
 
-    cfg = AppConfig()
-    engine = GameEngine(chapter_id=cfg.default_chapter)
+    journal = None
+    if cfg.autosave:
+        journal = SaveJournal(Path(cfg.save_dir) if cfg.save_dir else default_save_dir())
+        # save em outro capítulo carrega esse capítulo aqui (antes do primeiro render)
+        engine = AsyncGameEngine(journal.resume(cfg.default_chapter))
+    else:
+        # capítulo já aquecido (warm_content): criar a engine não lê o disco
+        engine = AsyncGameEngine(GameEngine(chapter_id=cfg.default_chapter))
+    prefetcher = prefetch.ScenePrefetcher(max_pending=cfg.prefetch_max_pending)
 
-    layout = AppLayout(page)
+    layout = AppLayout(page, config=cfg)
     page.add(layout.root)
 
     # ----------------------------
@@ -28,11 +139,18 @@ def _main(page: ft.Page) -> None:
     # ----------------------------
     def _on_disconnect(_e) -> None:
         # cancela tasks (typewriter etc.) e libera recursos
+        prefetcher.close()
+        if journal is not None:
+            journal.close()
         try:
-            if hasattr(layout.actions, "dispose"):
-                layout.actions.dispose()
+            layout.dispose()
         except Exception:
             pass
+        if metrics.ENABLED and cfg.metrics_export_path:
+            try:
+                metrics.write(cfg.metrics_export_path)
+            except OSError:
+                pass
 
     # dispara quando a sessão é encerrada (janela fechada / desconectou)
     page.on_disconnect = _on_disconnect
@@ -40,15 +158,30 @@ def _main(page: ft.Page) -> None:
     # ----------------------------
     # Render loop
     # ----------------------------
+    async def choose(choice_key: str) -> None:
+        # I/O da próxima cena fica fora do event loop (typewriter segue animando)
+        state = await engine.choose(choice_key)
+        if journal is not None:
+            # append de uma linha; compacta a cada compact_every escolhas
+            journal.record(choice_key, engine.engine)
+        render(state)
+
     def render(state: GameState) -> None:
         def on_choose(choice_key: str) -> None:
-            new_state = engine.choose(choice_key)
-            render(new_state)
+            page.run_task(choose, choice_key)
 
+        # layout envia um único update só com os painéis que mudaram
         layout.render(state, on_choose=on_choose)
-        page.update()
+        # enquanto o jogador lê, as próximas cenas vão para o cache
+        prefetcher.schedule(state.chapter_id, state.scene_id)
 
-    render(engine.start())
+    # primeiro render síncrono: a cena de entrada já está em memória
+    render(engine.engine.start())
+    startup.mark("first_render")
+    if cfg.preload_next_chapter:
+        # o jogador ainda está no capítulo atual: o próximo carrega em background
+        catalog.preload_next(engine.chapter_id)
+    return layout
 
 
 if __name__ == "__main__":
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+from typing import Optional, Sequence
+
+import flet as ft
+
+from jogo.runtime.config import AppConfig
+from jogo.ui_flet.main import start_session, warm_content
+
+
+def run_server(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Modo web multi-sessão (Flet WEB_BROWSER).
+    - o capítulo é carregado uma única vez, antes de aceitar conexões
+    - cada página/aba ganha só uma GameEngine + seu AppLayout
+    - imagens vão em bytes (page.web): o navegador não lê caminhos do servidor
+    - sem autosave: um save só no servidor seria dividido entre todas as sessões
+    """
+    cfg = replace(AppConfig(), autosave=False)
+
+    parser = argparse.ArgumentParser(prog="jogo-web", description="Detetive John no navegador")
+    parser.add_argument("--host", default=cfg.web_host)
+    parser.add_argument("--port", type=int, default=cfg.web_port)
+    args = parser.parse_args(argv)
+
+    warm_content(cfg)
+
+    def _session(page: ft.Page) -> None:
+        start_session(page, cfg)
+
+    ft.run(_session, host=args.host, port=args.port, view=ft.AppView.WEB_BROWSER)
+
+
+if __name__ == "__main__":
+    run_server()
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+import flet as ft
+
+
+class Animation(ABC):
+    """
+    Animação dirigida pelo FrameTicker.
+    step() é chamado uma vez por frame; retorna False quando terminou.
+    Controles alterados devem ser marcados com ticker.mark_dirty().
+    """
+
+    def start(self, ticker: "FrameTicker", now: float) -> None:
+        pass
+
+    @abstractmethod
+    def step(self, ticker: "FrameTicker", now: float) -> bool:
+        ...
+
+
+class Typewriter(Animation):
+    """
+    Revela o texto em `duration` segundos, qualquer que seja o tamanho:
+    caracteres por frame = ceil(len / (duration * fps)).
+    """
+
+    def __init__(self, control: ft.Text, text: str, *, duration: float) -> None:
+        self.control = control
+        self.text = text
+        self.duration = duration
+        self._shown = 0
+        self._per_frame = 1
+
+    def start(self, ticker: "FrameTicker", now: float) -> None:
+        frames = max(1, round(self.duration * ticker.fps))
+        self._per_frame = max(1, math.ceil(len(self.text) / frames))
+        self.control.value = ""
+        ticker.mark_dirty(self.control)
+
+    def step(self, ticker: "FrameTicker", now: float) -> bool:
+        self._shown = min(len(self.text), self._shown + self._per_frame)
+        self.control.value = self.text[: self._shown]
+        ticker.mark_dirty(self.control)
+        return self._shown < len(self.text)
+
+
+class Pulse(Animation):
+    """Pisca a opacidade (baixa -> 1) por `hold` segundos."""
+
+    def __init__(self, control: ft.Control, *, low: float = 0.35, hold: float = 0.08) -> None:
+        self.control = control
+        self.low = low
+        self.hold = hold
+        self._until = 0.0
+
+    def start(self, ticker: "FrameTicker", now: float) -> None:
+        self._until = now + self.hold
+        self.control.opacity = self.low
+        ticker.mark_dirty(self.control)
+
+    def step(self, ticker: "FrameTicker", now: float) -> bool:
+        if now < self._until:
+            return True
+        self.control.opacity = 1
+        ticker.mark_dirty(self.control)
+        return False
+
+
+class FrameTicker:
+    """
+    Relógio único de animações da UI (AppConfig.fps).
+    - uma task só (page.run_task), viva apenas enquanto houver trabalho
+    - cada animação tem um slot (ex.: "hint.type"); uma nova no mesmo slot substitui a antiga
+    - tudo que ficou sujo no frame vai num único page.update(*controles)
+    """
+
+    def __init__(self, page: ft.Page, *, fps: int = 30) -> None:
+        self.page = page
+        self.fps = max(1, int(fps))
+        self.frame_time = 1.0 / self.fps
+        self.frames = 0
+        self.updates_sent = 0
+
+        self._animations: Dict[str, Animation] = {}
+        self._dirty: Dict[int, ft.Control] = {}
+        self._task: Optional[Any] = None
+        self._disposed = False
+
+    # ---------- API ----------
+
+    def play(self, slot: str, animation: Animation) -> Animation:
+        if self._disposed:
+            return animation
+        animation.start(self, time.monotonic())
+        self._animations[slot] = animation
+        self._ensure_running()
+        return animation
+
+    def cancel(self, slot: str) -> None:
+        self._animations.pop(slot, None)
+
+    def mark_dirty(self, control: ft.Control) -> None:
+        """Agenda o controle para o próximo frame (sem animação associada)."""
+        self._dirty[id(control)] = control
+        self._ensure_running()
+
+    def tick(self, now: Optional[float] = None) -> bool:
+        """
+        Um frame: avança animações e envia um update com o que ficou sujo.
+        Retorna True se ainda há trabalho para os próximos frames.
+        """
+        now = time.monotonic() if now is None else now
+        for slot, anim in list(self._animations.items()):
+            if not anim.step(self, now) and self._animations.get(slot) is anim:
+                del self._animations[slot]
+
+        if self._dirty:
+            controls: List[ft.Control] = list(self._dirty.values())
+            self._dirty.clear()
+            try:
+                self.page.update(*controls)
+                self.updates_sent += 1
+            except Exception:
+                # controle ainda não montado / sessão caindo: descarta o frame
+                pass
+
+        self.frames += 1
+        return bool(self._animations or self._dirty)
+
+    def dispose(self) -> None:
+        self._disposed = True
+        self._animations.clear()
+        self._dirty.clear()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    # ---------- Loop ----------
+
+    def _ensure_running(self) -> None:
+        if self._disposed or (self._task is not None and not self._task.done()):
+            return
+        try:
+            self._task = self.page.run_task(self._run)
+        except Exception:
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_frame = loop.time()
+        try:
+            while not self._disposed:
+                if not self.tick():
+                    self._task = None  # próximo play()/mark_dirty() sobe outra task
+                    return
+                next_frame += self.frame_time
+                delay = next_frame - loop.time()
+                if delay < 0:
+                    # atrasou (máquina ocupada): não tenta "recuperar" frames
+                    next_frame = loop.time()
+                    delay = 0
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            return
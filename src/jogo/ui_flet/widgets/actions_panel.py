@@ -1,20 +1,14 @@
 from __future__ import annotations
 
-import asyncio
-from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Union
 
 import flet as ft
 
 from jogo.domain import GameState
+from jogo.ui_flet.ticker import FrameTicker, Pulse, Typewriter
 from .common import card
 
 
-@dataclass
-class _TypingJob:
-    task: Optional[asyncio.Task] = None
-
-
 class ActionsPanel:
     """
     Rodapé em 3 colunas:
@@ -25,9 +19,24 @@ class ActionsPanel:
       => scrollbar vai pro limite direito do painel.
     """
 
-    def __init__(self, page: ft.Page) -> None:
+    def __init__(
+        self,
+        page: ft.Page,
+        *,
+        ticker: Optional[FrameTicker] = None,
+        hint_reveal_seconds: float = 0.6,
+    ) -> None:
         self.page = page
-        self._typing = _TypingJob()
+        # animações (typewriter/pulse) rodam no ticker único do layout
+        self._ticker = ticker or FrameTicker(page)
+        self._hint_reveal_seconds = hint_reveal_seconds
+        self._on_choose: Optional[Callable[[str], None]] = None
+        self.controls_created = 0
+        self._inventory = "Mochila vazia."
+
+        # pool de botões de ação (cresce até o máximo de ações já visto)
+        self._pool: list[ft.Button] = []
+        self._empty = ft.Text("—", opacity=0.6, visible=False)
 
         # --------------------
         # Ações (ListView)
@@ -36,6 +45,7 @@ class ActionsPanel:
             expand=True,
             spacing=8,
             padding=ft.padding.only(top=6, right=8, bottom=6),
+            controls=[self._empty],
             auto_scroll=False,
         )
 
@@ -85,96 +95,101 @@ class ActionsPanel:
     # Lifecycle / cleanup
     # --------------------
     def dispose(self) -> None:
-        """Chamado no fechamento da janela para cancelar tasks penduradas."""
+        """Chamado no fechamento da janela para cancelar animações penduradas."""
         self._cancel_typing()
 
     # --------------------
     # Hint (typewriter)
     # --------------------
     def _cancel_typing(self) -> None:
-        if self._typing.task and not self._typing.task.done():
-            self._typing.task.cancel()
-        self._typing.task = None
-
-    def _pulse_hint(self) -> None:
-        self._hint_text.opacity = 0.35
-        self.page.update()
-
-        async def _up() -> None:
-            await asyncio.sleep(0.08)
-            self._hint_text.opacity = 1
-            self.page.update()
-
-        # task "curta"; não precisa guardar referência
-        self.page.run_task(_up)
-
-    def set_hint(self, text: str, *, typewriter: bool = True, speed: float = 0.02) -> None:
+        self._ticker.cancel("hint.type")
+        self._ticker.cancel("hint.pulse")
+
+    def set_hint(self, text: str, *, typewriter: bool = True, duration: Optional[float] = None) -> None:
+        """
+        typewriter=True: revela o texto em `duration` segundos (default do painel),
+        independente do tamanho; os frames saem do ticker (AppConfig.fps).
+        """
         self._cancel_typing()
         full = text or ""
 
         if not typewriter:
             self._hint_text.value = full
             self._hint_text.opacity = 1
-            self.page.update()
+            self._ticker.mark_dirty(self._hint_text)
             return
 
-        self._hint_text.value = ""
-        self._pulse_hint()
-
-        async def _type() -> None:
-            try:
-                i = 0
-                step = 2
-                while i < len(full):
-                    i = min(len(full), i + step)
-                    self._hint_text.value = full[:i]
-                    self.page.update()
-                    await asyncio.sleep(speed)
-            except asyncio.CancelledError:
-                return
-
-        self._typing.task = self.page.run_task(_type)
+        self._ticker.play("hint.pulse", Pulse(self._hint_text))
+        self._ticker.play(
+            "hint.type",
+            Typewriter(self._hint_text, full, duration=duration or self._hint_reveal_seconds),
+        )
 
     # --------------------
     # Config
     # --------------------
-    def _config_button(self, label: str, hint: str) -> ft.Control:
+    def _config_button(self, label: str, hint: Union[str, Callable[[], str]]) -> ft.Control:
+        """hint pode ser função: texto montado na hora do clique (ex.: mochila)."""
         return ft.Button(
             content=ft.Text(label, size=13, weight=ft.FontWeight.W_600),
             height=40,
-            on_click=lambda _e: self.set_hint(hint, typewriter=True),
+            on_click=lambda _e: self.set_hint(hint() if callable(hint) else hint, typewriter=True),
         )
 
     def set_config_defaults(self) -> None:
         self._config_lv.controls = [
-            self._config_button("Mochila", "Mochila / Inventário"),
+            self._config_button("Mochila", lambda: self._inventory),
             self._config_button("Atributos", "Árvore de atributos"),
             self._config_button("Config", "Configurações do jogo"),
         ]
 
+    def set_inventory(self, labels: List[str]) -> None:
+        """Itens atuais; aparecem nas Dicas quando o jogador abre a Mochila."""
+        self._inventory = "Mochila:\n" + "\n".join(f"• {label}" for label in labels) if labels else "Mochila vazia."
+
     # --------------------
     # Ações
     # --------------------
-    def render(self, state: GameState, *, on_choose: Callable[[str], None]) -> None:
-        def _make_on_click(choice_key: str):
-            def _handler(_e):
-                on_choose(choice_key)
-            return _handler
-
-        controls: list[ft.Control] = []
-
-        for c in state.choices:
-            btn = ft.Button(
-                content=ft.Text(c.label, size=13, weight=ft.FontWeight.W_600),
-                disabled=not c.enabled,
-                height=42,
-                on_click=_make_on_click(c.key),
-            )
-            btn.opacity = 1.0 if c.enabled else 0.45
-            controls.append(btn)
-
-        if not controls:
-            controls = [ft.Text("—", opacity=0.6)]
-
-        self._actions_lv.controls = controls
-        self.page.update()
+    def set_on_choose(self, on_choose: Callable[[str], None]) -> None:
+        """Callback atual; botões já criados chamam sempre o mais recente."""
+        self._on_choose = on_choose
+
+    def render(self, state: GameState, *, on_choose: Callable[[str], None]) -> ft.Control:
+        """
+        Reaproveita o pool de botões: só troca label, disabled, opacity e key.
+        Controles novos só nascem quando uma cena tem mais ações que o pool.
+        """
+        self.set_on_choose(on_choose)
+
+        while len(self._pool) < len(state.choices):
+            self._grow_pool()
+
+        for i, btn in enumerate(self._pool):
+            if i < len(state.choices):
+                c = state.choices[i]
+                btn.data = c.key
+                btn.content.value = c.label
+                btn.disabled = not c.enabled
+                btn.opacity = 1.0 if c.enabled else 0.45
+                btn.visible = True
+            else:
+                btn.visible = False
+
+        self._empty.visible = not state.choices
+        return self._actions_lv
+
+    def _grow_pool(self) -> None:
+        btn = ft.Button(
+            content=ft.Text("", size=13, weight=ft.FontWeight.W_600),
+            height=42,
+            on_click=self._on_pool_click,
+        )
+        self._pool.append(btn)
+        # botão = Button + Text
+        self.controls_created += 2
+        self._actions_lv.controls = [*self._pool, self._empty]
+
+    def _on_pool_click(self, e) -> None:
+        key = e.control.data
+        if key is not None and self._on_choose is not None:
+            self._on_choose(key)
@@ -107,12 +107,15 @@ def stat_chip(
     """
     Chip de status:
       [Label  65]
+
+    O Text do valor fica em .data, para atualizar o chip sem recriá-lo.
     """
 
+    value_text = ft.Text(str(value), size=12, opacity=value_opacity)
     row = ft.Row(
         controls=[
             ft.Text(label, size=12, weight=ft.FontWeight.W_600),
-            ft.Text(str(value), size=12, opacity=value_opacity),
+            value_text,
         ],
         spacing=6,
         tight=True,
@@ -124,6 +127,7 @@ def stat_chip(
         border=ft.border.all(BORDER_W, outline_color()),
         border_radius=RADIUS_CHIP,
         width=min_width,
+        data=value_text,
     )
 
 
@@ -25,5 +25,6 @@ class NarrativePanel:
 
         self.control = card("Narrativa", self._scroll, expand=True)
 
-    def render(self, state: GameState) -> None:
+    def render(self, state: GameState) -> ft.Control:
         self._text.value = (state.text or "").strip()
+        return self._text
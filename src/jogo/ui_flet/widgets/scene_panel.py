@@ -1,18 +1,58 @@
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Optional
+
 import flet as ft
 
+from jogo.content import registry
+from jogo.content.assets import ImagePipeline
 from jogo.domain import GameState
 from .common import card
 
 
 class ScenePanel:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        assets: Optional[ImagePipeline] = None,
+        target_width: int = 640,
+        inline_images: bool = False,
+    ) -> None:
+        self.assets = assets
+        self.target_width = target_width
+        # navegador (AppView.WEB_BROWSER) não enxerga caminhos do servidor: manda os bytes
+        self.inline_images = inline_images
+
         self._img = ft.Image(src="", fit=ft.BoxFit.CONTAIN, expand=True)
         self._img_container = ft.Container(self._img, padding=ft.Padding(top=6), expand=True)
 
         self.control = card("Cena", self._img_container, expand=True)
 
-    def render(self, state: GameState) -> None:
-        self._img.src = state.image_path if state.image_path else ""
-        self._img.visible = bool(state.image_path)
+    def render(self, state: GameState) -> ft.Control:
+        src = state.image_path or ""
+        if src and not Path(src).is_file():
+            # capítulo distribuído só como chapter.pack: a imagem vem em bytes do mmap
+            self._img.src = self._image_bytes(state)
+        else:
+            if src and self.assets is not None:
+                # variante pré-escalada se já existir; senão o original (sem esperar I/O)
+                src = self.assets.variant(src, self.target_width)
+            self._img.src = self._file_bytes(src, state) if src and self.inline_images else src
+        self._img.visible = bool(self._img.src)
+        return self._img
+
+    @classmethod
+    def _file_bytes(cls, path: str, state: GameState) -> bytes:
+        try:
+            return Path(path).read_bytes()
+        except OSError:
+            return cls._image_bytes(state)
+
+    @staticmethod
+    def _image_bytes(state: GameState) -> bytes:
+        try:
+            data = registry.get_image_bytes(state.chapter_id, state.scene_id)
+        except (registry.ManifestError, registry.SceneNotFoundError):
+            return b""
+        return bytes(data) if data is not None else b""
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from typing import Dict, List, Optional
+
 import flet as ft
 
 from jogo.domain import GameState
+from jogo.runtime import metrics
 from .common import card, stat_chip, subtle_bg
 
 
@@ -13,25 +16,42 @@ class StatusTabs:
     """
 
     def __init__(self) -> None:
+        # controles criados depois da montagem (views das abas, no primeiro clique)
+        self.controls_created = 0
+
         # ---------- Views ----------
-        self._chips = ft.Row(spacing=8, wrap=True)
-        self._local_text = ft.Text(value="—", selectable=True, size=13, no_wrap=False)
-        self._arquivo_text = ft.Text(value="Em breve: pistas, objetivos, tags.", size=13)
+        # chips fixos (criados uma vez); render só troca o valor
+        self._chip_fields = ("sono", "energia", "foco", "estresse")
+        self._chip_list = [
+            stat_chip("Sono", 0),
+            stat_chip("Energia", 0),
+            stat_chip("Foco", 0),
+            stat_chip("Estresse", 0),
+        ]
+        self._chips = ft.Row(controls=list(self._chip_list), spacing=8, wrap=True)
+        self._location = "—"
+        self._clues = "Nenhuma pista ainda."
 
-        self._status_view = ft.Container(self._chips, padding=ft.padding.only(top=6))
-        self._local_view = ft.Container(self._local_text, padding=ft.padding.only(top=6))
-        self._arquivo_view = ft.Container(self._arquivo_text, padding=ft.padding.only(top=6))
+        # Local/Arquivo/Debug só são montadas quando a aba é aberta pela primeira vez
+        self._views: Dict[str, ft.Container] = {
+            "status": ft.Container(self._chips, padding=ft.padding.only(top=6)),
+        }
+        self._local_text: Optional[ft.Text] = None
+        self._arquivo_text: Optional[ft.Text] = None
+        self._debug_text: Optional[ft.Text] = None
 
-        self._content_host = ft.Container(content=self._status_view)
+        self._content_host = ft.Container(content=self._views["status"])
 
         # ---------- Tabs ----------
         self._active = "status"
         self._tab_status = self._tab("Status", "status")
         self._tab_local = self._tab("Local", "local")
         self._tab_arquivo = self._tab("Arquivo", "arquivo")
+        # só aparece com métricas ligadas (timers, hit rates, visitas)
+        self._tab_debug = self._tab("Debug", "debug")
 
         self._tabs_row = ft.Row(
-            controls=[self._tab_status, self._tab_local, self._tab_arquivo],
+            controls=[self._tab_status, self._tab_local, self._tab_arquivo, self._tab_debug],
             spacing=8,
             wrap=True,
         )
@@ -65,21 +85,34 @@ class StatusTabs:
         c.data = {"name": name, "text": txt}
         return c
 
-    def _select(self, name: str) -> None:
-        self._active = name
+    def _view(self, name: str) -> ft.Container:
+        view = self._views.get(name)
+        if view is not None:
+            return view
 
-        if name == "status":
-            self._content_host.content = self._status_view
-        elif name == "local":
-            self._content_host.content = self._local_view
+        if name == "local":
+            text = self._local_text = ft.Text(value=self._location, selectable=True, size=13, no_wrap=False)
+        elif name == "debug":
+            text = self._debug_text = ft.Text(value="", size=12, selectable=True)
         else:
-            self._content_host.content = self._arquivo_view
+            text = self._arquivo_text = ft.Text(value=self._clues, size=13, selectable=True)
+        view = self._views[name] = ft.Container(text, padding=ft.padding.only(top=6))
+        # view = Container + Text
+        self.controls_created += 2
+        return view
+
+    def _select(self, name: str) -> None:
+        self._active = name
+        self._content_host.content = self._view(name)
+        if name == "debug":
+            self.render_debug()
 
         self._refresh_tabs()
         # layout/page.update() fica com quem chamou (main/layout)
 
     def _refresh_tabs(self) -> None:
-        for t in (self._tab_status, self._tab_local, self._tab_arquivo):
+        self._tab_debug.visible = metrics.ENABLED
+        for t in (self._tab_status, self._tab_local, self._tab_arquivo, self._tab_debug):
             meta = t.data or {}
             name = meta.get("name", "")
             is_active = (name == self._active)
@@ -100,14 +133,34 @@ class StatusTabs:
             )
 
     # ---------- Render ----------
-    def render(self, state: GameState) -> None:
+    def render(self, state: GameState) -> ft.Control:
         s = state.stats
-        self._chips.controls = [
-            stat_chip("Sono", s.sono),
-            stat_chip("Energia", s.energia),
-            stat_chip("Foco", s.foco),
-            stat_chip("Estresse", s.estresse),
-        ]
+        for chip, name in zip(self._chip_list, self._chip_fields):
+            chip.data.value = str(getattr(s, name))
+        return self._chips
+
+    def render_clues(self, labels: List[str]) -> Optional[ft.Control]:
+        """
+        Aba Arquivo = pistas do jogador.
+        Só devolve controle para update se a aba estiver aberta.
+        """
+        self._clues = "\n".join(f"• {label}" for label in labels) if labels else "Nenhuma pista ainda."
+        if self._arquivo_text is None:
+            return None  # aba nunca aberta: a view nasce com o texto atual
+        self._arquivo_text.value = self._clues
+        return self._arquivo_text if self._active == "arquivo" else None
+
+    def render_debug(self) -> Optional[ft.Control]:
+        """
+        Aba Debug (só com métricas ligadas): timers, hit rates, visitas.
+        Só atualiza se a aba estiver aberta; None = nada a enviar.
+        """
+        if not metrics.ENABLED or self._active != "debug" or self._debug_text is None:
+            return None
+        self._debug_text.value = metrics.summary()
+        return self._debug_text
 
     def set_location(self, text: str) -> None:
-        self._local_text.value = text or "—"
+        self._location = text or "—"
+        if self._local_text is not None:
+            self._local_text.value = self._location
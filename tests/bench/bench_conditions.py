@@ -0,0 +1,105 @@
+"""
+Custo por transição (estado da cena: choices + enabled + texto) com condições ("requires") compiladas,
+conforme cresce o número de condições no capítulo (tools/scripts/gen_chapter.py).
+
+Para comparação, "interpretado" mede só a avaliação das mesmas condições com
+eval() da string a cada render (o que o load compilado evita).
+
+Uso:
+    python tests/bench/bench_conditions.py [--sizes 1000,10000] [--ratios 0,0.5,1] [--steps 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from jogo.content import registry
+from jogo.domain import GameEngine
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools" / "scripts"))
+from gen_chapter import generate  # noqa: E402
+
+
+def _path(chapter: registry.ChapterData, steps: int, seed: int) -> List[str]:
+    """
+    Cenas sorteadas uniformemente (mesma sequência para todo mundo). Um passeio
+    pelo grafo ficaria preso nos loops perto dos finais e quase não veria condições.
+    """
+    rng = random.Random(seed)
+    ids = list(chapter.scenes)
+    return [rng.choice(ids) for _ in range(steps)]
+
+
+def _transitions(chapter_id: str, path: List[str]) -> float:
+    """Monta o estado de cada cena do caminho (o que choose() faz depois de aplicar a ação)."""
+    engine = GameEngine(chapter_id=chapter_id)
+    t0 = time.perf_counter()
+    for sid in path:
+        engine.scene_id = sid
+        engine.start()
+    return (time.perf_counter() - t0) / len(path)
+
+
+def _interpreted(chapter: registry.ChapterData, path: List[str]) -> float:
+    """Só o eval() das strings de requires de cada cena do caminho (sem compilar no load)."""
+    stats = {"sono": 65, "energia": 55, "foco": 70, "estresse": 30}
+    t0 = time.perf_counter()
+    for sid in path:
+        for a in chapter.scenes[sid].actions:
+            if a.requires is not None:
+                eval(a.requires.source, {"__builtins__": {}}, stats)
+    return (time.perf_counter() - t0) / len(path)
+
+
+def run(sizes: List[int], ratios: List[float], *, steps: int, seed: int) -> List[dict]:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        registry.CHAPTERS_DIR = Path(tmp)
+        for n in sizes:
+            for ratio in ratios:
+                chapter_id = f"cond_{n}_{int(ratio * 100)}"
+                generate(Path(tmp) / chapter_id, scenes=n, text_file_ratio=0.0, requires_ratio=ratio, seed=seed)
+                registry.invalidate()
+                chapter = registry.load_chapter(chapter_id)
+                conditions = sum(a.requires is not None for s in chapter.scenes.values() for a in s.actions)
+
+                path = _path(chapter, steps, seed)
+                _transitions(chapter_id, path)  # aquecimento (tabelas por cena)
+                compiled = min(_transitions(chapter_id, path) for _ in range(3))
+                interpreted = min(_interpreted(chapter, path) for _ in range(3))
+                rows.append(
+                    {
+                        "scenes": n,
+                        "conditions": conditions,
+                        "transition_us": round(compiled * 1e6, 3),
+                        "interpreted_eval_us": round(interpreted * 1e6, 3),
+                    }
+                )
+                registry.invalidate()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--ratios", default="0,0.5,1")
+    parser.add_argument("--steps", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    ratios = [float(r) for r in args.ratios.split(",")]
+    for r in run(sizes, ratios, steps=args.steps, seed=args.seed):
+        print(
+            f"{r['scenes']:>7} cenas  {r['conditions']:>7} condições  "
+            f"{r['transition_us']:>7.3f} µs/transição  (só o eval interpretado: {r['interpreted_eval_us']:.3f} µs)"
+        )
+
+
+if __name__ == "__main__":
+    main()
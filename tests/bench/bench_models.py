@@ -0,0 +1,111 @@
+"""
+Memória/alocação por GameState: layout antigo (dataclass com __dict__,
+choices em lista, stats copiados com replace) vs modelos atuais (slots,
+choices em tupla compartilhada, StatsSnapshot reaproveitado).
+
+Uso:
+    python tests/bench/bench_models.py [--states 20000]
+"""
+from __future__ import annotations
+
+import argparse
+import tracemalloc
+from dataclasses import dataclass, field, replace
+from typing import List
+
+from jogo.domain import GameEngine
+
+
+# ---------- Layout antigo (referência "antes") ----------
+
+@dataclass
+class _LegacyStats:
+    sono: int = 65
+    energia: int = 55
+    foco: int = 70
+    estresse: int = 30
+
+
+@dataclass(frozen=True)
+class _LegacyChoice:
+    key: str
+    label: str
+    goto: str
+    hint: str = ""
+    enabled: bool = True
+
+
+@dataclass(frozen=True)
+class _LegacyState:
+    chapter_id: str
+    scene_id: str
+    text: str
+    image_path: str
+    choices: List[_LegacyChoice] = field(default_factory=list)
+    stats: _LegacyStats = field(default_factory=_LegacyStats)
+
+
+def _legacy_states(n: int, template) -> list:
+    stats = _LegacyStats()
+    out = []
+    for _ in range(n):
+        out.append(
+            _LegacyState(
+                chapter_id=template.chapter_id,
+                scene_id=template.scene_id,
+                text=template.text,
+                image_path=template.image_path,
+                choices=[
+                    _LegacyChoice(key=c.key, label=c.label, goto=c.goto, hint=c.hint, enabled=True)
+                    for c in template.choices
+                ],
+                stats=replace(stats),
+            )
+        )
+    return out
+
+
+def _current_states(n: int, engine: GameEngine) -> list:
+    # ação "3" do loop tem efeito; alterna com key inexistente (re-render sem efeito)
+    return [engine.choose("3" if i % 4 == 0 else "x") for i in range(n)]
+
+
+def _measure(fn) -> int:
+    tracemalloc.start()
+    base = tracemalloc.take_snapshot()
+    keep = fn()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(base, "filename")
+    total = sum(s.size_diff for s in stats if s.size_diff > 0)
+    del keep
+    return total
+
+
+def run(states: int) -> dict:
+    engine = GameEngine(chapter_id="chapter_01")
+    engine.start()
+    template = engine.choose("1")  # cena de loop, 4 ações
+
+    before = _measure(lambda: _legacy_states(states, template))
+    after = _measure(lambda: _current_states(states, engine))
+    return {
+        "states": states,
+        "bytes_per_state_before": round(before / states, 1),
+        "bytes_per_state_after": round(after / states, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--states", type=int, default=20000)
+    args = parser.parse_args()
+
+    r = run(args.states)
+    print(f"GameState x{r['states']}")
+    print(f"  antes:  {r['bytes_per_state_before']:>8} bytes/estado")
+    print(f"  depois: {r['bytes_per_state_after']:>8} bytes/estado")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Escala do registry com capítulos sintéticos (tools/scripts/gen_chapter.py):
+parse do manifest, memória do ChapterData em cache e análise do grafo.
+
+Uso:
+    python tests/bench/bench_scaling.py [--sizes 1000,10000,100000] [--branching 3] [--seed 1]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+from jogo.content import registry
+from jogo.content.graph import build_graph
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools" / "scripts"))
+from gen_chapter import generate  # noqa: E402
+
+
+def run(sizes: List[int], *, branching: int, seed: int) -> List[dict]:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        registry.CHAPTERS_DIR = Path(tmp)
+        for n in sizes:
+            chapter_id = f"synth_{n}"
+            manifest = generate(Path(tmp) / chapter_id, scenes=n, branching=branching, seed=seed)
+
+            registry.invalidate()
+            gc.collect()
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            chapter = registry.load_chapter(chapter_id)
+            load_s = time.perf_counter() - t0
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            t0 = time.perf_counter()
+            graph = build_graph(chapter.entry_scene, chapter.scenes)
+            graph_s = time.perf_counter() - t0
+
+            rows.append(
+                {
+                    "scenes": n,
+                    "manifest_mb": round(manifest.stat().st_size / 1e6, 2),
+                    "load_ms": round(load_s * 1000, 1),
+                    "us_per_scene": round(load_s / n * 1e6, 2),
+                    "bytes_per_scene": round(current / n),
+                    "peak_mb": round(peak / 1e6, 1),
+                    "graph_ms": round(graph_s * 1000, 1),
+                    "endings": len(graph.endings),
+                }
+            )
+            registry.invalidate()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000")
+    parser.add_argument("--branching", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    for r in run(sizes, branching=args.branching, seed=args.seed):
+        print(
+            f"{r['scenes']:>7} cenas  manifest {r['manifest_mb']:>7} MB  "
+            f"load {r['load_ms']:>8} ms ({r['us_per_scene']} µs/cena)  "
+            f"{r['bytes_per_scene']:>6} B/cena (pico {r['peak_mb']} MB)  grafo {r['graph_ms']} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
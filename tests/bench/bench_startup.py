@@ -0,0 +1,63 @@
+"""
+Cold start: tempo até o primeiro render (python -m jogo --profile-startup --headless),
+medido em processos novos, mais o tempo de import por pacote.
+
+Uso:
+    python tests/bench/bench_startup.py [--runs 5]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+def _once() -> Dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(SRC), env.get("PYTHONPATH", "")) if p)
+    out = subprocess.run(
+        [sys.executable, "-m", "jogo", "--profile-startup", "--headless", "--json"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    ).stdout
+    return json.loads(out)
+
+
+def run(runs: int) -> dict:
+    reports: List[Dict] = [_once() for _ in range(runs)]
+    median: Dict[str, float] = {}
+    for phase in reports[0]["phases_ms"]:
+        values = [r["phases_ms"][phase] for r in reports if phase in r["phases_ms"]]
+        median[phase] = round(statistics.median(values), 1)
+    return {
+        "runs": runs,
+        "median_ms": median,
+        "imports_ms": reports[-1]["imports_ms"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    r = run(args.runs)
+    print(f"cold start x{r['runs']} (mediana, ms)")
+    for phase, ms in r["median_ms"].items():
+        print(f"  {phase:<16} {ms:>8}")
+    print("imports (ms):")
+    for name, ms in list(r["imports_ms"].items())[:8]:
+        print(f"  {name:<16} {ms:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Suíte de benchmarks (micro + macro) dos caminhos quentes:
+registry (load_manifest, load_chapter, get_scene frio/quente), engine
+(start/choose em sequências longas) e AppLayout.render sobre HeadlessPage.
+
+Cada benchmark roda `--rounds` vezes; guarda mediana e mínimo por operação (µs).
+A comparação usa o mínimo (menos sensível a ruído da máquina que a mediana).
+
+Uso:
+    python tests/bench/suite.py run                      # só imprime
+    python tests/bench/suite.py run --save               # grava baseline JSON
+    python tests/bench/suite.py compare --threshold 0.2  # falha (exit 1) se algo piorar >20%
+    python tests/bench/suite.py run -k engine            # filtra por nome
+
+Baselines dependem da máquina: gere a sua antes de comparar
+(padrão: tests/bench/baseline.json, fora do git).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from jogo.content import registry
+from jogo.domain import GameEngine
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+CHAPTER = "chapter_01"
+
+Results = Dict[str, Dict[str, Any]]  # nome -> {kind, median_us, min_us, ops}
+
+# setup() -> (op, ops): op() executa `ops` operações; o tempo é dividido por ops
+Setup = Callable[[], Tuple[Callable[[], None], int]]
+
+
+@dataclass(frozen=True)
+class Bench:
+    name: str
+    setup: Setup
+    kind: str  # "micro" | "macro"
+
+
+_BENCHES: List[Bench] = []
+
+
+def bench(name: str, *, kind: str = "micro") -> Callable[[Setup], Setup]:
+    def deco(fn: Setup) -> Setup:
+        _BENCHES.append(Bench(name, fn, kind))
+        return fn
+
+    return deco
+
+
+# ---------- Registry ----------
+
+@bench("registry.load_manifest")
+def _load_manifest():
+    def op() -> None:
+        registry.load_manifest(CHAPTER)
+
+    return op, 1
+
+
+@bench("registry.load_chapter.cold")
+def _load_chapter_cold():
+    def op() -> None:
+        registry.invalidate(CHAPTER)
+        registry.load_chapter(CHAPTER)
+
+    return op, 1
+
+
+@bench("registry.get_scene.cold")
+def _get_scene_cold():
+    scene_ids = list(registry.load_chapter(CHAPTER).scenes)
+
+    def op() -> None:
+        registry.invalidate(CHAPTER)
+        for sid in scene_ids:
+            registry.get_scene(CHAPTER, sid)
+
+    return op, len(scene_ids)
+
+
+@bench("registry.get_scene.warm")
+def _get_scene_warm():
+    registry.load_chapter(CHAPTER)
+    scene_ids = list(registry.get_chapter(CHAPTER).scenes)
+    for sid in scene_ids:
+        registry.get_scene(CHAPTER, sid)
+    n = 20_000
+
+    def op() -> None:
+        for i in range(n):
+            registry.get_scene(CHAPTER, scene_ids[i % len(scene_ids)])
+
+    return op, n
+
+
+# ---------- Engine ----------
+
+def _walk(engine: GameEngine, n: int, seed: int) -> Callable[[], None]:
+    rng = random.Random(seed)
+
+    def op() -> None:
+        state = engine.start()
+        for _ in range(n):
+            if not state.choices:
+                engine.scene_id = registry.get_entry_scene_id(CHAPTER)
+                state = engine.start()
+            state = engine.choose(rng.choice(state.choices).key)
+
+    return op
+
+
+@bench("engine.start")
+def _engine_start():
+    engine = GameEngine(chapter_id=CHAPTER)
+    n = 20_000
+
+    def op() -> None:
+        for _ in range(n):
+            engine.start()
+
+    return op, n
+
+
+@bench("engine.choose.sequence", kind="macro")
+def _engine_choose():
+    n = 10_000
+    return _walk(GameEngine(chapter_id=CHAPTER), n, seed=7), n
+
+
+# ---------- UI ----------
+
+@bench("ui.layout.render", kind="macro")
+def _layout_render():
+    from jogo.content.assets import ImagePipeline
+    from jogo.ui_flet.headless import HeadlessPage
+    from jogo.ui_flet.layout import AppLayout
+
+    # variantes num diretório temporário, nunca no cache do usuário
+    cache = tempfile.TemporaryDirectory(prefix="jogo-bench-")
+    engine = GameEngine(chapter_id=CHAPTER)
+    rng = random.Random(11)
+    states = [engine.start()]
+    while len(states) < 5000:
+        s = states[-1]
+        if not s.choices:
+            engine.scene_id = registry.get_entry_scene_id(CHAPTER)
+            states.append(engine.start())
+        else:
+            states.append(engine.choose(rng.choice(s.choices).key))
+
+    layout = AppLayout(HeadlessPage(), pipeline=ImagePipeline(Path(cache.name)))  # type: ignore[arg-type]
+
+    def op() -> None:
+        # op segura `cache`: o diretório vive enquanto o benchmark roda
+        _ = cache
+        for s in states:
+            layout.render(s, on_choose=lambda _k: None)
+
+    return op, len(states)
+
+
+# ---------- Runner ----------
+
+def run(*, rounds: int = 9, pattern: str = "", names: Optional[List[str]] = None) -> Results:
+    results: Results = {}
+    for b in _BENCHES:
+        if pattern and pattern not in b.name:
+            continue
+        if names is not None and b.name not in names:
+            continue
+        try:
+            op, ops = b.setup()
+        except ImportError as e:  # flet ausente, por exemplo
+            print(f"  {b.name:<28} pulado ({e})", file=sys.stderr)
+            continue
+        op()  # aquecimento
+        samples = []
+        for _ in range(rounds):
+            t0 = time.perf_counter()
+            op()
+            samples.append((time.perf_counter() - t0) / ops * 1e6)
+        results[b.name] = {
+            "kind": b.kind,
+            "median_us": round(statistics.median(samples), 3),
+            "min_us": round(min(samples), 3),
+            "ops": ops,
+        }
+    return results
+
+
+def compare(
+    current: Results, baseline: Results, threshold: float
+) -> List[Tuple[str, float, float, float]]:
+    """(nome, baseline µs, atual µs, razão) dos caminhos que pioraram além do limite."""
+    regressions = []
+    for name, cur in current.items():
+        base = baseline.get(name)
+        if base is None or not base["min_us"]:
+            continue
+        ratio = cur["min_us"] / base["min_us"]
+        if ratio > 1 + threshold:
+            regressions.append((name, base["min_us"], cur["min_us"], ratio))
+    return regressions
+
+
+def _machine() -> Dict[str, str]:
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine()}
+
+
+def _print(results: Results, baseline: Optional[Results] = None) -> None:
+    for name, r in results.items():
+        line = f"  {name:<28} {r['median_us']:>11.3f} µs/op  (min {r['min_us']:.3f})"
+        if baseline and name in baseline and baseline[name]["min_us"]:
+            ratio = r["min_us"] / baseline[name]["min_us"]
+            line += f"  x{ratio:.2f} vs baseline"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=("run", "compare"))
+    parser.add_argument("--rounds", type=int, default=9)
+    parser.add_argument("-k", dest="pattern", default="", help="só benchmarks cujo nome contém o texto")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="grava o resultado como baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="piora tolerada (0.2 = 20%%)")
+    parser.add_argument(
+        "--retries", type=int, default=2, help="re-roda quem piorou antes de acusar (descarta ruído pontual)"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(rounds=args.rounds, pattern=args.pattern)
+
+    if args.mode == "run":
+        _print(results)
+        if args.save:
+            args.baseline.write_text(
+                json.dumps({"machine": _machine(), "results": results}, indent=2) + "\n", encoding="utf-8"
+            )
+            print(f"baseline gravado em {args.baseline}")
+        return 0
+
+    try:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+    except FileNotFoundError:
+        print(f"baseline não encontrado: {args.baseline} (rode 'run --save' antes)", file=sys.stderr)
+        return 2
+
+    regressions = compare(results, baseline, args.threshold)
+    for _ in range(args.retries):
+        if not regressions:
+            break
+        again = run(rounds=args.rounds, names=[r[0] for r in regressions])
+        for name, r in again.items():
+            if r["min_us"] < results[name]["min_us"]:
+                results[name] = r
+        regressions = compare(results, baseline, args.threshold)
+
+    _print(results, baseline)
+    for name, base, cur, ratio in regressions:
+        print(f"REGRESSÃO {name}: {base:.3f} -> {cur:.3f} µs/op (x{ratio:.2f})", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from jogo.content import assets, registry
+
+
+@pytest.fixture(autouse=True)
+def _image_cache(tmp_path, monkeypatch):
+    """Pipeline de imagens do processo com cache em tmp_path (nunca em ~/.cache)."""
+    pipeline = assets.ImagePipeline(tmp_path / "image-cache")
+    monkeypatch.setattr(assets, "_shared", pipeline)
+    yield pipeline
+    pipeline.shutdown()
+
+
+@pytest.fixture
+def chapters_dir(tmp_path, monkeypatch):
+    """registry.CHAPTERS_DIR passa a ser tmp_path; o cache é limpo antes e depois."""
+    monkeypatch.setattr(registry, "CHAPTERS_DIR", tmp_path)
+    registry.invalidate()
+    yield tmp_path
+    registry.invalidate()
+
+
+@pytest.fixture
+def write_chapter(chapters_dir):
+    """
+    write_chapter(chapter_id, manifest, files={rel: texto|bytes}) -> pasta do capítulo
+    dentro de chapters_dir. manifest pode ser dict (vira JSON) ou o texto já pronto.
+    """
+
+    def write(chapter_id, manifest, files=None):
+        chapter = chapters_dir / chapter_id
+        chapter.mkdir(parents=True, exist_ok=True)
+        for rel, content in (files or {}).items():
+            f = chapter / rel
+            f.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(content, bytes):
+                f.write_bytes(content)
+            else:
+                f.write_text(content, encoding="utf-8")
+        text = manifest if isinstance(manifest, str) else json.dumps(manifest)
+        (chapter / "manifest.json").write_text(text, encoding="utf-8")
+        return chapter
+
+    return write
+
+
+@pytest.fixture
+def gated_chapter(write_chapter):
+    """
+    chapter_g: "Abrir" pede o item (requires configurável), "Forçar" pede foco >= 80,
+    "Revistar" dá o item e "Pensar" sobe o foco. Para simuladores (batch/explore).
+    """
+
+    def write(item, *, requires=None):
+        return write_chapter(
+            "chapter_g",
+            {
+                "entry_scene": "a",
+                "scenes": {
+                    "a": {"text": "Porta.", "actions": [
+                        {"key": "1", "label": "Revistar", "goto": "a", "grants": {"items": [item]}},
+                        {"key": "2", "label": "Abrir", "goto": "fim", "requires": requires or f"has('{item}')",
+                         "consumes": {"items": [item]}},
+                        {"key": "3", "label": "Forçar", "goto": "fim2", "requires": "foco >= 80"},
+                        {"key": "4", "label": "Pensar", "goto": "a", "effects": {"foco": 5}},
+                    ]},
+                    "fim": {"text": "Aberta.", "actions": []},
+                    "fim2": {"text": "Arrombada.", "actions": []},
+                },
+            },
+        )
+
+    return write
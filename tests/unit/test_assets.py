@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+from jogo.content import registry
+from jogo.content.assets import ImagePipeline
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _wait(pipeline, src, width, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        out = pipeline.variant(src, width)
+        if out != src:
+            return out
+        time.sleep(0.01)
+    raise AssertionError("variante não ficou pronta")
+
+
+def test_variant_is_scaled_cached_and_never_blocks(tmp_path):
+    src = tmp_path / "big.png"
+    Image.new("RGB", (2000, 1000), "red").save(src)
+    small = tmp_path / "small.png"
+    Image.new("RGB", (300, 200), "blue").save(small)
+
+    p = ImagePipeline(tmp_path / "cache", widths=(480, 960))
+    # primeiro render: original, variante agendada
+    assert p.variant(str(src), 900) == str(src)
+
+    out = _wait(p, str(src), 900)
+    with Image.open(out) as im:
+        assert im.size == (960, 480)
+    assert p.stats.variants_built == 1
+
+    # não amplia imagem menor que a variante
+    assert p.build(str(small), 480) == str(small)
+
+    # cache em disco por hash de conteúdo: outro pipeline reaproveita o arquivo
+    p2 = ImagePipeline(tmp_path / "cache", widths=(480, 960))
+    assert p2.build(str(src), 960) == out
+    assert p2.stats.variants_built == 0
+    p.shutdown()
+    p2.shutdown()
+
+
+def test_unreadable_image_is_not_rebuilt_on_every_render(tmp_path):
+    src = tmp_path / "broken.png"
+    src.write_bytes(b"isto nao e um png" * 64)
+
+    p = ImagePipeline(tmp_path / "cache", widths=(480,))
+    calls = []
+    build = p.build
+    p.build = lambda s, w: calls.append(s) or build(s, w)  # type: ignore[method-assign]
+
+    assert p.variant(str(src), 400) == str(src)
+    deadline = time.monotonic() + 5
+    while p.stats.variants_failed == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert p.stats.variants_failed == 1
+
+    for _ in range(5):
+        assert p.variant(str(src), 400) == str(src)
+    p.warm([str(src)], 400)
+    assert calls == [str(src)]
+    assert not p.is_ready(str(src), 400)
+
+    # clear() (capítulo recarregado) permite tentar de novo
+    p.clear()
+    p.variant(str(src), 400)
+    deadline = time.monotonic() + 5
+    while p.stats.variants_failed == 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(calls) == 2
+    p.shutdown()
+
+
+def test_prefetch_prepares_neighbour_images(tmp_path, write_chapter):
+    chapter = write_chapter("chapter_i", {
+        "entry_scene": "a",
+        "scenes": {
+            "a": {"text": "A", "actions": [{"key": "1", "label": "Ir", "goto": "b"}]},
+            "b": {"text": "B", "image": "images/b.png", "actions": []},
+        },
+    })
+    (chapter / "images").mkdir()
+    Image.new("RGB", (1200, 600)).save(chapter / "images" / "b.png")
+
+    p = ImagePipeline(tmp_path / "cache", widths=(480,))
+    p.prefetch("chapter_i", "a", 400)
+
+    src = registry.get_scene("chapter_i", "b").image
+    deadline = time.monotonic() + 5
+    while not p.is_ready(src, 400) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # depois do prefetch a troca de cena já encontra a variante pronta
+    assert p.variant(src, 400) != src
+    assert p.stats.variant_misses == 0
+    p.shutdown()
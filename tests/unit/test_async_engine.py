@@ -0,0 +1,44 @@
+import asyncio
+import threading
+
+from jogo.content import registry
+from jogo.domain import AsyncGameEngine, GameEngine, async_engine
+
+
+def test_async_engine_matches_sync_engine():
+    async def play():
+        engine = await AsyncGameEngine.open(chapter_id="chapter_01")
+        states = [await engine.start()]
+        for key in ("1", "3", "nao_existe"):
+            states.append(await engine.choose(key))
+        return states
+
+    sync = GameEngine(chapter_id="chapter_01")
+    expected = [sync.start()] + [sync.choose(k) for k in ("1", "3", "nao_existe")]
+    assert asyncio.run(play()) == expected
+
+
+def test_concurrent_requests_for_same_scene_share_one_load(monkeypatch):
+    calls = []
+    real = registry.get_scene
+    release = threading.Event()
+
+    def slow_get_scene(chapter_id, scene_id):
+        calls.append(scene_id)
+        release.wait(5)
+        return real(chapter_id, scene_id)
+
+    monkeypatch.setattr(registry, "get_scene", slow_get_scene)
+    monkeypatch.setattr(registry, "is_scene_cached", lambda *_a: False)
+    entry = registry.get_entry_scene_id("chapter_01")
+
+    async def main():
+        tasks = [asyncio.create_task(async_engine.get_scene("chapter_01", entry)) for _ in range(5)]
+        await asyncio.sleep(0.05)  # event loop segue rodando com o I/O parado
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    scenes = asyncio.run(main())
+    assert calls == [entry]
+    assert all(s is scenes[0] for s in scenes)
+    assert not async_engine._inflight
@@ -0,0 +1,78 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from jogo.domain import GameEngine  # noqa: E402
+from jogo.domain.batch import BatchEngine, GreedyPolicy, Policy, RandomPolicy, ScriptedPolicy  # noqa: E402
+
+
+def test_scripted_batch_matches_engine():
+    script = ["1", "1", "2", "4", "1", "3", "4", "2"]
+
+    engine = GameEngine(chapter_id="chapter_01")
+    engine.start()
+    for key in script:
+        state = engine.choose(key)
+
+    batch = BatchEngine(chapter_id="chapter_01", n=3, policies=[ScriptedPolicy(script)])
+    for _ in script:
+        batch.step()
+
+    assert batch.chapter.scene_ids[batch.scene[0]] == state.scene_id
+    assert batch.foco[0] == state.stats.foco
+    assert batch.estresse[2] == state.stats.estresse
+
+
+def test_random_and_greedy_reach_endings():
+    batch = BatchEngine(
+        chapter_id="chapter_01",
+        n=500,
+        policies=[RandomPolicy(seed=7), GreedyPolicy()],
+    )
+    result = batch.run(max_steps=500)
+
+    assert sum(result.endings.values()) + result.unfinished == 500
+    assert set(result.endings) <= {"scn_06_encerramento"}
+    assert result.histogram("scn_01_start", "foco").sum() == 500
+
+
+def test_greedy_leaves_loops_and_reaches_ending():
+    batch = BatchEngine(chapter_id="chapter_01", n=10, policies=[GreedyPolicy()])
+    result = batch.run(max_steps=2000)
+
+    assert result.unfinished == 0
+    assert result.endings == {"scn_06_encerramento": 10}
+    # start -> delegacia -> chamado -> apartamento -> escolha final -> encerramento
+    assert (result.steps == 5).all()
+
+
+def test_policy_must_implement_choose():
+    with pytest.raises(TypeError):
+        Policy()  # type: ignore[abstract]
+
+
+def test_batch_follows_requires_and_holdings(gated_chapter):
+    gated_chapter("batch_chave", requires="has('batch_chave') and not 90 <= foco < 100")
+    script = ["2", "3", "1", "4", "2"]
+
+    engine = GameEngine(chapter_id="chapter_g")
+    engine.start()
+    for key in script:
+        state = engine.choose(key)
+    assert state.scene_id == "fim"  # "2" e "3" desabilitadas no começo: não andam
+
+    batch = BatchEngine(chapter_id="chapter_g", n=2, policies=[ScriptedPolicy(script)])
+    for _ in script:
+        batch.step()
+    assert batch.chapter.scene_ids[batch.scene[0]] == state.scene_id
+    assert batch.foco[0] == state.stats.foco
+    assert batch.items[0] == 0  # chave gasta
+
+    # aleatória só clica em habilitadas: no primeiro passo ninguém sai de "a"
+    batch = BatchEngine(chapter_id="chapter_g", n=200, policies=[RandomPolicy(seed=3)])
+    batch.step()
+    assert (batch.scene == batch.chapter.index["a"]).all()
+
+    # gulosa: "Forçar" só quando foco chega a 80
+    result = BatchEngine(chapter_id="chapter_g", n=4, policies=[GreedyPolicy()]).run(max_steps=20)
+    assert result.endings == {"fim2": 4} and (result.steps == 3).all()
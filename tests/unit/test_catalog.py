@@ -0,0 +1,41 @@
+from jogo.content import catalog, registry
+
+
+def _chapter(write_chapter, chapter_id, meta, *, goto="a"):
+    write_chapter(chapter_id, {
+        "meta": meta,
+        "entry_scene": "a",
+        "scenes": {"a": {"text": chapter_id, "actions": [{"key": "1", "label": "x", "goto": goto}]}},
+    })
+
+
+def test_discover_orders_by_meta_and_resolves_next(tmp_path, write_chapter):
+    _chapter(write_chapter, "ch_b", {"title": "B", "order": 2})
+    _chapter(write_chapter, "ch_a", {"title": "A", "order": 1, "next": "ch_c"})
+    _chapter(write_chapter, "ch_c", {"title": "C", "order": 3})
+    _chapter(write_chapter, "ch_z", {"title": "Z", "next": None})
+    (tmp_path / "vazia").mkdir()
+
+    infos = catalog.discover()
+    assert [i.id for i in infos] == ["ch_a", "ch_b", "ch_c", "ch_z"]
+    assert [i.title for i in infos] == ["A", "B", "C", "Z"]
+    assert catalog.next_chapter("ch_a") == "ch_c"  # meta.next
+    assert catalog.next_chapter("ch_b") == "ch_c"  # ordem
+    assert catalog.next_chapter("ch_z") == ""  # null = fim
+
+
+def test_warm_all_reports_failures_and_preloads_next(write_chapter):
+    _chapter(write_chapter, "ch_1", {"order": 1})
+    _chapter(write_chapter, "ch_2", {"order": 2})
+    _chapter(write_chapter, "ch_3", {"order": 3}, goto="sumiu")
+
+    report = catalog.warm_all()
+    assert sorted(report.loaded) == ["ch_1", "ch_2"]
+    assert "sumiu" in report.failed["ch_3"]
+    assert not report.ok
+
+    registry.invalidate()
+    fut = catalog.preload_next("ch_1")
+    fut.result(timeout=5)
+    assert registry.is_scene_cached("ch_2", "a")
+    assert catalog.preload_next("ch_1") is fut
@@ -0,0 +1,56 @@
+import pytest
+
+from jogo.content import registry
+from jogo.content.conditions import ConditionError, compile_condition
+from jogo.domain import GameEngine, PlayerStats, StatsSnapshot
+
+
+def test_compile_condition():
+    s = StatsSnapshot(sono=10, energia=50, foco=60, estresse=75)
+    assert compile_condition("foco >= 50 and estresse < 80")(s) is True
+    assert compile_condition("30 <= estresse < 70")(s) is False
+    assert compile_condition("not (sono < 20 or energia < 10)")(s) is False
+    assert compile_condition("foco - estresse > -20")(PlayerStats(foco=60, estresse=75)) is True
+    assert compile_condition("foco >= 50") is compile_condition("foco >= 50")  # compilada uma vez
+
+    for bad in ("", "foco >", "sorte > 1", "foco > 1.5", "__import__('os')", "foco.real > 1", "[foco][0]"):
+        with pytest.raises(ConditionError):
+            compile_condition(bad)
+
+
+def _chapter(write_chapter, requires="foco >= 50"):
+    write_chapter("chapter_c", {
+        "entry_scene": "a",
+        "scenes": {
+            "a": {"text": "Normal.",
+                  "variants": [{"when": "estresse >= 70", "text": "Tremendo ({estresse})."}],
+                  "actions": [
+                      {"key": "1", "label": "Ler", "goto": "b", "requires": requires},
+                      {"key": "2", "label": "Respirar", "goto": "a", "effects": {"estresse": -30, "foco": 30}},
+                  ]},
+            "b": {"text": "Fim.", "actions": []},
+        },
+    })
+
+
+def test_engine_disables_choices_and_picks_text_variant(write_chapter):
+    _chapter(write_chapter)
+    engine = GameEngine(chapter_id="chapter_c", stats=PlayerStats(foco=30, estresse=80))
+
+    state = engine.start()
+    assert state.text == "Tremendo (80)."
+    assert [c.enabled for c in state.choices] == [False, True]
+
+    # escolher ação desabilitada não faz nada
+    assert engine.choose("1").scene_id == "a"
+
+    state = engine.choose("2")
+    assert state.text == "Normal."
+    assert [c.enabled for c in state.choices] == [True, True]
+    assert engine.choose("1").scene_id == "b"
+
+
+def test_invalid_condition_is_a_manifest_error(write_chapter):
+    _chapter(write_chapter, requires="sorte > 3")
+    with pytest.raises(registry.ManifestError, match="sorte"):
+        registry.load_chapter("chapter_c")
@@ -0,0 +1,44 @@
+from jogo.domain import GameEngine
+
+
+def test_choose_applies_effects_and_moves():
+    engine = GameEngine(chapter_id="chapter_01")
+    state = engine.start()
+    assert state.scene_id == "scn_01_start"
+
+    state = engine.choose("1")
+    assert state.scene_id == "scn_01_loop_delegacia"
+
+    foco = state.stats.foco
+    state = engine.choose("1")  # Ler o relatório: foco +2
+    assert state.scene_id == "scn_01_loop_delegacia"
+    assert state.stats.foco == foco + 2
+
+
+def test_unknown_action_rerenders_same_scene():
+    engine = GameEngine(chapter_id="chapter_01")
+    before = engine.start()
+    after = engine.choose("nao_existe")
+    assert after.scene_id == before.scene_id
+    assert after.stats == before.stats
+
+
+def test_loop_scene_reuses_choice_table():
+    engine = GameEngine(chapter_id="chapter_01")
+    engine.start()
+    first = engine.choose("1")
+    again = engine.choose("2")
+
+    assert isinstance(first.choices, tuple)
+    assert first.choices is again.choices
+
+
+def test_stats_snapshot_is_shared_until_it_changes():
+    engine = GameEngine(chapter_id="chapter_01")
+    start = engine.start()
+    moved = engine.choose("1")  # sem effects
+    assert moved.stats is start.stats
+
+    changed = engine.choose("1")  # Ler o relatório: com effects
+    assert changed.stats is not moved.stats
+    assert not hasattr(changed, "__dict__")
@@ -0,0 +1,53 @@
+from jogo.domain import GameEngine
+from jogo.domain.explore import explore
+
+
+def test_explore_finds_ending_with_replayable_path():
+    result = explore("chapter_01", workers=1, max_depth=12)
+
+    assert "scn_06_encerramento" in result.endings
+    path = result.endings["scn_06_encerramento"]
+
+    engine = GameEngine(chapter_id="chapter_01")
+    engine.start()
+    for key in path:
+        state = engine.choose(key)
+    assert state.scene_id == "scn_06_encerramento"
+
+    foco_lo, foco_hi = result.ranges["scn_01_loop_delegacia"]["foco"]
+    assert foco_lo < 70 < foco_hi
+
+
+def test_default_caps_stop_and_report_truncation():
+    result = explore("chapter_01", workers=1, max_depth=None, max_states=5000)
+
+    assert result.truncated and result.limit == "max_states"
+    assert result.states >= 5000
+
+    capped = explore("chapter_01", workers=1, max_depth=3)
+    assert capped.truncated and capped.limit == "max_depth" and capped.depth == 3
+
+
+def test_parallel_matches_serial():
+    serial = explore("chapter_01", workers=1, max_depth=8)
+    parallel = explore("chapter_01", workers=3, max_depth=8)
+
+    assert parallel.states == serial.states
+    assert parallel.endings == serial.endings
+    assert parallel.ranges == serial.ranges
+
+
+def test_explore_follows_requires_and_holdings(gated_chapter):
+    gated_chapter("exp_chave")
+    serial = explore("chapter_g", workers=1, max_depth=6)
+    parallel = explore("chapter_g", workers=2, max_depth=6)
+
+    assert serial.endings == {"fim": ("1", "2"), "fim2": ("4", "4", "3")}
+    assert parallel.endings == serial.endings and parallel.states == serial.states
+
+    for scene_id, path in serial.endings.items():
+        engine = GameEngine(chapter_id="chapter_g")
+        engine.start()
+        for key in path:
+            state = engine.choose(key)
+        assert state.scene_id == scene_id
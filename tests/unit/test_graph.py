@@ -0,0 +1,25 @@
+import pytest
+
+from jogo.content import registry
+
+
+def test_chapter_01_graph_index():
+    graph = registry.get_graph("chapter_01")
+
+    assert graph.entry == "scn_01_start"
+    assert "scn_06_encerramento" in graph.endings
+    assert not graph.unreachable
+    assert set(graph.predecessors("scn_02_apartamento")) == {
+        "scn_01_chamado",
+        "scn_02_apartamento",
+        "scn_03_bilhete",
+    }
+
+
+def test_broken_goto_fails_at_load(write_chapter):
+    write_chapter("chapter_bad", {"entry_scene": "a", "scenes": {"a": {"actions": [
+        {"key": "1", "label": "Ir", "goto": "nao_existe"},
+    ]}}})
+
+    with pytest.raises(registry.ManifestError, match="nao_existe"):
+        registry.load_chapter("chapter_bad")
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from jogo.content import items, registry
+from jogo.content.items import CLUES, ITEMS, Interner
+from jogo.domain import GameEngine, Holdings
+
+
+def test_interner_bits_and_saves():
+    it = Interner("item")
+    mask = it.mask(["a", "b", "c"])
+    assert mask == 0b111 and it.bit("b") == 1
+    assert it.names(mask & ~(1 << it.bit("b"))) == ["a", "c"]
+    it.set_label("a", "Lanterna")
+    assert it.labels(0b1) == ["Lanterna"] and it.label("c") == "c"
+
+    held = Holdings(items=ITEMS.mask(["x_lanterna"]), clues=CLUES.mask(["x_pegada"]))
+    save = items.to_save(held.items, held.clues)
+    assert save == {"items": ["x_lanterna"], "clues": ["x_pegada"]}
+    assert items.from_save(json.loads(json.dumps(save))) == (held.items, held.clues)
+
+
+def _chapter(write_chapter, grants=None):
+    write_chapter("chapter_i", {
+        "entry_scene": "a",
+        "items": {"chave": "Chave enferrujada"},
+        "clues": {"bilhete": "Bilhete rasgado"},
+        "scenes": {
+            "a": {"text": "Sala.",
+                  "variants": [{"when": "knows('bilhete')", "text": "Sala (o bilhete fala daqui)."}],
+                  "actions": [
+                      {"key": "1", "label": "Revistar", "goto": "a",
+                       "grants": grants or {"items": ["chave"], "clues": ["bilhete"]}},
+                      {"key": "2", "label": "Abrir a porta", "goto": "b",
+                       "requires": "has('chave')", "consumes": {"items": ["chave"]}},
+                  ]},
+            "b": {"text": "Corredor.", "actions": []},
+        },
+    })
+
+
+def test_actions_grant_and_consume_and_conditions_test_them(write_chapter):
+    _chapter(write_chapter)
+    engine = GameEngine(chapter_id="chapter_i")
+
+    state = engine.start()
+    assert [c.enabled for c in state.choices] == [True, False]
+    assert state.holdings.items == 0
+
+    state = engine.choose("1")
+    assert ITEMS.labels(state.holdings.items) == ["Chave enferrujada"]
+    assert CLUES.labels(state.holdings.clues) == ["Bilhete rasgado"]
+    assert state.text == "Sala (o bilhete fala daqui)."
+    assert [c.enabled for c in state.choices] == [True, True]
+
+    state = engine.choose("2")
+    assert state.scene_id == "b"
+    assert state.holdings.items == 0  # chave gasta
+    assert CLUES.names(state.holdings.clues) == ["bilhete"]  # pista fica
+
+
+def test_invalid_grants_is_a_manifest_error(write_chapter):
+    _chapter(write_chapter, grants={"items": "chave"})
+    with pytest.raises(registry.ManifestError, match="grants"):
+        registry.load_chapter("chapter_i")
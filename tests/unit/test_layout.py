@@ -0,0 +1,185 @@
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("flet")
+
+from jogo.domain import GameEngine  # noqa: E402
+from jogo.ui_flet.headless import HeadlessPage  # noqa: E402
+from jogo.ui_flet.layout import AppLayout  # noqa: E402
+
+
+def _setup():
+    page = HeadlessPage()
+    layout = AppLayout(page)
+    engine = GameEngine(chapter_id="chapter_01")
+    layout.render(engine.start(), on_choose=lambda _k: None)
+    layout.render(engine.choose("1"), on_choose=lambda _k: None)  # entra no loop
+    return page, layout, engine
+
+
+def test_loop_click_only_touches_changed_panels():
+    page, layout, engine = _setup()
+    updates, sent = page.updates, page.controls_sent
+
+    layout.render(engine.choose("3"), on_choose=lambda _k: None)  # mesma cena, stats mudam
+
+    assert page.updates == updates + 1
+    assert page.controls_sent == sent + 1  # só o painel de status
+
+
+def test_identical_state_sends_no_update():
+    page, layout, engine = _setup()
+    updates = page.updates
+
+    layout.render(engine.choose("nao_existe"), on_choose=lambda _k: None)
+
+    assert page.updates == updates
+    assert layout.counters.renders == 3
+
+
+def test_controls_are_pooled_across_transitions():
+    page, layout, engine = _setup()
+    created = layout.controls_created
+
+    for key in ["1", "2", "3", "4", "1", "3", "2"]:
+        layout.render(engine.choose(key), on_choose=lambda _k: None)
+
+    assert layout.controls_created == created
+
+
+def test_tab_views_are_built_once_and_counted():
+    page, layout, engine = _setup()
+    created = layout.controls_created
+
+    layout.status_tabs._select("arquivo")
+    layout.status_tabs._select("local")
+    assert layout.controls_created == created + 4
+
+    for name in ("status", "arquivo", "local", "arquivo"):
+        layout.status_tabs._select(name)
+        layout.render(engine.choose("3"), on_choose=lambda _k: None)
+    assert layout.controls_created == created + 4
+
+
+def test_ticker_reveals_hint_in_constant_frames():
+    page = HeadlessPage()
+    layout = AppLayout(page)
+    ticker = layout.ticker  # HeadlessPage não roda tasks: os frames são dados à mão
+
+    for text in ("curto", "x" * 500):
+        layout.actions.set_hint(text, duration=0.5)
+        t0 = time.monotonic()
+        frames = 0
+        while ticker.tick(now=t0 + frames / 30):
+            frames += 1
+        assert layout.actions._hint_text.value == text
+        assert frames <= 15  # 0.5s * 30fps
+
+    layout.dispose()
+    assert ticker.tick() is False
+
+
+def test_animation_requires_step():
+    from jogo.ui_flet.ticker import Animation
+
+    class NoStep(Animation):
+        pass
+
+    with pytest.raises(TypeError):
+        NoStep()  # type: ignore[abstract]
+
+
+def test_debug_tab_shows_metrics_when_enabled(monkeypatch):
+    from jogo.runtime import metrics
+
+    monkeypatch.setattr(metrics, "ENABLED", True)
+    metrics.reset()
+    page, layout, engine = _setup()
+    assert layout.status_tabs._tab_debug.visible
+    layout.status_tabs._select("debug")
+    sent = page.controls_sent
+
+    layout.render(engine.choose("3"), on_choose=lambda _k: None)
+
+    assert "engine.choose" in layout.status_tabs._debug_text.value
+    assert page.controls_sent == sent + 2  # status + view de debug
+    metrics.reset()
+
+
+def test_arquivo_keeps_clues_with_metrics_enabled(monkeypatch):
+    from jogo.content.items import CLUES
+    from jogo.domain import Holdings
+    from jogo.runtime import metrics
+
+    monkeypatch.setattr(metrics, "ENABLED", True)
+    metrics.reset()
+    page = HeadlessPage()
+    layout = AppLayout(page)
+    engine = GameEngine(chapter_id="chapter_01", holdings=Holdings(clues=CLUES.mask(["l_pegada"])))
+    layout.render(engine.start(), on_choose=lambda _k: None)
+
+    layout.status_tabs._select("arquivo")
+    layout.render(engine.choose("1"), on_choose=lambda _k: None)
+
+    assert "l_pegada" in layout.status_tabs._arquivo_text.value
+    assert "engine.choose" not in layout.status_tabs._arquivo_text.value
+    metrics.reset()
+
+
+def test_holdings_fill_mochila_and_arquivo():
+    from jogo.content.items import CLUES, ITEMS
+    from jogo.domain import Holdings
+
+    page = HeadlessPage()
+    layout = AppLayout(page)
+    engine = GameEngine(
+        chapter_id="chapter_01",
+        holdings=Holdings(items=ITEMS.mask(["l_lanterna"]), clues=CLUES.mask(["l_pegada"])),
+    )
+    layout.render(engine.start(), on_choose=lambda _k: None)
+
+    assert "l_lanterna" in layout.actions._inventory
+    layout.status_tabs._select("arquivo")
+    assert "l_pegada" in layout.status_tabs._arquivo_text.value
+
+
+def test_web_session_sends_image_bytes():
+    page = HeadlessPage(web=True)
+    layout = AppLayout(page)
+    state = GameEngine(chapter_id="chapter_01").start()
+    assert state.image_path
+
+    layout.render(state, on_choose=lambda _k: None)
+
+    src = layout.scene._img.src
+    assert isinstance(src, bytes) and src == Path(state.image_path).read_bytes()
+    # desktop continua com o caminho (variante em disco)
+    desktop = AppLayout(HeadlessPage())
+    desktop.render(state, on_choose=lambda _k: None)
+    assert desktop.scene._img.src == state.image_path
+
+
+def test_session_autosaves_and_resumes(tmp_path):
+    from jogo.runtime.config import AppConfig
+    from jogo.ui_flet.main import start_session
+
+    class Page(HeadlessPage):
+        def run_task(self, handler, *args, **kwargs):
+            asyncio.run(handler(*args, **kwargs))
+            return super().run_task(handler, *args, **kwargs)
+
+    cfg = AppConfig(save_dir=str(tmp_path / "save"), preload_next_chapter=False)
+    page = Page()
+    layout = start_session(page, cfg)
+    entry = layout._state.scene_id
+    layout.actions._on_choose("1")
+    scene_id = layout._state.scene_id
+    assert scene_id != entry
+    page.on_disconnect(None)
+
+    resumed = start_session(Page(), cfg)
+    assert resumed._state.scene_id == scene_id
+    resumed.dispose()
@@ -0,0 +1,114 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from jogo.content import prefetch, registry
+from jogo.content.assets import ImagePipeline
+from jogo.content.manifest_index import INDEX_FILENAME, StreamingManifest
+from jogo.domain import GameEngine
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "tools" / "scripts"))
+from gen_chapter import generate  # noqa: E402
+
+
+@pytest.fixture
+def streaming(tmp_path, write_chapter):
+    registry.configure_streaming(0)
+    yield tmp_path
+    registry.configure_streaming(registry.AppConfig().streaming_manifest_bytes)
+
+
+def test_offsets_match_full_decode(tmp_path):
+    path = generate(tmp_path / "synth", scenes=200, branching=3, loop_density=0.3, seed=3)
+    full = json.loads(path.read_text(encoding="utf-8"))
+
+    m = StreamingManifest(path)
+    assert m.entry_scene == full["entry_scene"]
+    assert dict(m.meta) == full["meta"]
+    assert list(m.scene_ids()) == list(full["scenes"])
+    assert all(m.raw_scene(sid) == raw for sid, raw in full["scenes"].items())
+    assert m.raw_scene("nao_existe") is None
+    m.close()
+
+    # índice persistido: o próximo launch não varre de novo
+    assert (path.parent / INDEX_FILENAME).exists()
+    again = StreamingManifest(path)
+    assert again.from_index
+    assert again.raw_scene("scn_000007") == full["scenes"]["scn_000007"]
+    again.close()
+
+
+def test_registry_streams_large_manifest(streaming):
+    generate(streaming / "synth", scenes=120, branching=2, loop_density=0.2, seed=9)
+
+    chapter = registry.load_chapter("synth")
+    assert chapter.graph is None
+    assert chapter.scenes.decoded == 0
+
+    engine = GameEngine(chapter_id="synth")
+    state = engine.start()
+    assert state.scene_id == "scn_000000"
+    state = engine.choose(state.choices[0].key)
+    assert 0 < chapter.scenes.decoded < 120
+
+    graph = registry.get_graph("synth")
+    assert len(graph.reachable) == 120 and not graph.broken
+    assert registry.get_graph("synth") is graph
+
+
+def test_first_render_prefetch_decodes_only_neighbours(streaming, tmp_path):
+    generate(streaming / "synth", scenes=2000, branching=3, loop_density=0.2, seed=5)
+    chapter = registry.load_chapter("synth")
+
+    state = GameEngine(chapter_id="synth").start()
+    # o que start_session/AppLayout.render fazem depois do primeiro render
+    prefetcher = prefetch.ScenePrefetcher()
+    prefetcher.schedule("synth", state.scene_id)
+    pipeline = ImagePipeline(tmp_path / "cache")
+    pipeline.prefetch("synth", state.scene_id, 480)
+    prefetcher.close()
+    pipeline.shutdown()
+
+    assert registry.get_successors("synth", state.scene_id) == tuple(
+        dict.fromkeys(c.goto for c in registry.get_scene("synth", state.scene_id).actions)
+    )
+    assert chapter.scenes.decoded <= 1 + len(state.choices)
+
+
+def test_reload_closes_previous_streaming_manifest(streaming):
+    path = generate(streaming / "synth", scenes=50, branching=2, loop_density=0.2, seed=4)
+    old = registry.load_chapter("synth")
+
+    # streaming não hasheia: mtime novo já é outra versão
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+    new = registry.load_chapter("synth")
+
+    assert new is not old
+    assert old.scenes._manifest._file.closed
+    assert not new.scenes._manifest._file.closed
+
+
+def test_broken_goto_in_streaming_mode_leaves_engine_usable(streaming, write_chapter):
+    write_chapter("quebrado", {
+        "entry_scene": "a",
+        "scenes": {
+            "a": {"text": "A.", "actions": [
+                {"key": "1", "label": "Buraco", "goto": "nao_existe", "effects": {"foco": -10}},
+                {"key": "2", "label": "Seguir", "goto": "b"},
+            ]},
+            "b": {"text": "B.", "actions": []},
+        },
+    })
+    engine = GameEngine(chapter_id="quebrado")
+    before = engine.start()
+
+    with pytest.raises(registry.SceneNotFoundError):
+        engine.choose("1")
+    assert engine.scene_id == "a"
+    assert engine.snapshot() == before.stats
+
+    assert engine.choose("2").scene_id == "b"
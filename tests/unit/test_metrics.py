@@ -0,0 +1,37 @@
+import json
+
+from jogo.domain import GameEngine
+from jogo.runtime import metrics
+
+
+def test_disabled_records_nothing(monkeypatch):
+    monkeypatch.setattr(metrics, "ENABLED", False)
+    metrics.reset()
+    engine = GameEngine(chapter_id="chapter_01")
+    engine.start()
+    engine.choose("1")
+    snap = metrics.snapshot()
+    assert snap["timers"] == {} and snap["visits"] == {}
+
+
+def test_enabled_exports_json_and_prometheus(monkeypatch):
+    monkeypatch.setattr(metrics, "ENABLED", True)
+    metrics.reset()
+    engine = GameEngine(chapter_id="chapter_01")
+    engine.start()
+    engine.choose("1")
+    engine.choose("1")
+    engine.choose("nao_existe")
+
+    snap = json.loads(metrics.to_json())
+    assert snap["timers"]["engine.choose"]["count"] == 2
+    assert snap["timers"]["registry.get_scene"]["count"] >= 3
+    assert snap["counters"]["engine.choose.unknown_key"] == 1
+    assert snap["visits"]["chapter_01/scn_01_loop_delegacia"] == 2
+    assert 0.0 <= snap["gauges"]["registry.text_cache.hit_rate"] <= 1.0
+
+    prom = metrics.to_prometheus()
+    assert 'jogo_engine_choose_seconds_bucket{le="+Inf"} 2' in prom
+    assert 'jogo_scene_visits_total{chapter="chapter_01",scene="scn_01_start"} 1' in prom
+    assert "# TYPE jogo_registry_text_cache_hit_rate gauge" in prom
+    metrics.reset()
@@ -0,0 +1,114 @@
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from jogo.content import registry
+from jogo.content.pack import PACK_FILENAME, ChapterPack
+from jogo.content.packer import compile_chapter
+from jogo.domain import GameEngine
+
+
+def _make_chapter(write_chapter):
+    return write_chapter(
+        "chapter_p",
+        {
+            "meta": {"id": "chapter_p"},
+            "entry_scene": "a",
+            "scenes": {
+                "a": {"text_file": "ascii/a.txt", "image": "images/a.png",
+                      "actions": [{"key": "1", "label": "Ir", "goto": "b"}]},
+                "b": {"text_file": "ascii/b.txt", "actions": []},
+                "c": {"text": "inline", "actions": []},
+            },
+        },
+        files={
+            "ascii/a.txt": "ARTE " * 200,
+            "ascii/b.txt": "ARTE " * 200,
+            "images/a.png": b"\x89PNG fake",
+        },
+    )
+
+
+def test_pack_roundtrip_and_dedup(write_chapter):
+    chapter = _make_chapter(write_chapter)
+
+    loose = {sid: registry.get_scene("chapter_p", sid) for sid in ("a", "b", "c")}
+    out = compile_chapter("chapter_p", compress=True)
+    assert out == chapter / PACK_FILENAME
+
+    pack = ChapterPack(out)
+    # a.txt e b.txt têm o mesmo conteúdo -> um blob só
+    assert pack.scenes["a"].text == pack.scenes["b"].text
+    assert isinstance(pack.image("a"), memoryview)
+    pack.close()
+
+    assert registry.load_chapter("chapter_p").pack is not None
+    for scene_id, scene in loose.items():
+        packed = registry.get_scene("chapter_p", scene_id)
+        assert packed.text == scene.text
+        assert packed.actions == scene.actions
+    assert bytes(registry.get_image_bytes("chapter_p", "a")) == b"\x89PNG fake"
+
+
+def test_pack_load_does_not_read_whole_file(write_chapter, monkeypatch):
+    _make_chapter(write_chapter)
+    out = compile_chapter("chapter_p")
+
+    read = []
+    real = Path.read_bytes
+    monkeypatch.setattr(Path, "read_bytes", lambda self: read.append(self.name) or real(self))
+    assert registry.load_chapter("chapter_p").pack is not None
+    assert registry.load_chapter("chapter_p").pack is not None
+    assert out.name not in read
+
+
+def test_edits_after_build_pack_win_over_stale_pack(write_chapter):
+    chapter = _make_chapter(write_chapter)
+    compile_chapter("chapter_p")
+    assert registry.load_chapter("chapter_p").pack is not None
+
+    # mesmo conteúdo, mtime novo (checkout/cópia): o pack continua valendo
+    manifest = chapter / "manifest.json"
+    os.utime(manifest, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert registry.load_chapter("chapter_p").pack is not None
+
+    packed = registry.load_chapter("chapter_p").pack
+    manifest.write_text(manifest.read_text(encoding="utf-8").replace('"inline"', '"editado"'), encoding="utf-8")
+    loaded = registry.load_chapter("chapter_p")
+    assert loaded.pack is None
+    assert packed._file.closed  # versão substituída não segura o mmap
+    assert registry.get_scene("chapter_p", "c").text == "editado"
+    assert registry.load_chapter("chapter_p") is loaded  # pack velho não força recarga a cada chamada
+
+    # pack reconstruído volta a valer; editar um text_file deixa velho de novo
+    compile_chapter("chapter_p")
+    assert registry.load_chapter("chapter_p").pack is not None
+    (chapter / "ascii" / "a.txt").write_text("NOVA ARTE", encoding="utf-8")
+    registry.invalidate("chapter_p")
+    assert registry.load_chapter("chapter_p").pack is None
+    assert registry.get_scene("chapter_p", "a").text == "NOVA ARTE"
+
+
+def test_pack_only_chapter_shows_images(write_chapter):
+    pytest.importorskip("flet")
+    from jogo.ui_flet.widgets.scene_panel import ScenePanel
+
+    chapter = _make_chapter(write_chapter)
+    compile_chapter("chapter_p")
+    # distribuído só com o pack: nenhum arquivo solto
+    for child in chapter.iterdir():
+        if child.is_dir():
+            shutil.rmtree(child)
+        elif child.name != PACK_FILENAME:
+            child.unlink()
+
+    state = GameEngine(chapter_id="chapter_p").start()
+    assert state.image_path and not Path(state.image_path).exists()
+
+    panel = ScenePanel()
+    img = panel.render(state)
+    assert img.src == b"\x89PNG fake"
+    assert img.visible
@@ -0,0 +1,32 @@
+import threading
+
+from jogo.runtime.pools import LazyPool
+
+
+def test_pool_is_created_on_first_submit():
+    pool = LazyPool(2, "teste")
+    assert pool._pool is None
+    assert pool.submit(lambda: 42).result() == 42
+    assert pool.executor()._max_workers == 2
+    pool.shutdown(wait=True)
+
+
+def test_resize_after_creation_switches_pool_and_keeps_queued_jobs():
+    pool = LazyPool(1, "teste")
+    gate = threading.Event()
+    first = pool.submit(gate.wait)
+    queued = pool.submit(lambda: "fila")
+    old = pool.executor()
+
+    pool.resize(3)
+    assert pool.workers == 3
+    assert pool.executor() is not old
+    assert pool.executor()._max_workers == 3
+
+    gate.set()
+    assert first.result(timeout=5) is True
+    assert queued.result(timeout=5) == "fila"  # o pool antigo termina a fila
+    before = pool.executor()
+    pool.resize(3)
+    assert pool.executor() is before
+    pool.shutdown(wait=True)
@@ -0,0 +1,57 @@
+import time
+
+from jogo.content import prefetch, registry
+
+
+def _make_chapter(write_chapter):
+    write_chapter(
+        "chapter_f",
+        {
+            "entry_scene": "a",
+            "scenes": {
+                "a": {"text": "A", "actions": [
+                    {"key": "1", "label": "B", "goto": "b"},
+                    {"key": "2", "label": "C", "goto": "c"},
+                ]},
+                "b": {"text_file": "ascii/b.txt", "actions": [{"key": "1", "label": "D", "goto": "d"}]},
+                "c": {"text_file": "ascii/c.txt", "actions": []},
+                "d": {"text_file": "ascii/d.txt", "actions": []},
+            },
+        },
+        files={f"ascii/{sid}.txt": sid.upper() * 10 for sid in ("b", "c", "d")},
+    )
+
+
+def _idle(p, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while p._jobs and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_prefetch_warms_neighbours_and_counts_hits(write_chapter):
+    _make_chapter(write_chapter)
+    registry.load_chapter("chapter_f")
+
+    p = prefetch.ScenePrefetcher()
+    p.schedule("chapter_f", "a")
+    _idle(p)
+    assert registry.is_scene_cached("chapter_f", "b")
+    assert registry.is_scene_cached("chapter_f", "c")
+    assert not registry.is_scene_cached("chapter_f", "d")
+    assert p.stats.scheduled == 2 and p.stats.completed == 2
+
+    # jogador vai para b: estava prevista e quente
+    p.schedule("chapter_f", "b")
+    assert p.stats.hits == 1 and p.stats.misses == 0
+    p.close()
+
+
+def test_prefetch_queue_is_bounded(write_chapter):
+    _make_chapter(write_chapter)
+
+    p = prefetch.ScenePrefetcher(max_pending=1)
+    p.schedule("chapter_f", "a")
+    assert p.stats.scheduled + p.stats.dropped == 2
+    assert p.stats.scheduled >= 1
+    _idle(p)
+    p.close()
@@ -20,3 +20,29 @@ def test_get_scene_returns_scene_data():
     assert scn.id == entry
     assert isinstance(scn.text, str)
     assert isinstance(scn.actions, list)
+
+
+def test_get_scene_is_served_from_cache():
+    registry.invalidate()
+    registry.reset_cache_stats()
+
+    entry = registry.get_entry_scene_id("chapter_01")
+    first = registry.get_scene("chapter_01", entry)
+    again = registry.get_scene("chapter_01", entry)
+
+    assert first is again
+    stats = registry.cache_stats()
+    assert stats.misses == 1
+    assert stats.hits >= 2
+
+
+def test_chapter_reloads_when_manifest_changes(write_chapter):
+    chapter = write_chapter("chapter_x", {"entry_scene": "a", "scenes": {"a": {"text": "v1", "actions": []}}})
+
+    assert registry.load_chapter("chapter_x").scenes["a"].text == "v1"
+
+    (chapter / "manifest.json").write_text(
+        '{"entry_scene": "a", "scenes": {"a": {"text": "v2 editado", "actions": []}}}',
+        encoding="utf-8",
+    )
+    assert registry.load_chapter("chapter_x").scenes["a"].text == "v2 editado"
@@ -0,0 +1,111 @@
+import json
+
+from jogo.content import registry
+from jogo.domain import GameEngine
+from jogo.runtime.saves import SaveJournal
+
+
+def _play(journal, engine, keys):
+    for key in keys:
+        state = journal.choose(engine, key)
+    return state
+
+
+def test_load_replays_journal_tail(tmp_path):
+    engine = GameEngine(chapter_id="chapter_01")
+    engine.start()
+    journal = SaveJournal(tmp_path, compact_every=1000)
+    journal.new_game(engine)
+
+    state = _play(journal, engine, ["1", "1", "3", "2", "4", "1"])
+    journal.close()
+
+    restored = SaveJournal(tmp_path).load()
+    again = restored.start()
+    assert again.scene_id == state.scene_id
+    assert again.stats == state.stats
+
+
+def test_compaction_keeps_journal_bounded(tmp_path):
+    engine = GameEngine(chapter_id="chapter_01")
+    engine.start()
+    journal = SaveJournal(tmp_path, compact_every=8)
+    journal.new_game(engine)
+
+    state = _play(journal, engine, ["1"] + ["3"] * 50)
+    journal.close()
+
+    logs = list(tmp_path.glob("journal.*.log"))
+    assert len(logs) == 1
+    assert len(logs[0].read_text(encoding="utf-8").splitlines()) < 8
+
+    restored = SaveJournal(tmp_path).load().start()
+    assert restored.stats == state.stats
+
+
+def test_truncated_tail_is_ignored(tmp_path):
+    engine = GameEngine(chapter_id="chapter_01")
+    engine.start()
+    journal = SaveJournal(tmp_path)
+    journal.new_game(engine)
+    state = _play(journal, engine, ["1"])
+    journal.close()
+
+    log = next(tmp_path.glob("journal.*.log"))
+    with log.open("a", encoding="utf-8") as f:
+        f.write('"4')  # append interrompido
+
+    restored = SaveJournal(tmp_path).load().start()
+    assert restored.scene_id == state.scene_id
+
+
+def test_holdings_survive_compaction_and_load(tmp_path, write_chapter):
+    write_chapter("chapter_i", {
+        "entry_scene": "a",
+        "scenes": {
+            "a": {"text": "Sala.", "actions": [
+                {"key": "1", "label": "Pegar", "goto": "b", "grants": {"items": ["save_lanterna"]}},
+            ]},
+            "b": {"text": "Porão.", "actions": [
+                {"key": "1", "label": "Descer", "goto": "c", "requires": "has('save_lanterna')"},
+            ]},
+            "c": {"text": "Fundo.", "actions": []},
+        },
+    })
+
+    saves = tmp_path / "save"
+    engine = GameEngine(chapter_id="chapter_i")
+    journal = SaveJournal(saves, compact_every=1)
+    journal.new_game(engine)
+    state = journal.choose(engine, "1")  # compacta logo depois
+    assert state.choices[0].enabled
+    journal.close()
+
+    snapshot = json.loads((saves / "snapshot.json").read_text(encoding="utf-8"))
+    assert snapshot["holdings"] == {"items": ["save_lanterna"], "clues": []}
+
+    restored = SaveJournal(saves).load()
+    again = restored.start()
+    assert again.holdings == state.holdings
+    assert again.choices[0].enabled
+    assert restored.choose("1").scene_id == "c"
+
+
+def test_resume_falls_back_to_new_game(tmp_path):
+    journal = SaveJournal(tmp_path)
+    assert journal.resume("chapter_01").scene_id == registry.get_entry_scene_id("chapter_01")
+    engine = GameEngine(chapter_id="chapter_01")
+    engine.start()
+    state = _play(journal, engine, ["1", "1"])
+    journal.close()
+
+    assert SaveJournal(tmp_path).resume("chapter_01").scene_id == state.scene_id
+
+    # save de um capítulo que não existe mais: jogo novo, gravado por cima
+    snapshot = json.loads((tmp_path / "snapshot.json").read_text(encoding="utf-8"))
+    snapshot["chapter_id"] = "chapter_removido"
+    (tmp_path / "snapshot.json").write_text(json.dumps(snapshot), encoding="utf-8")
+    journal = SaveJournal(tmp_path)
+    assert journal.resume("chapter_01").chapter_id == "chapter_01"
+    journal.close()
+    assert SaveJournal(tmp_path).load().chapter_id == "chapter_01"
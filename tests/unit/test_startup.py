@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from jogo.runtime import startup
+
+
+def test_mark_keeps_first_occurrence():
+    first = startup.mark("teste_fase")
+    startup.mark("teste_fase")
+    assert startup.marks()["teste_fase"] == first
+
+
+def test_import_breakdown_groups_by_top_package():
+    ranked, total = startup.import_breakdown("jogo.domain")
+    names = [name for name, _ms in ranked]
+    assert "jogo" in names
+    assert total >= sum(ms for _name, ms in ranked) - 1e-6
+    # registry não puxa flet nem Pillow
+    assert "flet" not in names and "PIL" not in names
+
+
+def test_ui_entry_point_defers_session_modules():
+    pytest.importorskip("flet")
+    loaded = subprocess.run(
+        [sys.executable, "-c", "import sys, jogo.ui_flet.main; print(' '.join(sorted(sys.modules)))"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(startup.__file__).resolve().parents[2])},
+        check=True,
+    ).stdout.split()
+    # só o flet antes da janela: widgets, engine e registry ficam para preload_modules
+    for name in ("jogo.ui_flet.layout", "jogo.domain", "jogo.content.registry", "jogo.content.assets"):
+        assert name not in loaded
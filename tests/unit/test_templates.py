@@ -0,0 +1,36 @@
+from jogo.content.templates import compile_template
+from jogo.domain import GameEngine, PlayerStats, StatsSnapshot
+
+
+def test_compile_and_render():
+    assert compile_template("sem stats") is None
+    # chaves que não são template ficam literais
+    assert compile_template("arte { } {foo}") is None
+
+    t = compile_template("Foco {foco}. {estresse>=70?Mãos tremem.|Respira.} {x}")
+    assert t.render(StatsSnapshot(foco=50, estresse=80)) == "Foco 50. Mãos tremem. {x}"
+    assert t.render(StatsSnapshot(foco=50, estresse=10)) == "Foco 50. Respira. {x}"
+    assert compile_template("{sono<10?zzz}").render(StatsSnapshot(sono=50)) == ""
+
+
+def test_engine_renders_text_and_hints_with_live_stats(write_chapter):
+    write_chapter(
+        "chapter_t",
+        {
+            "entry_scene": "a",
+            "scenes": {
+                "a": {"text": "Estresse: {estresse}", "actions": [
+                    {"key": "1", "label": "Ir", "goto": "b", "hint": "foco {foco}", "effects": {"estresse": 40}},
+                ]},
+                "b": {"text_file": "ascii/b.txt", "actions": []},
+            },
+        },
+        files={"ascii/b.txt": "{estresse>50?Pânico.|Calma.}"},
+    )
+
+    engine = GameEngine(chapter_id="chapter_t", stats=PlayerStats(estresse=20, foco=33))
+    state = engine.start()
+    assert state.text == "Estresse: 20"
+    assert state.choices[0].hint == "foco 33"
+
+    assert engine.choose("1").text == "Pânico."
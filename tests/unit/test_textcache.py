@@ -0,0 +1,33 @@
+from jogo.content import registry
+from jogo.content.textcache import ByteLRU
+
+
+def test_byte_lru_evicts_by_weight():
+    lru = ByteLRU(max_bytes=10)
+    for key in "abc":
+        lru.get(key, lambda k=key: (k * 4, 4, None))
+
+    stats = lru.stats()
+    assert stats.bytes <= 10
+    assert stats.evictions == 1
+    assert lru.peek("a") is None
+    assert lru.peek("c") == "cccc"
+
+
+def test_text_file_loaded_lazily_and_cached():
+    registry.invalidate()
+    registry.reset_cache_stats()
+
+    chapter = registry.load_chapter("chapter_01")
+    entry = registry.get_entry_scene_id("chapter_01")
+    assert chapter.scenes[entry].text == ""  # só metadados
+
+    first = registry.get_scene("chapter_01", entry)
+    again = registry.get_scene("chapter_01", entry)
+    assert first.text != ""
+    assert first is again
+
+    stats = registry.text_cache_stats()
+    assert stats.misses == 1
+    assert stats.hits == 1
+    assert stats.bytes == len(first.text.encode("utf-8"))
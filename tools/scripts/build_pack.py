@@ -0,0 +1,27 @@
+"""
+Compila um capítulo em chapter.pack (arquivo único, carregado via mmap).
+
+Uso:
+    python tools/scripts/build_pack.py chapter_01 [--compress] [--out caminho.pack]
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from jogo.content.packer import compile_chapter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("chapter_id")
+    parser.add_argument("--compress", action="store_true", help="zlib nos blobs (quando compensa)")
+    parser.add_argument("--out", type=Path, default=None)
+    args = parser.parse_args()
+
+    out = compile_chapter(args.chapter_id, compress=args.compress, out=args.out)
+    print(f"pack gerado: {out} ({out.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
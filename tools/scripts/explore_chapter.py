@@ -0,0 +1,64 @@
+"""
+Explora o espaço de estados (cena, stats) de um capítulo e imprime:
+finais alcançáveis, caminho mais curto até cada um e faixa de stats por cena.
+
+Uso:
+    python tools/scripts/explore_chapter.py chapter_01 [--workers 8] [--max-depth 30] [--max-states 5000000]
+
+Loops que mudam stats deixam o espaço infinito: a busca para nos tetos
+(default: profundidade 24, 2M estados) e avisa quando truncou.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from jogo.domain.explore import DEFAULT_MAX_DEPTH, DEFAULT_MAX_STATES, explore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("chapter_id")
+    parser.add_argument("--workers", type=int, default=None, help="processos (default: nº de CPUs)")
+    parser.add_argument("--max-depth", type=int, default=DEFAULT_MAX_DEPTH, help="0 = sem teto")
+    parser.add_argument("--max-states", type=int, default=DEFAULT_MAX_STATES, help="0 = sem teto")
+    parser.add_argument("--json", action="store_true", help="saída em JSON")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    result = explore(
+        args.chapter_id,
+        max_depth=args.max_depth or None,
+        max_states=args.max_states or None,
+        workers=args.workers,
+    )
+    elapsed = time.perf_counter() - t0
+
+    if args.json:
+        print(json.dumps({
+            "chapter_id": result.chapter_id,
+            "states": result.states,
+            "depth": result.depth,
+            "truncated": result.truncated,
+            "limit": result.limit,
+            "seconds": round(elapsed, 3),
+            "endings": {k: list(v) for k, v in result.endings.items()},
+            "ranges": result.ranges,
+        }, ensure_ascii=False, indent=2))
+        return
+
+    print(f"{result.chapter_id}: {result.states} estados, profundidade {result.depth} em {elapsed:.2f}s")
+    if result.truncated:
+        print(f"  truncado em {result.limit} (aumente --max-depth/--max-states; finais mais fundos não aparecem)")
+    print("\nFinais alcançáveis:")
+    for scene_id, path in result.endings.items():
+        print(f"  {scene_id}: {len(path)} passos -> {' '.join(path)}")
+    print("\nFaixa de stats por cena:")
+    for scene_id, ranges in result.ranges.items():
+        cols = "  ".join(f"{name} {lo}..{hi}" for name, (lo, hi) in ranges.items())
+        print(f"  {scene_id}: {cols}")
+
+
+if __name__ == "__main__":
+    main()
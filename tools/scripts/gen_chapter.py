@@ -0,0 +1,205 @@
+"""
+Gera capítulos sintéticos (chapter-manifest/v1) para testes de escala.
+
+Estrutura:
+- árvore de alcance: cena i (> 0) é filha de (i - 1) // branching  -> tudo alcançável a partir da entrada
+- loops: com probabilidade --loop-density, a cena ganha uma ação que volta
+  para ela mesma ou para um ancestral
+- folhas sem loop viram finais (sem ações)
+- texto inline ou text_file (--text-file-ratio), com tamanho em --ascii-bytes MIN:MAX
+- efeitos por ação sorteados de --effects none:PESO,light:PESO,heavy:PESO
+- condições: com probabilidade --requires-ratio a ação ganha um "requires"
+  (ex.: "foco >= 40 and estresse < 75")
+
+Mesma seed = mesmo capítulo, byte a byte.
+
+Uso:
+    python tools/scripts/gen_chapter.py --out /tmp/chapters/synth_10k --scenes 10000 \\
+        [--branching 3] [--loop-density 0.1] [--text-file-ratio 0.5] \\
+        [--ascii-bytes 256:4096] [--effects none:0.5,light:0.4,heavy:0.1] \\
+        [--requires-ratio 0.0] [--seed 1]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+STATS = ("sono", "energia", "foco", "estresse")
+MAX_SCENES = 100_000
+
+# (quantos stats mexe, faixa do delta)
+_EFFECT_KINDS = {
+    "none": (0, (0, 0)),
+    "light": (1, (1, 2)),
+    "heavy": (2, (3, 8)),
+}
+
+_ASCII = " .:-=+*#%@|/\\_"
+
+
+def scene_id(i: int) -> str:
+    return f"scn_{i:06d}"
+
+
+def parse_effects(spec: str) -> List[Tuple[str, float]]:
+    out: List[Tuple[str, float]] = []
+    for part in spec.split(","):
+        name, _, weight = part.partition(":")
+        name = name.strip()
+        if name not in _EFFECT_KINDS:
+            raise ValueError(f"tipo de efeito desconhecido: {name!r} (use none, light, heavy)")
+        out.append((name, float(weight or 1)))
+    return out
+
+
+def parse_range(spec: str) -> Tuple[int, int]:
+    lo, _, hi = spec.partition(":")
+    a, b = int(lo), int(hi or lo)
+    if a < 1 or b < a:
+        raise ValueError(f"faixa inválida: {spec!r}")
+    return a, b
+
+
+def _ascii_pool(rng: random.Random, size: int = 1 << 16) -> str:
+    """Bloco de "arte" sorteado uma vez; os textos são fatias dele (gerar 100k cenas é rápido)."""
+    width = 60
+    chars = "".join(rng.choice(_ASCII) for _ in range(size))
+    return "\n".join(chars[i : i + width] for i in range(0, size, width))
+
+
+def _ascii_block(rng: random.Random, pool: str, size: int) -> str:
+    size = min(size, len(pool))
+    start = rng.randrange(0, len(pool) - size + 1)
+    return pool[start : start + size]
+
+
+def _effects(rng: random.Random, kinds: List[Tuple[str, float]]) -> Optional[Dict[str, int]]:
+    kind = rng.choices([k for k, _ in kinds], weights=[w for _, w in kinds])[0]
+    count, (lo, hi) = _EFFECT_KINDS[kind]
+    if count == 0:
+        return None
+    return {stat: rng.choice((-1, 1)) * rng.randint(lo, hi) for stat in rng.sample(STATS, count)}
+
+
+def _requires(rng: random.Random) -> str:
+    parts = []
+    for stat in rng.sample(STATS, rng.randint(1, 2)):
+        if rng.random() < 0.5:
+            parts.append(f"{stat} >= {rng.randint(10, 60)}")
+        else:
+            parts.append(f"{stat} < {rng.randint(50, 95)}")
+    return " and ".join(parts)
+
+
+def generate(
+    out: Path,
+    *,
+    scenes: int = 1000,
+    branching: int = 3,
+    loop_density: float = 0.1,
+    text_file_ratio: float = 0.5,
+    ascii_bytes: Tuple[int, int] = (256, 4096),
+    effects: str = "none:0.5,light:0.4,heavy:0.1",
+    requires_ratio: float = 0.0,
+    seed: int = 1,
+    chapter_id: Optional[str] = None,
+) -> Path:
+    """Escreve manifest.json (+ ascii/*.txt) em `out`. Retorna o caminho do manifest."""
+    if not 1 <= scenes <= MAX_SCENES:
+        raise ValueError(f"scenes deve estar entre 1 e {MAX_SCENES}")
+    if branching < 1:
+        raise ValueError("branching deve ser >= 1")
+
+    rng = random.Random(seed)
+    kinds = parse_effects(effects)
+    pool = _ascii_pool(rng)
+    out = Path(out)
+    ascii_dir = out / "ascii"
+    ascii_dir.mkdir(parents=True, exist_ok=True)
+
+    children: List[List[int]] = [[] for _ in range(scenes)]
+    parent = [-1] * scenes
+    for i in range(1, scenes):
+        parent[i] = (i - 1) // branching
+        children[parent[i]].append(i)
+
+    raw_scenes: Dict[str, Any] = {}
+    for i in range(scenes):
+        actions: List[Dict[str, Any]] = []
+        for n, child in enumerate(children[i], start=1):
+            actions.append({"key": str(n), "label": f"Seguir para {child}", "goto": scene_id(child)})
+
+        if rng.random() < loop_density:
+            # volta para si mesma ou para um ancestral (ciclo no grafo)
+            target, hops = i, rng.randint(0, 3)
+            while hops and parent[target] >= 0:
+                target, hops = parent[target], hops - 1
+            actions.append({"key": str(len(actions) + 1), "label": "Voltar", "goto": scene_id(target)})
+
+        for a in actions:
+            fx = _effects(rng, kinds)
+            if fx:
+                a["effects"] = fx
+            if rng.random() < 0.3:
+                a["hint"] = f"Pressentimento {rng.randint(1, 999)}."
+            # só sorteia com ratio > 0: capítulos sem condições saem iguais aos de antes
+            if requires_ratio and rng.random() < requires_ratio:
+                a["requires"] = _requires(rng)
+
+        scene: Dict[str, Any] = {"actions": actions}
+        size = rng.randint(*ascii_bytes)
+        if rng.random() < text_file_ratio:
+            rel = f"ascii/{scene_id(i)}.txt"
+            (out / rel).write_text(_ascii_block(rng, pool, size), encoding="utf-8")
+            scene["text_file"] = rel
+        else:
+            scene["text"] = _ascii_block(rng, pool, size)
+        raw_scenes[scene_id(i)] = scene
+
+    manifest = {
+        "schema": "chapter-manifest/v1",
+        "meta": {
+            "id": chapter_id or out.name,
+            "title": f"Sintético ({scenes} cenas, seed {seed})",
+            "version": 1,
+        },
+        "entry_scene": scene_id(0),
+        "scenes": raw_scenes,
+    }
+    path = out / "manifest.json"
+    path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding="utf-8")
+    return path
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", type=Path, required=True, help="pasta do capítulo (nome = id)")
+    parser.add_argument("--scenes", type=int, default=1000)
+    parser.add_argument("--branching", type=int, default=3)
+    parser.add_argument("--loop-density", type=float, default=0.1)
+    parser.add_argument("--text-file-ratio", type=float, default=0.5)
+    parser.add_argument("--ascii-bytes", default="256:4096", help="MIN:MAX bytes por texto")
+    parser.add_argument("--effects", default="none:0.5,light:0.4,heavy:0.1")
+    parser.add_argument("--requires-ratio", type=float, default=0.0, help="fração das ações com 'requires'")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    path = generate(
+        args.out,
+        scenes=args.scenes,
+        branching=args.branching,
+        loop_density=args.loop_density,
+        text_file_ratio=args.text_file_ratio,
+        ascii_bytes=parse_range(args.ascii_bytes),
+        effects=args.effects,
+        requires_ratio=args.requires_ratio,
+        seed=args.seed,
+    )
+    print(f"capítulo gerado: {path} ({path.stat().st_size} bytes, {args.scenes} cenas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Load test do modo multi-sessão: N sessões simultâneas clicando em escolhas.
+
+Cada sessão = GameEngine + (opcional) AppLayout sobre uma HeadlessPage,
+todas compartilhando o mesmo cache do registry.
+Mede latência por clique (choose + render) e memória por sessão.
+
+Uso:
+    python tools/scripts/loadtest.py --sessions 200 --clicks 100 [--ui] [--workers 32] [--metrics out.prom]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from jogo.content import registry
+from jogo.domain import GameEngine
+from jogo.runtime import metrics
+from jogo.runtime.config import AppConfig
+
+
+class _Session:
+    def __init__(self, chapter_id: str, with_ui: bool) -> None:
+        self.engine = GameEngine(chapter_id=chapter_id)
+        self.layout = None
+        self.state = self.engine.start()
+        if with_ui:
+            from jogo.ui_flet.headless import HeadlessPage
+            from jogo.ui_flet.layout import AppLayout
+
+            self.page = HeadlessPage()
+            self.layout = AppLayout(self.page)
+            self._render()
+
+    def click(self, rng: random.Random) -> None:
+        if not self.state.choices:
+            # chegou num final: recomeça a partir da entrada
+            self.engine = GameEngine(chapter_id=self.engine.chapter_id)
+            self.state = self.engine.start()
+        else:
+            self.state = self.engine.choose(rng.choice(self.state.choices).key)
+        if self.layout is not None:
+            self._render()
+
+    def _render(self) -> None:
+        self.layout.render(self.state, on_choose=lambda _k: None)
+
+
+def _percentile(sorted_values: List[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+def _drive(session: _Session, clicks: int, seed: int) -> List[float]:
+    rng = random.Random(seed)
+    out: List[float] = []
+    for _ in range(clicks):
+        t0 = time.perf_counter()
+        session.click(rng)
+        out.append(time.perf_counter() - t0)
+    return out
+
+
+def run(
+    *,
+    chapter_id: str,
+    sessions: int,
+    clicks: int,
+    with_ui: bool,
+    workers: int,
+    seed: int = 0,
+) -> dict:
+    registry.load_chapter(chapter_id)  # cache compartilhado, carregado uma vez
+    if with_ui:
+        # importa flet/UI fora da medição de memória
+        _Session(chapter_id, with_ui=True)
+
+    tracemalloc.start()
+    before, _peak = tracemalloc.get_traced_memory()
+    pool: List[_Session] = [_Session(chapter_id, with_ui) for _ in range(sessions)]
+    after, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(lambda i: _drive(pool[i], clicks, seed + i), range(sessions)))
+    wall = time.perf_counter() - t0
+
+    latencies = sorted(x for r in results for x in r)
+    return {
+        "sessions": sessions,
+        "clicks": len(latencies),
+        "ui": with_ui,
+        "wall_s": round(wall, 3),
+        "clicks_per_s": round(len(latencies) / wall, 1) if wall else 0.0,
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 50) * 1000, 3),
+            "p90": round(_percentile(latencies, 90) * 1000, 3),
+            "p99": round(_percentile(latencies, 99) * 1000, 3),
+            "max": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+            "mean": round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+        },
+        "bytes_per_session": round((after - before) / sessions) if sessions else 0,
+        "chapter_cache": registry.cache_stats().__dict__,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chapter", default=AppConfig().default_chapter)
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--clicks", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--ui", action="store_true", help="inclui AppLayout.render (HeadlessPage)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--metrics", default="", help="liga jogo.runtime.metrics e grava o dump (.prom ou .json)")
+    args = parser.parse_args(argv)
+
+    if args.metrics:
+        metrics.enable()
+
+    r = run(
+        chapter_id=args.chapter,
+        sessions=args.sessions,
+        clicks=args.clicks,
+        with_ui=args.ui,
+        workers=args.workers,
+        seed=args.seed,
+    )
+    lat = r["latency_ms"]
+    print(f"{r['sessions']} sessões x {args.clicks} cliques ({'engine+UI' if r['ui'] else 'engine'})")
+    print(f"  {r['clicks_per_s']} cliques/s em {r['wall_s']}s")
+    print(f"  latência ms: p50 {lat['p50']}  p90 {lat['p90']}  p99 {lat['p99']}  max {lat['max']}")
+    print(f"  memória por sessão: {r['bytes_per_session']} bytes")
+    if args.metrics:
+        metrics.write(args.metrics)
+        print(f"  métricas: {args.metrics}")
+
+
+if __name__ == "__main__":
+    main()